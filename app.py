@@ -18,11 +18,16 @@ from cli import register_cli  # ⬅ cli.py에서 만든 함수 import
 from routes.admin.admin import admin_bp
 from routes.map import map_bp
 from routes.news import news_bp
+from services.view_counter_service import ViewCounterService
+from services.job_stats_service import JobStatsService
 app = Flask(__name__)
 app.config.from_object(Config)
 
 Session(app)
 db.init_app(app)
+ViewCounterService.init_app(app)
+JobStatsService.init_app(app)
+register_cli(app)
 
 # Railway 환경에서는 데이터베이스 초기화를 지연시킴
 print("🚀 애플리케이션이 시작되었습니다. 데이터베이스는 첫 요청 시 초기화됩니다.")
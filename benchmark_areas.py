@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+지역 선택기 API 마이크로벤치마크
+
+1. 조회: 예전 방식(요청마다 sido/sigungu/dong 목록 전체를 훑으며 이름을 다시 자름)과
+   utils/region_data(메모리 매핑 + 코드 범위 이진 탐색 + 응답 재사용)를 같은 입력으로 비교
+2. 시작 비용: 새 프로세스에서 JSON 세 파일을 파싱할 때와 regions.bin 을 매핑할 때의
+   소요 시간과 RSS 증가량(/proc/self/status VmRSS) 비교
+
+Flask 없이 실행됩니다.
+
+사용법: python benchmark_areas.py [반복 횟수]
+"""
+
+import json
+import os
+import random
+import subprocess
+import sys
+import time
+
+from utils.region_data import (
+    DATA_DIR, REGION_DATA_PATH, SOURCE_FILES, RegionData, _load_json, compile_region_data, last_token
+)
+
+# 새 프로세스에서 실행할 시작 비용 측정 코드 (json: 예전 routes/areas.py import 시점 로드)
+STARTUP_SNIPPETS = {
+    "json": (
+        "from utils.region_data import _load_json\n"
+        "data = [_load_json(name) for name in ('sido.json', 'sigungu.json', 'dong.json')]\n"
+    ),
+    "regions.bin": (
+        "from utils.region_data import RegionData\n"
+        "data = RegionData()\n"
+        "data.dong_payload('서울특별시', '종로구')\n"
+    ),
+}
+
+STARTUP_TEMPLATE = """
+import json, time
+
+def rss_kb():
+    with open('/proc/self/status') as f:
+        for line in f:
+            if line.startswith('VmRSS:'):
+                return int(line.split()[1])
+    return 0
+
+before = rss_kb()
+start = time.perf_counter()
+{snippet}
+elapsed = time.perf_counter() - start
+print(json.dumps({{'ms': elapsed * 1000, 'rss_kb': rss_kb() - before}}))
+"""
+
+
+def scan_sigungu(sido_list, sigungu_list, sido_name):
+    """예전 get_sigungu_by_name 조회 + 직렬화"""
+    sido_code = next((s['code'] for s in sido_list if s["name"] == sido_name), None)
+    if not sido_code:
+        return json.dumps([])
+    return json.dumps([
+        {"name": last_token(s["name"])}
+        for s in sigungu_list if s["sido_code"] == sido_code
+    ])
+
+
+def scan_dong(sido_list, sigungu_list, dong_list, sido_name, sigungu_name):
+    """예전 get_dong_by_name 조회 + 직렬화"""
+    sido_code = next((s['code'] for s in sido_list if s["name"] == sido_name), None)
+    if not sido_code:
+        return json.dumps([])
+    sigungu_code = next(
+        (
+            s['code'] for s in sigungu_list
+            if s['sido_code'] == sido_code and last_token(s["name"]) == sigungu_name
+        ),
+        None
+    )
+    if not sigungu_code:
+        return json.dumps([])
+    return json.dumps([
+        {"name": last_token(d["name"])}
+        for d in dong_list if d["sigungu_code"] == sigungu_code
+    ])
+
+
+def measure(label, func, queries):
+    start = time.perf_counter()
+    for query in queries:
+        func(*query)
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<10} {elapsed * 1000:10.1f} ms  ({elapsed / len(queries) * 1e6:9.1f} us/요청)")
+    return elapsed
+
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+
+    sido_list = _load_json("sido.json")
+    sigungu_list = _load_json("sigungu.json")
+    dong_list = _load_json("dong.json")
+
+    size = compile_region_data()
+    json_size = sum(os.path.getsize(os.path.join(DATA_DIR, name)) for name in SOURCE_FILES)
+    print(f"regions.bin: {size / 1024:.0f} KB (원본 JSON 합계 {json_size / 1024:.0f} KB)")
+    index = RegionData(REGION_DATA_PATH)
+
+    random.seed(0)
+    sido_codes = {s["code"]: s["name"] for s in sido_list}
+    pairs = sorted({(sido_codes[s["sido_code"]], last_token(s["name"])) for s in sigungu_list})
+    dong_queries = [random.choice(pairs) for _ in range(repeat)]
+    sigungu_queries = [(sido_name,) for sido_name, _ in dong_queries]
+
+    # 결과가 같은지 먼저 확인
+    for sido_name, sigungu_name in dong_queries[:200]:
+        assert json.loads(scan_dong(sido_list, sigungu_list, dong_list, sido_name, sigungu_name)) \
+            == json.loads(index.dong_payload(sido_name, sigungu_name))
+        assert json.loads(scan_sigungu(sido_list, sigungu_list, sido_name)) \
+            == json.loads(index.sigungu_payload(sido_name))
+
+    print(f"\n/api/areas/sigungu_by_name x {repeat}")
+    before = measure("목록 순회", lambda s: scan_sigungu(sido_list, sigungu_list, s), sigungu_queries)
+    after = measure("인덱스", index.sigungu_payload, sigungu_queries)
+    print(f"  → {before / after:.0f}배")
+
+    print(f"\n/api/areas/dong_by_name x {repeat}")
+    before = measure("목록 순회", lambda s, g: scan_dong(sido_list, sigungu_list, dong_list, s, g), dong_queries)
+    after = measure("인덱스", index.dong_payload, dong_queries)
+    print(f"  → {before / after:.0f}배")
+
+    print("\n시작 비용 (새 프로세스, 5회 중앙값)")
+    for label, snippet in STARTUP_SNIPPETS.items():
+        runs = sorted(
+            (json.loads(subprocess.check_output(
+                [sys.executable, "-c", STARTUP_TEMPLATE.format(snippet=snippet)]
+            )) for _ in range(5)),
+            key=lambda run: run["ms"]
+        )
+        median = runs[len(runs) // 2]
+        print(f"  {label:<12} {median['ms']:8.1f} ms   RSS +{median['rss_kb'] / 1024:6.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+"내 주변 일자리" 위치 인덱스(JobGeoIndex) 마이크로벤치마크
+
+가짜 공고 좌표로 인덱스를 만들고 반경별 search() 지연 시간의 p50/p95/p99 를 잽니다.
+좌표는 수도권에 절반, 나머지는 전국에 고르게 뿌려 밀집 지역 검색을 재현합니다.
+먼저 몇 개 검색을 전체 거리 계산(브루트 포스) 결과와 비교해 정확한지 확인합니다.
+
+DB 없이 실행됩니다 (인덱스 갱신 주기 설정만 쓰는 빈 Flask 앱 컨텍스트 사용).
+
+사용법: python benchmark_nearby.py [공고 수] [반경별 검색 횟수]
+"""
+
+import sys
+import time
+
+import numpy as np
+from flask import Flask
+
+from services.job_geo_index import EARTH_RADIUS_KM, JobGeoIndex
+
+# 검색 반경 (km)
+RADII_KM = (1, 3, 5, 10, 20, 50)
+
+# search() limit: 필터 없는 검색 결과 수, 필터 적용 시 첫 후보 구간(NEARBY_CANDIDATE_LIMIT),
+# 반경 안 전체 (후보 구간을 끝까지 넓혔을 때)
+LIMITS = (50, 2000, None)
+
+# 좌표 범위 (위도, 경도)
+CAPITAL_AREA = ((37.40, 37.70), (126.80, 127.20))
+KOREA = ((34.50, 38.30), (126.10, 129.40))
+
+
+def random_positions(rng, count):
+    """수도권 절반 + 전국 절반 좌표"""
+    capital = count // 2
+    (lat_lo, lat_hi), (lng_lo, lng_hi) = CAPITAL_AREA
+    (k_lat_lo, k_lat_hi), (k_lng_lo, k_lng_hi) = KOREA
+    lats = np.concatenate([rng.uniform(lat_lo, lat_hi, capital), rng.uniform(k_lat_lo, k_lat_hi, count - capital)])
+    lngs = np.concatenate([rng.uniform(lng_lo, lng_hi, capital), rng.uniform(k_lng_lo, k_lng_hi, count - capital)])
+    return lats, lngs
+
+
+def brute_force(lats, lngs, lat, lng, radius_km):
+    """모든 좌표의 하버사인 거리 → 반경 안 공고 ID 집합"""
+    lat_rad, lng_rad = np.radians(lats), np.radians(lngs)
+    origin_lat, origin_lng = np.radians(lat), np.radians(lng)
+    a = np.sin((lat_rad - origin_lat) / 2) ** 2 \
+        + np.cos(origin_lat) * np.cos(lat_rad) * np.sin((lng_rad - origin_lng) / 2) ** 2
+    distances = 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+    return set((np.nonzero(distances <= radius_km)[0] + 1).tolist())
+
+
+def percentile_ms(samples, q):
+    return float(np.percentile(samples, q)) * 1000
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+
+    rng = np.random.default_rng(0)
+    lats, lngs = random_positions(rng, count)
+
+    app = Flask(__name__)
+    app.config.update(NEARBY_INDEX_REFRESH_SECONDS=10 ** 9, NEARBY_INDEX_FULL_REBUILD_SECONDS=10 ** 9)
+
+    with app.app_context():
+        start = time.perf_counter()
+        JobGeoIndex._positions = {i + 1: (float(lat), float(lng)) for i, (lat, lng) in enumerate(zip(lats, lngs))}
+        JobGeoIndex._build_arrays()
+        JobGeoIndex._last_full_build = JobGeoIndex._last_refresh = time.monotonic()
+        print(f"공고 {count:,}개 인덱스 구축: {(time.perf_counter() - start) * 1000:.1f} ms")
+
+        # 검색 기준 위치: 수도권 (가장 밀집한 곳)
+        (lat_lo, lat_hi), (lng_lo, lng_hi) = CAPITAL_AREA
+        origins = list(zip(rng.uniform(lat_lo, lat_hi, repeat), rng.uniform(lng_lo, lng_hi, repeat)))
+
+        # 결과가 맞는지 먼저 확인
+        for lat, lng in origins[:20]:
+            for radius_km in RADII_KM:
+                ids, distances = JobGeoIndex.search(lat, lng, radius_km)
+                assert set(ids.tolist()) == brute_force(lats, lngs, lat, lng, radius_km)
+                assert np.all(np.diff(distances) >= 0)
+
+        print(f"\nJobGeoIndex.search x {repeat} (수도권 기준 위치)")
+        print(f"  {'반경':>6} {'limit':>6} {'반경 안':>9} {'p50':>9} {'p95':>9} {'p99':>9}")
+        for radius_km in RADII_KM:
+            for limit in LIMITS:
+                samples = []
+                inside = 0
+                for lat, lng in origins:
+                    start = time.perf_counter()
+                    JobGeoIndex.search(lat, lng, radius_km, limit=limit)
+                    samples.append(time.perf_counter() - start)
+                for lat, lng in origins[:50]:
+                    inside += len(JobGeoIndex.search(lat, lng, radius_km)[0])
+                print(f"  {radius_km:>4}km {limit or '전체':>6} {inside // 50:>9,} "
+                      f"{percentile_ms(samples, 50):>7.2f}ms {percentile_ms(samples, 95):>7.2f}ms "
+                      f"{percentile_ms(samples, 99):>7.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
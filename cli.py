@@ -14,6 +14,111 @@ def register_cli(app):
         db.create_all()
         click.echo("Database initialized and tables created.")
 
+    @app.cli.command("reconcile-counters")
+    @with_appcontext
+    def reconcile_counters():
+        """Recomputes bookmark/application counters from job_bookmark/job_application."""
+        from services.job_service import JobService
+        fixed = JobService.reconcile_counters()
+        click.echo(f"Reconciled counters: {fixed} job posts corrected.")
+
+    @app.cli.command("prune-job-stats")
+    @click.option("--keep-days", default=8, show_default=True, help="Days of hourly stats to keep.")
+    @with_appcontext
+    def prune_job_stats(keep_days):
+        """Deletes hourly job stats older than --keep-days (daily rollups are kept)."""
+        from services.job_stats_service import JobStatsService
+        deleted = JobStatsService.prune_hourly(keep_days)
+        click.echo(f"Deleted {deleted} hourly job stat rows.")
+
+    @app.cli.command("rebuild-map-clusters")
+    @with_appcontext
+    def rebuild_map_clusters():
+        """Recomputes the per-zoom-level map cluster grid (job_map_cell) from job_post coordinates."""
+        from services.map_service import MapService
+        cells = MapService.rebuild_clusters()
+        click.echo(f"Rebuilt map clusters: {cells} grid cells.")
+
+    @app.cli.command("prune-map-changes")
+    @click.option("--keep-days", default=30, show_default=True, help="Days of marker change log to keep.")
+    @with_appcontext
+    def prune_map_changes(keep_days):
+        """Deletes job_map_change rows older than --keep-days (older clients fall back to a full marker sync)."""
+        from services.map_service import MapService
+        deleted = MapService.prune_changes(keep_days)
+        click.echo(f"Deleted {deleted} map change rows.")
+
+    @app.cli.command("rebuild-region-counts")
+    @with_appcontext
+    def rebuild_region_counts():
+        """Recomputes per-region open job counts (job_region_count) from job_post."""
+        from services.region_service import RegionService
+        rows = RegionService.rebuild_counts()
+        click.echo(f"Rebuilt region counts: {rows} rows.")
+
+    @app.cli.command("prune-region-counts")
+    @with_appcontext
+    def prune_region_counts():
+        """Deletes job_region_count rows whose recruitment end date has passed."""
+        from services.region_service import RegionService
+        deleted = RegionService.prune_expired()
+        click.echo(f"Deleted {deleted} expired region count rows.")
+
+    @app.cli.command("prune-geocode-cache")
+    @with_appcontext
+    def prune_geocode_cache():
+        """Deletes expired geocode_cache rows."""
+        from services.geocode_service import GeocodeService
+        deleted = GeocodeService.prune_expired()
+        click.echo(f"Deleted {deleted} expired geocode cache rows.")
+
+    @app.cli.command("geocode-jobs")
+    @click.option("--batch-size", default=50, show_default=True, help="Posts per geocoding batch/commit.")
+    @click.option("--limit", default=None, type=int, help="Stop after this many posts.")
+    @click.option("--retry-failed", is_flag=True, help="Also retry posts whose address previously had no match.")
+    @with_appcontext
+    def geocode_jobs(batch_size, limit, retry_failed):
+        """Fills latitude/longitude/region names for job posts that only have an address."""
+        from services.job_geocoding_service import JobGeocodingService
+        click.echo(f"Pending job posts: {JobGeocodingService.count_pending()}")
+        resolved, failed = JobGeocodingService.backfill(batch_size, include_failed=retry_failed, limit=limit)
+        click.echo(f"Geocoded {resolved} job posts, {failed} addresses not found.")
+
+    @app.cli.command("build-commute-matrix")
+    @with_appcontext
+    def build_commute_matrix():
+        """Geocodes every eup/myeon/dong and saves the dong-to-dong distance matrix for the commute filter."""
+        from services.commute_service import CommuteService
+        count, missing = CommuteService.build_matrix(
+            progress=lambda done, total: click.echo(f"Geocoded {done}/{total} dongs...")
+        )
+        click.echo(f"Saved commute distance matrix for {count} dongs ({missing} without coordinates).")
+
+    @app.cli.command("backfill-region-codes")
+    @click.option("--batch-size", default=500, show_default=True, help="Rows per update batch/commit.")
+    @click.option("--recompute", is_flag=True, help="Also re-match rows that already have a region code.")
+    @with_appcontext
+    def backfill_region_codes(batch_size, recompute):
+        """Fills legal-dong region codes for job posts and users from their region names."""
+        from services.region_service import RegionService
+        results = RegionService.backfill_codes(batch_size=batch_size, recompute=recompute)
+        for table, (resolved, unresolved) in results.items():
+            click.echo(f"{table}: {resolved} region codes set, {unresolved} regions not matched.")
+
+    @app.cli.command("migrate-region-codes")
+    @click.argument("report_path", type=click.Path(exists=True, dir_okay=False))
+    @click.option("--batch-size", default=500, show_default=True, help="Abolished codes per update batch/commit.")
+    @with_appcontext
+    def migrate_region_codes(report_path, batch_size):
+        """Moves stored region codes off abolished legal dongs using a convert_csv_to_json.py report."""
+        from services.region_service import RegionService
+        from utils.region_build import load_code_map
+        code_map = load_code_map(report_path)
+        click.echo(f"Abolished codes with a successor: {len(code_map)}")
+        results = RegionService.migrate_codes(code_map, batch_size=batch_size)
+        for table, changed in results.items():
+            click.echo(f"{table}: {changed} region codes updated.")
+
     @app.cli.command("create-admin")
     def create_admin():
         username = input("관리자 아이디: ")
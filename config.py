@@ -64,8 +64,8 @@ class Config:
                 'connect_timeout': 60,       # MySQL 연결 타임아웃
                 'read_timeout': 60,          # 읽기 타임아웃
                 'write_timeout': 60,         # 쓰기 타임아웃
-                'charset': 'utf8mb4',        # UTF8 문자셋
-                'autocommit': True           # 자동 커밋
+                'charset': 'utf8mb4'         # UTF8 문자셋
+                # autocommit 은 사용하지 않음: 지원 처리 등 여러 문장을 한 트랜잭션으로 커밋
             }
         }
     else:
@@ -95,10 +95,70 @@ class Config:
     KAKAO_MAP_API_KEY = os.getenv("KAKAO_MAP_API_KEY")
 
     KAKAO_REST_API_KEY = os.getenv("KAKAO_REST_API_KEY")
+    KAKAO_LOCAL_API_URL = os.getenv("KAKAO_LOCAL_API_URL", "https://dapi.kakao.com")  # 카카오 로컬 API 주소 (테스트 시 가짜 서버로 교체)
 
     # 세션 저장 방식
     SESSION_TYPE = os.getenv("SESSION_TYPE", "filesystem")
 
+    # 캐시 설정 (simple: 프로세스 메모리, filesystem: gunicorn 워커 간 공유)
+    CACHE_TYPE = os.getenv("CACHE_TYPE", "simple")
+    CACHE_DIR = os.getenv("CACHE_DIR", os.path.join(os.path.dirname(__file__), "flask_cache"))
+    CACHE_THRESHOLD = int(os.getenv("CACHE_THRESHOLD", "2000"))
+    CACHE_DEFAULT_TIMEOUT = int(os.getenv("CACHE_DEFAULT_TIMEOUT", "300"))
+
+    # 공고 상세 페이지 본문 캐시 유지 시간 (초)
+    JOB_DETAIL_CACHE_TIMEOUT = int(os.getenv("JOB_DETAIL_CACHE_TIMEOUT", "3600"))
+
+    # 조회수 집계 설정
+    VIEW_COUNT_DEDUPE_SECONDS = int(os.getenv("VIEW_COUNT_DEDUPE_SECONDS", "1800"))  # 같은 사용자의 재조회를 무시할 시간
+    VIEW_COUNT_FLUSH_INTERVAL = int(os.getenv("VIEW_COUNT_FLUSH_INTERVAL", "30"))    # DB 반영 주기 (초)
+    VIEW_COUNT_FLUSH_THRESHOLD = int(os.getenv("VIEW_COUNT_FLUSH_THRESHOLD", "200"))  # 버퍼가 이만큼 쌓이면 즉시 반영
+
+    # 공고 시간대별 통계 / 급상승 공고 설정
+    JOB_STATS_FLUSH_INTERVAL = int(os.getenv("JOB_STATS_FLUSH_INTERVAL", "60"))  # 통계 버퍼 DB 반영 주기 (초)
+    TRENDING_CACHE_TIMEOUT = int(os.getenv("TRENDING_CACHE_TIMEOUT", "300"))     # 급상승 순위 캐시 유지 시간 (초)
+    TRENDING_SIZE = int(os.getenv("TRENDING_SIZE", "100"))                       # 캐시할 급상승 공고 수 (top-K)
+
+    # 지도 설정
+    MAP_MAX_MARKERS = int(os.getenv("MAP_MAX_MARKERS", "300"))  # 뷰포트 조회 한 번에 내려주는 최대 공고 수
+    MAP_CLUSTER_MIN_LEVEL = int(os.getenv("MAP_CLUSTER_MIN_LEVEL", "8"))  # 이 확대 레벨부터 개별 마커 대신 클러스터 표시
+    MAP_SYNC_REPLAY_SECONDS = int(os.getenv("MAP_SYNC_REPLAY_SECONDS", "30"))  # 마커 증분 동기화 시 다시 보내는 최근 변경 구간 (초)
+
+    # 내 주변 일자리 (반경 검색) 설정
+    NEARBY_MAX_RADIUS_KM = int(os.getenv("NEARBY_MAX_RADIUS_KM", "50"))                        # 최대 검색 반경 (km)
+    NEARBY_CANDIDATE_LIMIT = int(os.getenv("NEARBY_CANDIDATE_LIMIT", "2000"))                  # 필터 적용 시 처음 확인할 거리순 후보 수 (결과가 모자라면 두 배씩 넓힘)
+    NEARBY_INDEX_REFRESH_SECONDS = int(os.getenv("NEARBY_INDEX_REFRESH_SECONDS", "10"))        # 위치 인덱스 증분 갱신 주기 (초)
+    NEARBY_INDEX_FULL_REBUILD_SECONDS = int(os.getenv("NEARBY_INDEX_FULL_REBUILD_SECONDS", "600"))  # 위치 인덱스 전체 재구축 주기 (초)
+
+    # 주소 검색(지오코딩) 설정
+    GEOCODE_LRU_SIZE = int(os.getenv("GEOCODE_LRU_SIZE", "1024"))               # 프로세스 메모리 캐시 항목 수
+    GEOCODE_CACHE_TTL_DAYS = int(os.getenv("GEOCODE_CACHE_TTL_DAYS", "30"))     # DB 캐시 유지 기간 (일)
+    GEOCODE_POOL_SIZE = int(os.getenv("GEOCODE_POOL_SIZE", "10"))               # 카카오 API 연결 풀 크기
+    GEOCODE_CONNECT_TIMEOUT = float(os.getenv("GEOCODE_CONNECT_TIMEOUT", "2"))  # 연결 타임아웃 (초)
+    GEOCODE_READ_TIMEOUT = float(os.getenv("GEOCODE_READ_TIMEOUT", "5"))        # 응답 타임아웃 (초)
+    GEOCODE_RATE_PER_SECOND = int(os.getenv("GEOCODE_RATE_PER_SECOND", "5"))    # 공고 좌표 채우기 시 초당 최대 API 호출 수
+    GEOCODE_BATCH_SIZE = int(os.getenv("GEOCODE_BATCH_SIZE", "50"))             # 공고 좌표 채우기 배치 크기
+
+    # 통근 가능 공고 필터 설정 (읍/면/동 사이 직선거리 → 이동 시간 환산)
+    COMMUTE_SPEED_KMH = float(os.getenv("COMMUTE_SPEED_KMH", "15"))           # 대중교통 평균 속도 (대기/환승 포함, km/h)
+    WALK_SPEED_KMH = float(os.getenv("WALK_SPEED_KMH", "3"))                   # 보행 속도 (km/h)
+    COMMUTE_DETOUR_FACTOR = float(os.getenv("COMMUTE_DETOUR_FACTOR", "1.3"))   # 실제 경로 / 직선거리 비율
+
+    # 채팅 실시간 스트림(SSE) 설정
+    CHAT_STREAM_POLL_SECONDS = float(os.getenv("CHAT_STREAM_POLL_SECONDS", "1"))         # 워커별 새 메시지/읽음 표시 조회 주기 (초)
+    CHAT_STREAM_LOOKBACK_POLLS = int(os.getenv("CHAT_STREAM_LOOKBACK_POLLS", "3"))       # 늦게 커밋된 메시지를 찾기 위해 다시 조회하는 주기 수
+    CHAT_STREAM_HEARTBEAT_SECONDS = int(os.getenv("CHAT_STREAM_HEARTBEAT_SECONDS", "15"))  # keep-alive 전송 간격 (초)
+    CHAT_STREAM_MAX_SECONDS = int(os.getenv("CHAT_STREAM_MAX_SECONDS", "300"))           # 연결 최대 유지 시간 (지나면 재연결)
+    CHAT_STREAM_RETRY_MS = int(os.getenv("CHAT_STREAM_RETRY_MS", "3000"))                # 브라우저 재연결 대기 시간 (ms)
+    CHAT_STREAM_QUEUE_SIZE = int(os.getenv("CHAT_STREAM_QUEUE_SIZE", "100"))             # 연결별 대기 이벤트 수 (넘으면 연결을 끊고 재연결)
+    CHAT_STREAM_CATCH_UP_LIMIT = int(os.getenv("CHAT_STREAM_CATCH_UP_LIMIT", "200"))     # 재연결 시 놓친 메시지 조회 배치 크기
+
+    # 지역 계층 API(/api/areas/tree, /api/areas/dong/...) 브라우저/프록시 캐시 유지 시간 (초)
+    AREAS_CACHE_MAX_AGE = int(os.getenv("AREAS_CACHE_MAX_AGE", "604800"))
+
+    # 지역별 공고 수 트리 캐시 유지 시간 (초)
+    REGION_COUNT_CACHE_TIMEOUT = int(os.getenv("REGION_COUNT_CACHE_TIMEOUT", "60"))
+
     # 업로드 설정
     UPLOAD_FOLDER = os.path.join(os.path.dirname(__file__), "static", "uploads")
     ALLOWED_EXTENSIONS = {"png", "jpg", "jpeg", "pdf"}
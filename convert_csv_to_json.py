@@ -1,60 +1,52 @@
-import csv
-import json
-from collections import OrderedDict
-import os
-
-csv_path = '국토교통부_전국 법정동_20250415.csv'
-sido_path = 'data/sido.json'
-sigungu_path = 'data/sigungu.json'
-dong_path = 'data/dong.json'
-
-sido_set = OrderedDict()
-sigungu_set = OrderedDict()
-dong_set = OrderedDict()
-
-with open(csv_path, encoding='utf-8-sig') as csvfile:
-    reader = csv.DictReader(csvfile)
-    for row in reader:
-        code = row['법정동코드'].strip()
-        is_exist = row['삭제일자'].strip()
-        name = f"{row['시도명'].strip()} {row['시군구명'].strip()} {row['읍면동명'].strip()}"
-
-        if is_exist:  # 삭제일자가 값이 있으면 폐지된 동
-            continue
-
-        sido_code = code[:2]
-        sigungu_code = code[:5]
-        dong_code = code[:10]
-
-        sido_name = row['시도명'].strip()
-        sigungu_name = f"{row['시도명'].strip()} {row['시군구명'].strip()}"
-
-        if sido_code not in sido_set:
-            sido_set[sido_code] = sido_name
-
-        if sigungu_code not in sigungu_set:
-            sigungu_set[sigungu_code] = {
-                "code": sigungu_code,
-                "name": sigungu_name,
-                "sido_code": sido_code
-            }
-
-        if dong_code not in dong_set:
-            dong_set[dong_code] = {
-                "code": dong_code,
-                "name": name,
-                "sigungu_code": sigungu_code
-            }
-
-os.makedirs('data', exist_ok=True)
-
-with open(sido_path, 'w', encoding='utf-8') as f:
-    json.dump([{"code": k, "name": v} for k, v in sido_set.items()], f, ensure_ascii=False, indent=2)
-
-with open(sigungu_path, 'w', encoding='utf-8') as f:
-    json.dump(list(sigungu_set.values()), f, ensure_ascii=False, indent=2)
-
-with open(dong_path, 'w', encoding='utf-8') as f:
-    json.dump(list(dong_set.values()), f, ensure_ascii=False, indent=2)
-
-print("✅ 변환 완료: sido.json / sigungu.json / dong.json")
\ No newline at end of file
+#!/usr/bin/env python3
+"""
+법정동 CSV → 지역 데이터 빌드
+
+국토교통부 전국 법정동 CSV 새 배포본을 한 줄씩 읽어 현재 데이터와 비교하고,
+바뀐 것이 있으면 data/sido.json, sigungu.json, dong.json, regions.bin 과
+변경 보고서(data/region_migration_<배포일>.json)를 씁니다. (utils/region_build 참고)
+
+저장된 공고/사용자 법정동 코드는 보고서로 일괄 변경합니다:
+    flask migrate-region-codes data/region_migration_<배포일>.json
+
+사용법: python convert_csv_to_json.py [CSV 경로] [--dry-run] [--force] [--encoding cp949] [--report 경로]
+"""
+
+import argparse
+
+from utils.region_build import build
+
+DEFAULT_CSV_PATH = '국토교통부_전국 법정동_20250415.csv'
+
+
+def main():
+    parser = argparse.ArgumentParser(description="법정동 CSV 배포본으로 지역 데이터 빌드")
+    parser.add_argument('csv_path', nargs='?', default=DEFAULT_CSV_PATH, help="법정동 CSV 경로")
+    parser.add_argument('--encoding', default='utf-8-sig', help="CSV 인코딩 (예: cp949)")
+    parser.add_argument('--report', default=None, help="변경 보고서 경로")
+    parser.add_argument('--dry-run', action='store_true', help="비교만 하고 파일은 쓰지 않음")
+    parser.add_argument('--force', action='store_true', help="바뀐 것이 없어도 데이터 파일을 다시 씀")
+    args = parser.parse_args()
+
+    report = build(args.csv_path, args.report, args.encoding, dry_run=args.dry_run, force=args.force)
+
+    mapped = sum(1 for item in report['abolished'] if item['successor'])
+    print(f"📦 배포본 {report['release']}")
+    print(f"  신설 {len(report['added'])}개, 명칭 변경 {len(report['renamed'])}개, "
+          f"폐지 {len(report['abolished'])}개 (후속 코드 {mapped}개)")
+
+    if args.dry_run:
+        print("🔍 비교만 했습니다 (파일 변경 없음)")
+    elif report['report_path']:
+        print(f"✅ 변환 완료: sido.json / sigungu.json / dong.json / regions.bin")
+        print(f"📝 변경 보고서: {report['report_path']}")
+        if report['code_map']:
+            print(f"   저장된 법정동 코드 변경: flask migrate-region-codes {report['report_path']}")
+    elif args.force:
+        print("✅ 바뀐 것이 없지만 데이터 파일을 다시 썼습니다")
+    else:
+        print("✅ 바뀐 것이 없습니다")
+
+
+if __name__ == "__main__":
+    main()
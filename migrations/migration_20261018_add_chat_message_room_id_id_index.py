@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+chat_message(room_id, id) 인덱스 추가 마이그레이션 스크립트
+
+채팅방 메시지를 메시지 ID 커서(최신 메시지, before_id 이전/after_id 이후 메시지)로
+조회할 때 채팅방 안의 ID 범위만 읽도록 합니다.
+"""
+
+import os
+import sys
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from migrate_job_post import get_db_connection
+from migration_20261018_add_job_post_lat_lng_index import check_index_exists
+
+
+def add_room_id_id_index():
+    """chat_message(room_id, id) 인덱스 추가"""
+    connection = get_db_connection()
+    cursor = connection.cursor()
+
+    try:
+        if check_index_exists(cursor, 'chat_message', 'ix_chat_message_room_id_id'):
+            print("  ⏭️  ix_chat_message_room_id_id (이미 존재)")
+        else:
+            cursor.execute("CREATE INDEX ix_chat_message_room_id_id ON chat_message (room_id, id)")
+            print("  ✅ ix_chat_message_room_id_id 추가됨")
+
+        connection.commit()
+        return True
+
+    except Exception as e:
+        print(f"❌ 마이그레이션 오류: {e}")
+        connection.rollback()
+        return False
+    finally:
+        cursor.close()
+        connection.close()
+
+
+if __name__ == "__main__":
+    print("🚀 chat_message(room_id, id) 인덱스 마이그레이션 시작\n")
+    if add_room_id_id_index():
+        print("\n🎉 마이그레이션 완료!")
+    else:
+        print("\n❌ 마이그레이션 실패")
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+chat_room 테이블에 applicant_last_read_id, employer_last_read_id(읽은 마지막 메시지 ID) 컬럼 추가 마이그레이션 스크립트
+
+채팅 실시간 스트림(/chat/<room_id>/stream)이 상대방의 읽음 표시를 전달하는 데 사용됩니다.
+기존 채팅방은 비어 있으며, 참여자가 채팅방을 다시 열면 채워집니다.
+"""
+
+import os
+import sys
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from migrate_job_post import get_db_connection, check_column_exists
+
+
+def add_last_read_id_columns():
+    """chat_room.applicant_last_read_id, employer_last_read_id 컬럼 추가"""
+    connection = get_db_connection()
+    cursor = connection.cursor()
+
+    try:
+        for column in ('applicant_last_read_id', 'employer_last_read_id'):
+            if check_column_exists(cursor, 'chat_room', column):
+                print(f"  ⏭️  {column} (이미 존재)")
+            else:
+                cursor.execute(f"ALTER TABLE chat_room ADD COLUMN {column} INT NULL")
+                print(f"  ✅ {column} 추가됨")
+
+        connection.commit()
+        return True
+
+    except Exception as e:
+        print(f"❌ 마이그레이션 오류: {e}")
+        connection.rollback()
+        return False
+    finally:
+        cursor.close()
+        connection.close()
+
+
+if __name__ == "__main__":
+    print("🚀 chat_room 읽음 위치 컬럼 마이그레이션 시작\n")
+    if add_last_read_id_columns():
+        print("\n🎉 마이그레이션 완료!")
+    else:
+        print("\n❌ 마이그레이션 실패")
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+job_post 테이블에 geocode_failed_at(좌표 채우기 실패 시각) 컬럼 추가 마이그레이션 스크립트
+
+근무지 주소로 좌표를 찾지 못한 공고를 좌표 채우기 재시도에서 제외하는 데 사용됩니다.
+기존 공고의 좌표는 `flask geocode-jobs` 로 채웁니다.
+"""
+
+import os
+import sys
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from migrate_job_post import get_db_connection, check_column_exists
+
+
+def add_geocode_failed_at_column():
+    """job_post.geocode_failed_at 컬럼 추가"""
+    connection = get_db_connection()
+    cursor = connection.cursor()
+
+    try:
+        if check_column_exists(cursor, 'job_post', 'geocode_failed_at'):
+            print("  ⏭️  geocode_failed_at (이미 존재)")
+        else:
+            cursor.execute("ALTER TABLE job_post ADD COLUMN geocode_failed_at DATETIME NULL")
+            print("  ✅ geocode_failed_at 추가됨")
+
+        connection.commit()
+        return True
+
+    except Exception as e:
+        print(f"❌ 마이그레이션 오류: {e}")
+        connection.rollback()
+        return False
+    finally:
+        cursor.close()
+        connection.close()
+
+
+if __name__ == "__main__":
+    print("🚀 job_post.geocode_failed_at 마이그레이션 시작\n")
+    if add_geocode_failed_at_column():
+        print("\n🎉 마이그레이션 완료!")
+    else:
+        print("\n❌ 마이그레이션 실패")
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+job_post 테이블에 (latitude, longitude) 복합 인덱스 추가 마이그레이션 스크립트
+
+지도 뷰포트 조회(/api/jobs/in_bounds)의 위도/경도 범위 검색에 사용됩니다.
+"""
+
+import os
+import sys
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from migrate_job_post import get_db_connection
+
+
+def check_index_exists(cursor, table_name, index_name):
+    """인덱스가 존재하는지 확인"""
+    cursor.execute(f"""
+        SELECT COUNT(*)
+        FROM INFORMATION_SCHEMA.STATISTICS
+        WHERE TABLE_SCHEMA = DATABASE()
+        AND TABLE_NAME = '{table_name}'
+        AND INDEX_NAME = '{index_name}'
+    """)
+    return cursor.fetchone()[0] > 0
+
+
+def add_lat_lng_index():
+    """job_post(latitude, longitude) 인덱스 추가"""
+    connection = get_db_connection()
+    cursor = connection.cursor()
+
+    try:
+        if check_index_exists(cursor, 'job_post', 'ix_job_post_lat_lng'):
+            print("  ⏭️  ix_job_post_lat_lng (이미 존재)")
+        else:
+            cursor.execute("CREATE INDEX ix_job_post_lat_lng ON job_post (latitude, longitude)")
+            print("  ✅ ix_job_post_lat_lng 추가됨")
+
+        connection.commit()
+        return True
+
+    except Exception as e:
+        print(f"❌ 마이그레이션 오류: {e}")
+        connection.rollback()
+        return False
+    finally:
+        cursor.close()
+        connection.close()
+
+
+if __name__ == "__main__":
+    print("🚀 job_post 위도/경도 인덱스 마이그레이션 시작\n")
+    if add_lat_lng_index():
+        print("\n🎉 마이그레이션 완료!")
+    else:
+        print("\n❌ 마이그레이션 실패")
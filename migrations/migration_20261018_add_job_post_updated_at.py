@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+job_post 테이블에 updated_at(공고 내용 수정일) 컬럼 추가 마이그레이션 스크립트
+
+공고 상세 페이지 본문 캐시의 버전으로 사용됩니다.
+기존 공고는 created_at 값으로 채웁니다.
+"""
+
+import os
+import sys
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from migrate_job_post import get_db_connection, check_column_exists
+
+
+def add_updated_at_column():
+    """job_post.updated_at 컬럼 추가 및 기존 데이터 채우기"""
+    connection = get_db_connection()
+    cursor = connection.cursor()
+
+    try:
+        if check_column_exists(cursor, 'job_post', 'updated_at'):
+            print("  ⏭️  updated_at (이미 존재)")
+        else:
+            cursor.execute("ALTER TABLE job_post ADD COLUMN updated_at DATETIME NULL")
+            print("  ✅ updated_at 추가됨")
+
+        cursor.execute("UPDATE job_post SET updated_at = created_at WHERE updated_at IS NULL")
+        print(f"  ✅ 기존 공고 {cursor.rowcount}건 updated_at 채움")
+
+        connection.commit()
+        return True
+
+    except Exception as e:
+        print(f"❌ 마이그레이션 오류: {e}")
+        connection.rollback()
+        return False
+    finally:
+        cursor.close()
+        connection.close()
+
+
+if __name__ == "__main__":
+    print("🚀 job_post.updated_at 마이그레이션 시작\n")
+    if add_updated_at_column():
+        print("\n🎉 마이그레이션 완료!")
+    else:
+        print("\n❌ 마이그레이션 실패")
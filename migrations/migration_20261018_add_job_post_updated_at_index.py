@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+job_post.updated_at 인덱스 추가 마이그레이션 스크립트
+
+내 주변 일자리 위치 인덱스의 증분 갱신(최근 수정된 공고 조회)에 사용됩니다.
+"""
+
+import os
+import sys
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from migrate_job_post import get_db_connection
+from migration_20261018_add_job_post_lat_lng_index import check_index_exists
+
+
+def add_updated_at_index():
+    """job_post(updated_at) 인덱스 추가"""
+    connection = get_db_connection()
+    cursor = connection.cursor()
+
+    try:
+        if check_index_exists(cursor, 'job_post', 'ix_job_post_updated_at'):
+            print("  ⏭️  ix_job_post_updated_at (이미 존재)")
+        else:
+            cursor.execute("CREATE INDEX ix_job_post_updated_at ON job_post (updated_at)")
+            print("  ✅ ix_job_post_updated_at 추가됨")
+
+        connection.commit()
+        return True
+
+    except Exception as e:
+        print(f"❌ 마이그레이션 오류: {e}")
+        connection.rollback()
+        return False
+    finally:
+        cursor.close()
+        connection.close()
+
+
+if __name__ == "__main__":
+    print("🚀 job_post.updated_at 인덱스 마이그레이션 시작\n")
+    if add_updated_at_index():
+        print("\n🎉 마이그레이션 완료!")
+    else:
+        print("\n❌ 마이그레이션 실패")
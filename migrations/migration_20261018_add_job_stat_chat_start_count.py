@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+job_stat_hourly 테이블에 chat_start_count(채팅 시작 수) 컬럼 추가 마이그레이션 스크립트
+
+job_stat_daily 테이블은 앱 시작 시 db.create_all() 로 생성됩니다.
+"""
+
+import os
+import sys
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from migrate_job_post import get_db_connection, check_column_exists
+
+
+def add_chat_start_count_column():
+    """job_stat_hourly.chat_start_count 컬럼 추가"""
+    connection = get_db_connection()
+    cursor = connection.cursor()
+
+    try:
+        if check_column_exists(cursor, 'job_stat_hourly', 'chat_start_count'):
+            print("  ⏭️  chat_start_count (이미 존재)")
+        else:
+            cursor.execute("ALTER TABLE job_stat_hourly ADD COLUMN chat_start_count INT NOT NULL DEFAULT 0")
+            print("  ✅ chat_start_count 추가됨")
+
+        connection.commit()
+        return True
+
+    except Exception as e:
+        print(f"❌ 마이그레이션 오류: {e}")
+        connection.rollback()
+        return False
+    finally:
+        cursor.close()
+        connection.close()
+
+
+if __name__ == "__main__":
+    print("🚀 job_stat_hourly.chat_start_count 마이그레이션 시작\n")
+    if add_chat_start_count_column():
+        print("\n🎉 마이그레이션 완료!")
+    else:
+        print("\n❌ 마이그레이션 실패")
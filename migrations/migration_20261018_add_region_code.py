@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+job_post, user 테이블에 region_code(10자리 법정동 코드) 컬럼과 인덱스 추가 마이그레이션 스크립트
+
+지역 필터를 코드 앞부분 범위 비교로 처리하는 데 사용됩니다.
+기존 공고/사용자의 코드는 `flask backfill-region-codes` 로 채웁니다.
+"""
+
+import os
+import sys
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from migrate_job_post import get_db_connection, check_column_exists
+from migration_20261018_add_job_post_lat_lng_index import check_index_exists
+
+
+def add_region_code_columns():
+    """job_post.region_code, user.region_code 컬럼/인덱스 추가"""
+    connection = get_db_connection()
+    cursor = connection.cursor()
+
+    try:
+        for table in ('job_post', 'user'):
+            if check_column_exists(cursor, table, 'region_code'):
+                print(f"  ⏭️  {table}.region_code (이미 존재)")
+            else:
+                cursor.execute(f"ALTER TABLE `{table}` ADD COLUMN region_code VARCHAR(10) NULL")
+                print(f"  ✅ {table}.region_code 추가됨")
+
+            index_name = f"ix_{table}_region_code"
+            if check_index_exists(cursor, table, index_name):
+                print(f"  ⏭️  {index_name} (이미 존재)")
+            else:
+                cursor.execute(f"CREATE INDEX {index_name} ON `{table}` (region_code)")
+                print(f"  ✅ {index_name} 추가됨")
+
+        connection.commit()
+        return True
+
+    except Exception as e:
+        print(f"❌ 마이그레이션 오류: {e}")
+        connection.rollback()
+        return False
+    finally:
+        cursor.close()
+        connection.close()
+
+
+if __name__ == "__main__":
+    print("🚀 region_code 마이그레이션 시작\n")
+    if add_region_code_columns():
+        print("\n🎉 마이그레이션 완료!")
+    else:
+        print("\n❌ 마이그레이션 실패")
@@ -52,6 +52,7 @@ class User(db.Model):
     sido = db.Column(db.String(30), nullable=True)            # 시/도
     sigungu = db.Column(db.String(30), nullable=True)         # 시/군/구
     dong = db.Column(db.String(40), nullable=True)            # 동
+    region_code = db.Column(db.String(10), nullable=True, index=True)  # 거주지 법정동 코드 (10자리)
 
     # 일반 로그인용
     username = db.Column(db.String(50), unique=True, nullable=True)  # 일반 로그인용 ID
@@ -116,12 +117,14 @@ class JobPost(db.Model):
     region = db.Column(db.String(100), nullable=True)          # 근무 지역 (맵 연동)
     latitude = db.Column(Float, nullable=True)  # 위도
     longitude = db.Column(Float, nullable=True)  # 경도
+    geocode_failed_at = db.Column(db.DateTime, nullable=True)  # 근무지 주소로 좌표를 찾지 못한 시각 (좌표 채우기 재시도 제외)
     salary = db.Column(db.String(100), nullable=True)          # 급여
 
     # 행정구역 정보를 분리하여 저장할 필드 추가
     region_1depth_name = db.Column(db.String(50), index=True)  # 시/도 (예: '서울')
     region_2depth_name = db.Column(db.String(50), index=True)  # 시/군/구 (예: '강남구')
     region_3depth_name = db.Column(db.String(50), index=True)  # 읍/면/동 (예: '역삼동')
+    region_code = db.Column(db.String(10), nullable=True, index=True)  # 법정동 코드 (10자리, 지역 필터는 코드 앞부분 비교)
 
     # 근무 요일 (월화수목금토일)
     work_monday = db.Column(db.Boolean, default=False)         # 월요일
@@ -171,13 +174,108 @@ class JobPost(db.Model):
 
     # 작성자 및 시간 정보
     created_at = db.Column(db.DateTime, default=datetime.utcnow)  # 공고 작성일
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, index=True)  # 공고 내용 수정일 (상세 페이지 캐시 버전, 카운터 변경 시에는 갱신하지 않음)
     author_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)  # 작성자 (User ID)
 
     author = db.relationship('User', backref=db.backref('job_posts', lazy=True))
 
+    # 지도 뷰포트(위도/경도 범위) 조회용 복합 인덱스
+    __table_args__ = (
+        db.Index('ix_job_post_lat_lng', 'latitude', 'longitude'),
+    )
+
     def __repr__(self):
         return f"<JobPost id={self.id} title={self.title} company={self.company}>"
 
+class JobStatHourly(db.Model):
+    """공고 시간대별 통계 (1시간 단위 버킷, 급상승 공고 집계 및 시간별 분석용)"""
+    __tablename__ = 'job_stat_hourly'
+
+    job_id = db.Column(db.Integer, db.ForeignKey('job_post.id', ondelete='CASCADE'), primary_key=True)
+    bucket_start = db.Column(db.DateTime, primary_key=True)    # 집계 구간 시작 시각 (UTC 정시)
+    view_count = db.Column(db.Integer, nullable=False, default=0)         # 해당 시간 조회수
+    bookmark_count = db.Column(db.Integer, nullable=False, default=0)     # 해당 시간 찜 수
+    application_count = db.Column(db.Integer, nullable=False, default=0)  # 해당 시간 지원 수
+    chat_start_count = db.Column(db.Integer, nullable=False, default=0)   # 해당 시간 채팅 시작 수
+
+    # 기간 조회(최근 24시간/7일)용 인덱스
+    __table_args__ = (
+        db.Index('ix_job_stat_hourly_bucket', 'bucket_start', 'job_id'),
+    )
+
+    def __repr__(self):
+        return f"<JobStatHourly job_id={self.job_id} bucket_start={self.bucket_start}>"
+
+class JobStatDaily(db.Model):
+    """공고 일별 통계 (기업 회원 분석 대시보드용, 시간별 통계와 함께 누적)"""
+    __tablename__ = 'job_stat_daily'
+
+    job_id = db.Column(db.Integer, db.ForeignKey('job_post.id', ondelete='CASCADE'), primary_key=True)
+    day = db.Column(db.Date, primary_key=True)                 # 집계 날짜 (UTC)
+    view_count = db.Column(db.Integer, nullable=False, default=0)         # 해당 일 조회수
+    bookmark_count = db.Column(db.Integer, nullable=False, default=0)     # 해당 일 찜 수
+    application_count = db.Column(db.Integer, nullable=False, default=0)  # 해당 일 지원 수
+    chat_start_count = db.Column(db.Integer, nullable=False, default=0)   # 해당 일 채팅 시작 수
+
+    def __repr__(self):
+        return f"<JobStatDaily job_id={self.job_id} day={self.day}>"
+
+class JobMapCell(db.Model):
+    """지도 클러스터 격자 집계 (확대 레벨별 격자 칸마다 공고 수와 좌표 합, 공고 등록/수정/삭제 시 증분 갱신)"""
+    __tablename__ = 'job_map_cell'
+
+    level = db.Column(db.SmallInteger, primary_key=True)       # 카카오맵 확대 레벨
+    cell_y = db.Column(db.Integer, primary_key=True)           # 격자 행 (floor(위도 / 칸 크기))
+    cell_x = db.Column(db.Integer, primary_key=True)           # 격자 열 (floor(경도 / 칸 크기))
+    job_count = db.Column(db.Integer, nullable=False, default=0)  # 칸 안의 공고 수
+    lat_sum = db.Column(Float, nullable=False, default=0)      # 위도 합 (중심점 = 합 / 공고 수)
+    lng_sum = db.Column(Float, nullable=False, default=0)      # 경도 합
+
+    def __repr__(self):
+        return f"<JobMapCell level={self.level} cell=({self.cell_y},{self.cell_x}) count={self.job_count}>"
+
+class JobMapChange(db.Model):
+    """지도 마커 변경 기록 (공고 좌표 등록/이동/삭제, 마커 증분 동기화용)"""
+    __tablename__ = 'job_map_change'
+
+    id = db.Column(db.Integer, primary_key=True, autoincrement=True)  # 동기화 버전 (증가하는 순번)
+    job_id = db.Column(db.Integer, nullable=False)             # 공고 ID (삭제된 공고도 기록하므로 외래 키 없음)
+    latitude = db.Column(Float, nullable=True)                 # 변경 후 위도 (삭제/좌표 제거면 NULL)
+    longitude = db.Column(Float, nullable=True)                # 변경 후 경도
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, index=True)
+
+    def __repr__(self):
+        return f"<JobMapChange id={self.id} job_id={self.job_id}>"
+
+class JobRegionCount(db.Model):
+    """지역별 공고 수 집계 (지역 × 모집 마감일 단위, 공고 등록/수정/삭제 시 증분 갱신)"""
+    __tablename__ = 'job_region_count'
+
+    region_1depth_name = db.Column(db.String(50), primary_key=True)  # 시/도 (지역 선택기 이름, 없으면 '')
+    region_2depth_name = db.Column(db.String(50), primary_key=True)  # 시/군/구 (공백 제거)
+    region_3depth_name = db.Column(db.String(50), primary_key=True)  # 읍/면/동
+    end_date = db.Column(db.Date, primary_key=True)                  # 모집 마감일 (마감일 없으면 9999-12-31)
+    job_count = db.Column(db.Integer, nullable=False, default=0)     # 공고 수
+    located_count = db.Column(db.Integer, nullable=False, default=0) # 좌표가 있는 공고 수
+    lat_sum = db.Column(Float, nullable=False, default=0)            # 좌표가 있는 공고의 위도 합 (평균 위치 계산용)
+    lng_sum = db.Column(Float, nullable=False, default=0)            # 경도 합
+
+    def __repr__(self):
+        return f"<JobRegionCount {self.region_1depth_name} {self.region_2depth_name} {self.region_3depth_name} count={self.job_count}>"
+
+class GeocodeCache(db.Model):
+    """카카오 주소 검색 결과 캐시 (정규화된 검색어 기준, 만료 시각까지 재사용)"""
+    __tablename__ = 'geocode_cache'
+
+    query_hash = db.Column(db.String(40), primary_key=True)    # 정규화된 검색어의 SHA-1
+    query = db.Column(db.String(255), nullable=False)          # 정규화된 검색어
+    response = db.Column(db.Text, nullable=False)              # 카카오 API 응답 (JSON)
+    expires_at = db.Column(db.DateTime, nullable=False, index=True)  # 만료 시각
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    def __repr__(self):
+        return f"<GeocodeCache query={self.query} expires_at={self.expires_at}>"
+
 class JobBookmark(db.Model):
     __tablename__ = 'job_bookmark'
     
@@ -233,6 +331,8 @@ class ChatRoom(db.Model):
     is_active = db.Column(db.Boolean, default=True)  # 채팅방 활성 상태
     applicant_left = db.Column(db.Boolean, default=False)  # 지원자가 나갔는지 여부
     employer_left = db.Column(db.Boolean, default=False)  # 고용주가 나갔는지 여부
+    applicant_last_read_id = db.Column(db.Integer, nullable=True)  # 지원자가 읽은 마지막 메시지 ID (읽음 표시)
+    employer_last_read_id = db.Column(db.Integer, nullable=True)  # 고용주가 읽은 마지막 메시지 ID (읽음 표시)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
@@ -265,6 +365,11 @@ class ChatMessage(db.Model):
     room = db.relationship('ChatRoom', backref=db.backref('messages', lazy=True, order_by='ChatMessage.created_at'))
     sender = db.relationship('User', backref=db.backref('sent_messages', lazy=True))
     
+    # 채팅방별 메시지 ID 커서 조회 (최신 메시지, 이전/이후 메시지)
+    __table_args__ = (
+        db.Index('ix_chat_message_room_id_id', 'room_id', 'id'),
+    )
+    
     def __repr__(self):
         return f"<ChatMessage id={self.id} room_id={self.room_id} sender_id={self.sender_id}>"
 
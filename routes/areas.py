@@ -1,64 +1,90 @@
-import json
-import os
-from flask import Blueprint, jsonify
+from flask import Blueprint, Response, current_app, jsonify, request
+from services.region_service import RegionService
+from utils.region_data import EMPTY_PAYLOAD, TREE_KEY, get_region_data
 
 areas_bp = Blueprint("areas", __name__)
 
-# 현재 파일의 디렉토리를 기준으로 절대 경로 생성
-current_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-data_dir = os.path.join(current_dir, "data")
-
-try:
-    with open(os.path.join(data_dir, "sido.json"), encoding="utf-8") as f:
-        sido_list = json.load(f)
-    with open(os.path.join(data_dir, "sigungu.json"), encoding="utf-8") as f:
-        sigungu_list = json.load(f)
-    with open(os.path.join(data_dir, "dong.json"), encoding="utf-8") as f:
-        dong_list = json.load(f)
-except FileNotFoundError as e:
-    print(f"Warning: {e}")
-    # 기본값 설정
-    sido_list = []
-    sigungu_list = []
-    dong_list = []
-
-
-def last_token(s):
-    return s.split()[-1] if s else s
-def sigungu_token(s):
-    return s.split()[-1] if s else s
-def sido_token(s):
-    return s  # 시도 name 완전값
+# 지역 데이터는 첫 요청 때 data/regions.bin 을 메모리 매핑해서 읽음 (워커 간 페이지 공유)
+
+
+def _json_payload(payload):
+    return Response(payload, mimetype="application/json")
+
+
+def _precompressed_response(key, etag_name):
+    """
+    미리 만든 응답 (gzip 을 받는 클라이언트에는 압축본) + 강한 ETag + 긴 캐시 헤더
+
+    ETag 는 지역 데이터 버전과 응답 키로 만들며, 압축본은 다른 표현이므로 ETag 도 구분합니다.
+    """
+    region_data = get_region_data()
+    compressed = "gzip" in request.accept_encodings
+    payload = region_data.payload(key, compressed=compressed)
+    if payload is None:
+        return _json_payload(EMPTY_PAYLOAD), 404
+
+    response = Response(payload, mimetype="application/json")
+    if compressed:
+        response.headers["Content-Encoding"] = "gzip"
+    response.vary.add("Accept-Encoding")
+    response.set_etag(f"{region_data.version}-{etag_name}{'-gz' if compressed else ''}")
+    response.cache_control.public = True
+    response.cache_control.max_age = current_app.config.get("AREAS_CACHE_MAX_AGE", 604800)
+    return response.make_conditional(request)
 
 @areas_bp.route("/api/areas/sido")
 def get_sido():
-    return jsonify([{"name": sido_token(s["name"])} for s in sido_list])
+    return _json_payload(get_region_data().sido_payload)
 
 @areas_bp.route("/api/areas/sigungu_by_name/<sido_name>")
 def get_sigungu_by_name(sido_name):
-    sido_code = next((s['code'] for s in sido_list if sido_token(s["name"]) == sido_name), None)
-    if not sido_code:
-        return jsonify([])
-    return jsonify([
-        {"name": sigungu_token(s["name"])}
-        for s in sigungu_list if s["sido_code"] == sido_code
-    ])
+    return _json_payload(get_region_data().sigungu_payload(sido_name))
 
 @areas_bp.route("/api/areas/dong_by_name/<sido_name>/<sigungu_name>")
 def get_dong_by_name(sido_name, sigungu_name):
-    sido_code = next((s['code'] for s in sido_list if sido_token(s["name"]) == sido_name), None)
-    if not sido_code:
-        return jsonify([])
-    sigungu_code = next(
-        (
-            s['code'] for s in sigungu_list
-            if s['sido_code'] == sido_code and sigungu_token(s["name"]) == sigungu_name
-        ),
-        None
-    )
+    return _json_payload(get_region_data().dong_payload(sido_name, sigungu_name))
+
+@areas_bp.route("/api/areas/tree")
+def get_area_tree():
+    """
+    지역 계층 (시/도 → 시/군/구) 한 번에 조회
+    =====================================
+
+    기능:
+    - 지역 선택기가 시/도, 시/군/구 목록을 요청 한 번으로 채움
+    - 읍/면/동은 시/군/구를 고를 때 /api/areas/dong/<시/군/구 코드> 로 받음
+    - 응답은 regions.bin 컴파일 시 JSON/gzip 으로 미리 만든 것을 그대로 전송
+
+    URL: GET /api/areas/tree
+
+    반환값:
+    - {"sido": [{"code", "name", "sigungu": [{"code", "name"}]}]}
+    - ETag 가 같으면 304, Cache-Control: public, max-age=AREAS_CACHE_MAX_AGE
+    """
+    return _precompressed_response(TREE_KEY, "tree")
+
+@areas_bp.route("/api/areas/dong/<int:sigungu_code>")
+def get_dong_by_code(sigungu_code):
+    """
+    시/군/구의 읍/면/동 목록
+    =======================
+
+    URL: GET /api/areas/dong/<sigungu_code>
+
+    반환값:
+    - [{"code": 법정동 코드, "name": 읍/면/동 이름}] (없는 시/군/구 코드면 404 와 빈 목록)
+    - 캐시 헤더는 /api/areas/tree 와 같음
+    """
     if not sigungu_code:
-        return jsonify([])
-    return jsonify([
-        {"name": last_token(d["name"])}
-        for d in dong_list if d["sigungu_code"] == sigungu_code
-    ])
\ No newline at end of file
+        return _json_payload(EMPTY_PAYLOAD), 404
+    return _precompressed_response(sigungu_code, str(sigungu_code))
+
+@areas_bp.route("/api/areas/job_counts")
+def get_job_counts():
+    """
+    지역별 모집 중인 공고 수 (공고가 있는 지역만)
+
+    지역 선택기의 공고 수 표시와 지도 지역별 히트맵이 함께 사용합니다.
+    시/군/구, 읍/면/동 키는 위 선택기 API 가 내려주는 이름과 같습니다.
+    """
+    return jsonify(RegionService.get_job_count_tree())
@@ -13,6 +13,7 @@ from flask import request, flash
 from services.job_service import JobService
 from services.application_service import ApplicationService
 from services.naver_news_service import NaverNewsService
+from services.region_service import RegionService
 
 # 인증 관련 라우트를 담당하는 블루프린트 생성
 auth_bp = Blueprint("auth", __name__)
@@ -202,6 +203,13 @@ def main():
         company_jobs_with_status = []
         person_jobs_with_status = []
 
+    # 급상승 공고 (최근 24시간, 캐시된 상위 공고 중 3개)
+    try:
+        trending_jobs = JobService.get_trending_jobs(window='24h', limit=3)
+    except Exception as e:
+        print(f"Error getting trending jobs: {e}")
+        trending_jobs = []
+
     # 뉴스 데이터 가져오기 (상위 3개)
     try:
         news_service = NaverNewsService()
@@ -211,7 +219,7 @@ def main():
         print(f"Error getting news: {e}")
         news_list = []
 
-    return render_template("main.html", user=current_user, company_jobs=company_jobs_with_status, people_jobs=person_jobs_with_status, news_list=news_list)
+    return render_template("main.html", user=current_user, company_jobs=company_jobs_with_status, people_jobs=person_jobs_with_status, trending_jobs=trending_jobs, news_list=news_list)
 
 # 로그인한 사용자의 프로필 페이지
 @auth_bp.route("/profile")
@@ -238,6 +246,9 @@ def onboarding():
         current_user.sido = request.form.get("sido")
         current_user.sigungu = request.form.get("sigungu")
         current_user.dong = request.form.get("dong")
+        current_user.region_code = RegionService.resolve_code(
+            current_user.sido, current_user.sigungu, current_user.dong
+        )
         
         try:
             db.session.commit()
@@ -403,6 +414,7 @@ def edit_profile():
         user.sido = request.form.get('sido')
         user.sigungu = request.form.get('sigungu')
         user.dong = request.form.get('dong')
+        user.region_code = RegionService.resolve_code(user.sido, user.sigungu, user.dong)
 
         try:
             db.session.commit()
@@ -8,20 +8,28 @@
 - 채팅방 목록 조회
 - 채팅 화면 표시
 - 메시지 전송 (AJAX)
+- 새 메시지/읽음 표시 실시간 스트림 (SSE)
 - 읽지 않은 메시지 관리
 
 작성자: [팀명]
 최종 수정일: 2025-01-09
 """
 
-from flask import Blueprint, render_template, request, redirect, url_for, flash, jsonify
+import queue
+import time
+from flask import Blueprint, Response, current_app, render_template, request, redirect, url_for, flash, jsonify
 from flask_login import login_required, current_user
+from models import db
 from services.chat_service import ChatService
+from services.chat_stream_service import ChatStreamService, format_event, message_data
 from services.application_service import ApplicationService
 
 # 채팅 관련 블루프린트 생성
 chat_bp = Blueprint("chat", __name__)
 
+# 메시지 목록 API 한 번에 내려주는 최대 메시지 수
+MAX_MESSAGE_LIMIT = 100
+
 @chat_bp.route("/chat")
 @login_required
 def chat_list():
@@ -60,7 +68,7 @@ def chat_room(room_id):
     ===========
     
     기능:
-    - 특정 채팅방의 메시지 목록 표시
+    - 특정 채팅방의 최신 메시지 목록 표시 (이전 메시지는 위로 스크롤하면 불러옴)
     - 메시지 전송 폼 제공
     - 실시간 메시지 업데이트 (JavaScript)
     - 메시지 읽음 처리
@@ -73,14 +81,14 @@ def chat_room(room_id):
     
     반환값:
     - room: 채팅방 정보
-    - messages: 메시지 목록
+    - messages: 최신 메시지 목록 (오래된 순)
+    - has_more: 이전 메시지 존재 여부
     - other_user: 상대방 정보
     - job: 관련 공고 정보
     """
     
-    # 메시지 목록 조회 (권한 확인 포함)
-    messages_pagination = ChatService.get_chat_messages(room_id, current_user.id)
-    messages = messages_pagination.items
+    # 최신 메시지 목록 조회 (권한 확인 포함)
+    messages, has_more = ChatService.get_chat_messages(room_id, current_user.id)
     
     # 채팅방 정보 조회
     from models import ChatRoom
@@ -95,6 +103,7 @@ def chat_room(room_id):
     return render_template("chat/chat_room.html", 
                          room=room, 
                          messages=messages,
+                         has_more=has_more,
                          other_user=other_user,
                          job=room.job)
 
@@ -174,8 +183,8 @@ def get_messages(room_id):
     
     기능:
     - 채팅방의 메시지 목록을 JSON으로 반환
-    - 페이지네이션 지원
-    - 실시간 업데이트용
+    - 메시지 ID 커서 방식 (after_id: 새 메시지, before_id: 이전 메시지)
+    - 실시간 업데이트용 (EventSource 를 쓸 수 없는 브라우저의 폴링)
     
     URL: GET /chat/<room_id>/messages
     
@@ -183,26 +192,29 @@ def get_messages(room_id):
     - room_id: 채팅방 ID
     
     쿼리 파라미터:
-    - page: 페이지 번호 (기본값: 1)
-    - per_page: 페이지당 메시지 수 (기본값: 50)
+    - after_id: 이 ID 보다 새 메시지만 (화면의 마지막 메시지 ID)
+    - before_id: 이 ID 보다 오래된 메시지 (화면의 첫 메시지 ID)
+    - limit: 최대 메시지 수 (기본값: 50, 최대 MAX_MESSAGE_LIMIT)
+    - 커서가 없으면 최신 메시지
     
     반환값 (JSON):
     - success: 성공 여부
-    - messages: 메시지 목록
-    - has_more: 더 많은 메시지 존재 여부
+    - messages: 메시지 목록 (오래된 순)
+    - has_more: after_id 면 더 새 메시지, 그 외에는 더 오래된 메시지 존재 여부
     """
     
     try:
-        page = request.args.get('page', 1, type=int)
-        per_page = request.args.get('per_page', 50, type=int)
+        after_id = request.args.get('after_id', type=int)
+        before_id = request.args.get('before_id', type=int)
+        limit = min(max(request.args.get('limit', 50, type=int), 1), MAX_MESSAGE_LIMIT)
         
         # 메시지 목록 조회
-        messages_pagination = ChatService.get_chat_messages(
-            room_id, current_user.id, page, per_page
+        messages, has_more = ChatService.get_chat_messages(
+            room_id, current_user.id, after_id=after_id, before_id=before_id, limit=limit
         )
         
         messages_data = []
-        for message in messages_pagination.items:
+        for message in messages:
             messages_data.append({
                 'id': message.id,
                 'message': message.message,
@@ -216,7 +228,7 @@ def get_messages(room_id):
         return jsonify({
             'success': True,
             'messages': messages_data,
-            'has_more': messages_pagination.has_next
+            'has_more': has_more
         })
         
     except Exception as e:
@@ -225,6 +237,131 @@ def get_messages(room_id):
             'message': '메시지 조회 중 오류가 발생했습니다.'
         }), 500
 
+@chat_bp.route("/chat/<int:room_id>/stream")
+@login_required
+def stream_messages(room_id):
+    """
+    새 메시지/읽음 표시 실시간 스트림 (SSE)
+    ====================================
+    
+    기능:
+    - 채팅방의 새 메시지(message)와 상대방 읽음 표시(read) 이벤트를 전송
+    - 연결 직후 놓친 메시지를 DB 에서 채운 뒤 실시간 전송으로 전환
+    - 메시지 이벤트 id 는 메시지 ID (브라우저가 재연결 시 Last-Event-ID 로 보냄)
+    - CHAT_STREAM_HEARTBEAT_SECONDS 마다 keep-alive 주석 전송
+    - CHAT_STREAM_MAX_SECONDS 가 지나면 연결을 닫아 브라우저가 다시 연결 (권한 재확인)
+    
+    URL: GET /chat/<room_id>/stream
+    
+    매개변수:
+    - room_id: 채팅방 ID
+    
+    요청 헤더:
+    - Last-Event-ID: 마지막으로 받은 메시지 ID (재연결 시, after_id 보다 우선)
+    
+    쿼리 파라미터:
+    - after_id: 화면에 이미 있는 마지막 메시지 ID (처음 연결 시, 메시지가 없으면 0)
+    
+    반환값 (text/event-stream):
+    - message: 메시지 정보 (id, message, sender_id, sender_name, created_at, message_type)
+    - read: 상대방이 읽은 마지막 메시지 (reader_id, last_read_id)
+    """
+    
+    room = ChatService.get_participant_room(room_id, current_user.id)
+    user_id = current_user.id
+    
+    after_id = request.headers.get('Last-Event-ID', type=int)
+    if after_id is None:
+        after_id = request.args.get('after_id', type=int)
+    
+    config = current_app.config
+    heartbeat = config.get('CHAT_STREAM_HEARTBEAT_SECONDS', 15)
+    max_seconds = config.get('CHAT_STREAM_MAX_SECONDS', 300)
+    catch_up_limit = config.get('CHAT_STREAM_CATCH_UP_LIMIT', 200)
+    
+    # 구독 후 놓친 메시지를 채움 (구독 이후 메시지는 큐로 오므로 빠지는 메시지 없음)
+    subscription = ChatStreamService.subscribe(room_id, user_id)
+    try:
+        catch_up = []
+        if after_id is not None:
+            while True:
+                rows = ChatStreamService.messages_after(room_id, after_id, catch_up_limit)
+                catch_up.extend(rows)
+                if len(rows) < catch_up_limit:
+                    break
+                after_id = rows[-1].id
+        read = ChatStreamService.read_event(room, user_id)
+    except Exception:
+        ChatStreamService.unsubscribe(subscription)
+        raise
+    finally:
+        # 스트림을 여는 동안 DB 커넥션을 잡고 있지 않도록 반납
+        db.session.remove()
+    
+    def generate():
+        try:
+            yield f"retry: {config.get('CHAT_STREAM_RETRY_MS', 3000)}\n\n"
+            sent_ids = set()
+            for row in catch_up:
+                sent_ids.add(row.id)
+                yield format_event('message', message_data(row), row.id)
+            if read:
+                yield format_event('read', read)
+            
+            deadline = time.monotonic() + max_seconds
+            while not subscription.overflowed:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    event, data, event_id = subscription.queue.get(timeout=min(heartbeat, remaining))
+                except queue.Empty:
+                    yield ": keep-alive\n\n"
+                    continue
+                if event_id in sent_ids:
+                    continue
+                yield format_event(event, data, event_id)
+        finally:
+            ChatStreamService.unsubscribe(subscription)
+    
+    return Response(generate(), mimetype='text/event-stream', headers={
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no'  # 프록시(nginx) 버퍼링 끄기
+    })
+
+@chat_bp.route("/chat/<int:room_id>/read", methods=["POST"])
+@login_required
+def mark_as_read(room_id):
+    """
+    메시지 읽음 처리 (AJAX)
+    ======================
+    
+    기능:
+    - 채팅방을 보고 있는 중에 받은 메시지를 읽음으로 표시
+    - 상대방 스트림에 읽음 표시(read) 이벤트가 전달됨
+    
+    URL: POST /chat/<room_id>/read
+    
+    매개변수:
+    - room_id: 채팅방 ID
+    
+    반환값 (JSON):
+    - success: 성공 여부
+    """
+    
+    ChatService.get_participant_room(room_id, current_user.id)
+    
+    try:
+        ChatService.mark_messages_as_read(room_id, current_user.id)
+        return jsonify({'success': True})
+        
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({
+            'success': False,
+            'message': '읽음 처리 중 오류가 발생했습니다.'
+        }), 500
+
 @chat_bp.route("/chat/<int:room_id>/leave", methods=["POST"])
 @login_required
 def leave_chat_room(room_id):
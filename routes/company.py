@@ -19,6 +19,10 @@ from flask_login import login_required, current_user
 from models import db, JobPost
 from services.job_service import JobService
 from services.application_service import ApplicationService
+from services.job_stats_service import JobStatsService
+from services.region_service import RegionService
+from services.job_geocoding_service import JobGeocodingService
+from utils.region_matcher import match_address
 from utils.helpers import format_datetime, get_work_days
 from datetime import datetime, time
 
@@ -65,6 +69,10 @@ def company_list():
     filters = {}
     if region:
         filters['region'] = region
+        # 법정동 코드로 찾으면 하위 지역 전체를 코드 앞부분으로 검색
+        region_match = match_address(region)
+        if region_match:
+            filters['region_code_prefix'] = region_match.prefix
     if recruitment_type:
         filters['recruitment_type'] = recruitment_type
     if work_period:
@@ -238,6 +246,7 @@ def create_company_job():
                 disabled_restroom=disabled_restroom,
                 recruitment_type=recruitment_type,
                 region=region,
+                region_code=RegionService.resolve_code(address=region),
                 contact_phone=contact_phone,
                 recruitment_count=recruitment_count,
                 work_start_time=work_start_time,
@@ -255,8 +264,13 @@ def create_company_job():
             )
             
             db.session.add(new_job)
+            RegionService.record_change(new_snapshot=RegionService.snapshot(new_job))
             db.session.commit()
             
+            # 근무지 주소로 좌표/행정구역 채우기 (백그라운드)
+            if new_job.region:
+                JobGeocodingService.enqueue(new_job.id)
+            
             flash("기업 공고가 성공적으로 등록되었습니다!", "success")
             return redirect(url_for("company.company_list"))
             
@@ -286,7 +300,7 @@ def company_job_detail(job_id):
     job = JobService.get_job_by_id(job_id)
     
     # 조회수 증가
-    JobService.increment_view_count(job_id)
+    JobService.increment_view_count(job_id, current_user.id)
     
     # 현재 사용자가 이 공고를 찜했는지 확인
     is_bookmarked = JobService.is_bookmarked(current_user.id, job_id)
@@ -297,16 +311,11 @@ def company_job_detail(job_id):
     else:
         application_status = {'applied': False, 'status': None}
     
-    # 지원자 목록 (공고 작성자만)
-    applications = []
-    if current_user.id == job.author_id:
-        applications = ApplicationService.get_job_applications(job_id, current_user.id)
-    
+    # 지원자 목록은 별도 페이지(company_job_applications)에서 조회
     return render_template("company/job_detail.html", 
                          job=job, 
                          is_bookmarked=is_bookmarked,
-                         application_status=application_status,
-                         applications=applications)
+                         application_status=application_status)
 
 @company_bp.route("/company/<int:job_id>/applications")
 @login_required
@@ -316,26 +325,40 @@ def company_job_applications(job_id):
     ====================
     
     기능:
-    - 공고에 지원한 사용자 목록 조회
+    - 공고에 지원한 사용자 목록 조회 (이력서, 자격증 포함)
+    - 지원 상태별 필터링 및 상태별 지원자 수 표시
+    - 페이지네이션 지원 (기본 20명씩)
     - 지원 상태 관리 (승인/거절)
     
     URL: GET /company/<job_id>/applications
     템플릿: company/job_applications.html
     
+    쿼리 파라미터:
+    - status: 지원 상태 필터 (pending, accepted, rejected / 없으면 전체)
+    - page: 페이지 번호 (기본값: 1)
+    
     권한:
     - 공고 작성자만 접근 가능
     """
     
+    status = request.args.get('status', '')
+    page = request.args.get('page', 1, type=int)
+    
     try:
-        # 지원자 목록 조회 (권한 확인 포함)
-        applications = ApplicationService.get_job_applications(job_id, current_user.id)
+        # 공고 및 지원자 목록 조회 (권한 확인 포함)
+        job, applications = ApplicationService.get_job_applications(
+            job_id, current_user.id, status=status or None, page=page
+        )
         
-        # 공고 정보
-        job = JobService.get_job_by_id(job_id)
+        # 상태별 지원자 수
+        status_counts = ApplicationService.get_application_status_counts(job_id)
         
         return render_template("company/job_applications.html", 
                              job=job, 
-                             applications=applications)
+                             applications=applications.items,
+                             pagination=applications,
+                             status_counts=status_counts,
+                             current_status=status)
         
     except Exception as e:
         flash("지원자 목록을 조회할 수 없습니다.", "error")
@@ -348,4 +371,109 @@ def update_application_status(application_id):
     result = ApplicationService.update_application_status(
         application_id, current_user.id, status
     )
-    return jsonify(result)
\ No newline at end of file
+    return jsonify(result)
+
+@company_bp.route("/company/<int:job_id>/applications/status", methods=["POST"])
+@login_required
+def bulk_update_application_status(job_id):
+    """
+    지원 상태 일괄 변경 (AJAX)
+    =========================
+    
+    기능:
+    - 선택한 지원자들을 한 번에 승인/거절
+    - 변경 후 상태별 지원자 수 반환
+    
+    URL: POST /company/<job_id>/applications/status
+    
+    요청 데이터 (JSON):
+    - application_ids: 지원 ID 목록 (최대 500개)
+    - status: 새로운 상태 ('accepted', 'rejected')
+    
+    반환값 (JSON):
+    - success: 성공 여부
+    - message: 결과 메시지
+    - updated: 변경된 지원 수 (성공 시)
+    - status_counts: 상태별 지원자 수 (성공 시)
+    
+    권한:
+    - 공고 작성자만 변경 가능
+    """
+    
+    data = request.get_json(silent=True) or {}
+    status = data.get('status')
+    
+    try:
+        application_ids = [int(application_id) for application_id in data.get('application_ids', [])]
+    except (TypeError, ValueError):
+        return jsonify({'success': False, 'message': '잘못된 지원 ID입니다.'}), 400
+    
+    if len(application_ids) > 500:
+        return jsonify({'success': False, 'message': '한 번에 최대 500명까지 변경할 수 있습니다.'}), 400
+    
+    result = ApplicationService.bulk_update_application_status(
+        job_id, current_user.id, application_ids, status
+    )
+    return jsonify(result), (200 if result['success'] else 400)
+
+@company_bp.route("/company/analytics")
+@login_required
+def company_analytics():
+    """
+    공고 성과 대시보드
+    =================
+    
+    기능:
+    - 내가 작성한 모든 공고의 기간별 조회/찜/지원/채팅 시작 수
+    - 공고별 일별 추이 표시
+    - 일별 롤업 테이블만 조회 (원시 이벤트를 읽지 않음)
+    
+    URL: GET /company/analytics
+    템플릿: company/analytics.html
+    
+    쿼리 파라미터:
+    - days: 조회 기간 (7, 14, 30 / 기본값: 14)
+    """
+    
+    days = request.args.get('days', 14, type=int)
+    if days not in (7, 14, 30):
+        days = 14
+    
+    stats = JobStatsService.get_employer_stats(current_user.id, days=days)
+    
+    return render_template("company/analytics.html", 
+                         stats=stats, 
+                         current_days=days)
+
+@company_bp.route("/company/analytics/<int:job_id>/hourly")
+@login_required
+def company_job_hourly_stats(job_id):
+    """
+    공고 시간별 통계 (AJAX)
+    ======================
+    
+    URL: GET /company/analytics/<job_id>/hourly
+    
+    쿼리 파라미터:
+    - hours: 조회 기간 (최대 168시간 / 기본값: 48)
+    
+    반환값 (JSON):
+    - success: 성공 여부
+    - series: 시간별 조회/찜/지원/채팅 시작 수
+    
+    권한:
+    - 공고 작성자만 조회 가능
+    """
+    
+    JobPost.query.filter_by(id=job_id, author_id=current_user.id).first_or_404()
+    
+    hours = min(max(request.args.get('hours', 48, type=int), 1), 168)
+    series = JobStatsService.get_hourly_stats(job_id, hours=hours)
+    
+    return jsonify({
+        'success': True,
+        'series': [
+            dict(item, bucket_start=item['bucket_start'].strftime('%Y-%m-%d %H:00'))
+            for item in series
+        ]
+    })
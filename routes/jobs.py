@@ -15,12 +15,17 @@
 최종 수정일: 2025-01-09
 """
 
-from flask import Blueprint, render_template, request, redirect, url_for, flash, jsonify,  current_app
+from flask import Blueprint, render_template, request, redirect, url_for, flash, jsonify,  current_app, get_template_attribute
 from flask_login import login_required, current_user
 from models import db, JobPost
 from services.job_service import JobService
 from services.application_service import ApplicationService
+from services.map_service import MapService
+from services.region_service import RegionService
+from services.job_geocoding_service import JobGeocodingService
+from services.commute_service import CommuteService
 from utils.helpers import format_datetime, get_work_days
+from utils.cache import cache
 from datetime import datetime, time
 
 # 공고 관련 블루프린트 생성
@@ -48,6 +53,8 @@ def job_list():
     - region: 지역 필터 (선택)
     - recruitment_type: 모집형태 필터 (선택)
     - work_period: 근무기간 필터 (선택)
+    - commute: 1 이면 거주지에서 이력서의 통근 시간/걸을 수 있는 시간 안에 갈 수 있는 공고만 (선택)
+    - sort: 정렬 기준 (latest, popular, views, trending)
 
     반환값:
     - jobs: 공고 목록
@@ -59,6 +66,7 @@ def job_list():
     recruitment_type = request.args.get('recruitment_type', '')  # 모집형태 필터
     work_period = request.args.get('work_period', '')  # 근무기간 필터
     sort_by = request.args.get('sort', 'latest')  # 정렬 기준
+    commute = request.args.get('commute') == '1'  # 통근 가능 공고만
 
     # 필터 조건을 딕셔너리로 구성 (정확 일치용)
     filters = {}
@@ -67,23 +75,46 @@ def job_list():
     if work_period:
         filters['work_period'] = work_period
 
-    # LIKE 검색 조건 (부분 일치용)
+    # 지역 필터: 법정동 코드로 찾으면 코드 앞부분 비교 ('서울'/'서울특별시' 등 표기 차이 무시)
+    region1 = request.args.get('region1', '').strip()
+    region2 = request.args.get('region2', '').strip()
+    region3 = request.args.get('region3', '').strip()
+    region_code_prefix = RegionService.match_filter(region1, region2, region3)
+    if region_code_prefix:
+        filters['region_code_prefix'] = region_code_prefix
+
+    # 코드로 찾지 못한 지역은 LIKE 검색 조건 (부분 일치용)
     conditions = []
-    if request.args.get('region1'):
-        region1 = request.args.get('region1')
-        conditions.append(JobPost.region_1depth_name.like(f"{region1}%"))
-    if request.args.get('region2'):
-        region2 = request.args.get('region2')
-        conditions.append(JobPost.region_2depth_name.like(f"{region2}%"))
-    if request.args.get('region3'):
-        region3 = request.args.get('region3')
-        conditions.append(JobPost.region_3depth_name.like(f"{region3}%"))
-
-    # 검색어나 필터가 있으면 검색 실행, 없으면 전체 목록 조회
+    if not region_code_prefix:
+        if region1:
+            conditions.append(JobPost.region_1depth_name.like(f"{region1}%"))
+        if region2:
+            conditions.append(JobPost.region_2depth_name.like(f"{region2}%"))
+        if region3:
+            conditions.append(JobPost.region_3depth_name.like(f"{region3}%"))
+
+    # 통근 가능 공고 필터: 거주지 → 읍/면/동 거리 행렬로 통근 가능한 법정동 코드를 구해 쿼리 조건으로
+    commute_unavailable = False
+    if commute:
+        resume = current_user.resume
+        reachable_codes = CommuteService.reachable_codes(
+            current_user.region_code,
+            commute_minutes=resume.commute_time if resume else None,
+            walkable_minutes=resume.walkable_minutes if resume else None
+        )
+        if reachable_codes is None:
+            commute_unavailable = True
+            commute = False
+
+    # 검색어나 필터가 있으면 검색 실행, 없으면 전체 목록 조회 (통근 필터만 있으면 전체 목록 조회에 조건 추가)
     if query or filters or conditions:
-        jobs = JobService.search_jobs(query, filters, conditions, sort_by)
+        search_filters = dict(filters, region_codes=reachable_codes) if commute else filters
+        jobs = JobService.search_jobs(query, search_filters, conditions, sort_by)
     else:
-        jobs_pagination = JobService.get_all_jobs(page=1, per_page=20, sort_by=sort_by)
+        jobs_pagination = JobService.get_all_jobs(
+            page=1, per_page=20, sort_by=sort_by,
+            filters={'region_codes': reachable_codes} if commute else None
+        )
         jobs = jobs_pagination.items
 
     # 각 공고의 지원 상태 확인
@@ -97,8 +128,13 @@ def job_list():
         jobs_with_status.append(job_data)
 
     current_filters = filters.copy()
+    current_filters['region_1depth_name'] = region1 or None
+    current_filters['region_2depth_name'] = region2 or None
+    current_filters['region_3depth_name'] = region3 or None
     current_filters['q'] = query
     current_filters['sort'] = sort_by
+    current_filters['commute'] = commute
+    current_filters['commute_unavailable'] = commute_unavailable
 
     return render_template("jobs/job_list.html",
                            jobs_with_status=jobs_with_status,
@@ -188,12 +224,22 @@ def create_job():
                 region_1depth_name=region_1depth_name,
                 region_2depth_name=region_2depth_name,
                 region_3depth_name=region_3depth_name,
+                region_code=RegionService.resolve_code(
+                    region_1depth_name, region_2depth_name, region_3depth_name, address=region
+                ),
                 author_id=current_user.id
             )
             
             db.session.add(new_job)
+            db.session.flush()  # 변경 기록에 쓸 공고 ID 확보
+            MapService.record_position_change(new_job.id, new_position=(latitude, longitude))
+            RegionService.record_change(new_snapshot=RegionService.snapshot(new_job))
             db.session.commit()
             
+            # 지도에서 위치를 고르지 않았으면 근무지 주소로 좌표 채우기 (백그라운드)
+            if new_job.latitude is None and new_job.region:
+                JobGeocodingService.enqueue(new_job.id)
+            
             flash("공고가 성공적으로 등록되었습니다!", "success")
             return redirect(url_for("jobs.job_list"))
             
@@ -207,14 +253,37 @@ def create_job():
     
     return render_template("jobs/create_job_scroll.html", kakao_key=kakao_api_key)
 
+def _get_job_detail_static(job_id, version):
+    """
+    공고 상세 페이지의 정적 영역(헤더, 본문) 조회
+
+    사용자와 무관한 영역만 렌더링하여 캐시합니다. 캐시 키에 공고의
+    updated_at 버전이 포함되므로 공고가 수정되면 자연스럽게 새로 렌더링됩니다.
+    """
+    cache_key = f"job_detail:{job_id}:{version}"
+    job_static = cache.get(cache_key)
+    if job_static is None:
+        job = JobService.get_job_by_id(job_id)
+        template_name = "jobs/_job_detail_static.html"
+        job_static = {
+            'header': get_template_attribute(template_name, "header")(job),
+            'body': get_template_attribute(template_name, "body")(job)
+        }
+        cache.set(cache_key, job_static,
+                  timeout=current_app.config.get('JOB_DETAIL_CACHE_TIMEOUT'))
+    return job_static
+
 # 공고 상세보기
 @jobs_bp.route("/jobs/<int:job_id>")
 @login_required
 def job_detail(job_id):
-    job = JobService.get_job_by_id(job_id)
-    
-    # 조회수 증가
-    JobService.increment_view_count(job_id)
+    # 동적 영역(조회/찜/지원 수, 작성자 여부)에 필요한 컬럼만 조회 (없는 공고면 404)
+    job = JobService.get_job_summary(job_id)
+
+    # 조회수 증가 (공고가 있을 때만)
+    JobService.increment_view_count(job_id, current_user.id)
+    version = int(job.updated_at.timestamp() * 1000000) if job.updated_at else 0
+    job_static = _get_job_detail_static(job_id, version)
     
     # 현재 사용자가 이 공고를 찜했는지 확인
     is_bookmarked = JobService.is_bookmarked(current_user.id, job_id)
@@ -224,6 +293,7 @@ def job_detail(job_id):
     
     return render_template("jobs/job_detail.html", 
                          job=job, 
+                         job_static=job_static,
                          is_bookmarked=is_bookmarked,
                          application_status=application_status)
 
@@ -240,6 +310,8 @@ def edit_job(job_id):
     
     if request.method == "POST":
         try:
+            old_region = RegionService.snapshot(job)
+            
             # 폼 데이터 업데이트
             job.title = request.form.get("title", "").strip()
             job.company = request.form.get("company", "").strip()
@@ -255,13 +327,19 @@ def edit_job(job_id):
             job.region_1depth_name = request.form.get("region_1depth_name")
             job.region_2depth_name = request.form.get("region_2depth_name")
             job.region_3depth_name = request.form.get("region_3depth_name")
+            job.region_code = RegionService.resolve_code(
+                job.region_1depth_name, job.region_2depth_name, job.region_3depth_name, address=job.region
+            )
 
             latitude = request.form.get("latitude", type=float)
             longitude = request.form.get("longitude", type=float)
+            old_position = (job.latitude, job.longitude)
             if latitude is not None:
                 job.latitude = latitude
             if longitude is not None:
                 job.longitude = longitude
+            MapService.record_position_change(job.id, old_position, (job.latitude, job.longitude))
+            RegionService.record_change(old_region, RegionService.snapshot(job))
 
             # 근무 시간 업데이트
             work_start_time_str = request.form.get("work_start_time", "")
@@ -280,6 +358,9 @@ def edit_job(job_id):
             job.work_friday = bool(request.form.get("work_friday"))
             job.work_saturday = bool(request.form.get("work_saturday"))
             job.work_sunday = bool(request.form.get("work_sunday"))
+
+            # 내용 수정 시각 갱신 (상세 페이지 캐시 버전)
+            job.updated_at = datetime.utcnow()
             
             db.session.commit()
             flash("공고가 성공적으로 수정되었습니다!", "success")
@@ -306,6 +387,8 @@ def delete_job(job_id):
         return redirect(url_for("jobs.job_detail", job_id=job_id))
     
     try:
+        MapService.record_position_change(job.id, old_position=(job.latitude, job.longitude))
+        RegionService.record_change(old_snapshot=RegionService.snapshot(job))
         db.session.delete(job)
         db.session.commit()
         flash("공고가 삭제되었습니다.", "success")
@@ -346,8 +429,8 @@ def toggle_bookmark(job_id):
         # JobService를 통해 찜 상태 토글 (True: 찜 추가, False: 찜 해제)
         is_bookmarked = JobService.toggle_bookmark(current_user.id, job_id)
         
-        # 업데이트된 공고 정보 조회
-        job = JobService.get_job_by_id(job_id)
+        # 업데이트된 찜 개수 조회
+        job = JobService.get_job_summary(job_id)
         
         # 찜 상태에 따른 메시지 설정
         message = "찜 목록에 추가했습니다." if is_bookmarked else "찜을 취소했습니다."
@@ -386,55 +469,53 @@ def bookmark_list():
     기능:
     - 현재 로그인한 사용자의 찜한 공고 목록 조회
     - 카테고리별 필터링 (사람 이음 / 기업 이음)
-    - 찜한 순서대로 정렬 (최신순)
+    - 최신순/인기순/조회순 정렬
+    - 페이지네이션 지원 (기본 20개씩)
     - 찜 해제 기능 포함
 
     URL: GET /bookmarks
     템플릿: jobs/bookmark_list.html
 
+    쿼리 파라미터:
+    - category: people(사람 이음, 기본값) 또는 company(기업 이음)
+    - sort: 정렬 기준 (latest, popular, views)
+    - page: 페이지 번호 (기본값: 1)
+
     반환값:
-    - jobs: 사용자가 찜한 공고 목록
+    - jobs_with_status: 사용자가 찜한 공고 목록과 지원 상태
+    - pagination: 페이지네이션 정보
 
     주의사항:
     - 로그인이 필요한 페이지
     - 찜 목록이 비어있을 경우 빈 상태 메시지 표시
     """
 
-    # 정렬 기준 및 카테고리 추출
+    # 정렬 기준, 카테고리, 페이지 추출
     sort_by = request.args.get('sort', 'latest')
     category = request.args.get('category', 'people')  # people(사람 이음) 또는 company(기업 이음)
-
-    # JobService를 통해 현재 사용자의 찜 목록 조회
-    jobs = JobService.get_user_bookmarks(current_user.id)
-
-    # 카테고리별 필터링
-    if category == 'company':
-        # 기업 이음: user_type이 1인 작성자의 공고
-        jobs = [job for job in jobs if job.author.user_type == 1]
-    else:  # people
-        # 사람 이음: user_type이 0인 작성자의 공고
-        jobs = [job for job in jobs if job.author.user_type == 0]
-
-    # 정렬 적용
-    if sort_by == 'popular':
-        jobs.sort(key=lambda x: x.bookmark_count + x.application_count, reverse=True)
-    elif sort_by == 'views':
-        jobs.sort(key=lambda x: x.view_count, reverse=True)
-    else:  # latest
-        jobs.sort(key=lambda x: x.created_at, reverse=True)
-
-    # 각 공고의 지원 상태 확인
-    jobs_with_status = []
-    for job in jobs:
-        application_status = ApplicationService.check_application_status(current_user.id, job.id)
-        job_data = {
-            'job': job,
-            'application_status': application_status
-        }
-        jobs_with_status.append(job_data)
+    page = request.args.get('page', 1, type=int)
+
+    # 기업 이음: user_type이 1인 작성자의 공고 / 사람 이음: user_type이 0인 작성자의 공고
+    author_type = 1 if category == 'company' else 0
+
+    # 필터링, 정렬, 페이지네이션을 한 번의 조인 쿼리로 처리
+    jobs_pagination = JobService.get_user_bookmarks(
+        current_user.id, author_type=author_type, sort_by=sort_by, page=page
+    )
+    jobs = jobs_pagination.items
+
+    # 각 공고의 지원 상태를 한 번에 확인
+    application_statuses = ApplicationService.get_application_statuses(
+        current_user.id, [job.id for job in jobs]
+    )
+    jobs_with_status = [
+        {'job': job, 'application_status': application_statuses[job.id]}
+        for job in jobs
+    ]
 
     return render_template("jobs/bookmark_list.html",
                          jobs_with_status=jobs_with_status,
+                         pagination=jobs_pagination,
                          current_sort=sort_by,
                          current_category=category)
 
@@ -539,36 +620,13 @@ def job_applications(job_id):
     공고 지원자 목록 (고용주용)
     =========================
     
-    기능:
-    - 공고에 지원한 사용자 목록 조회
-    - 지원 상태별 필터링
-    - 지원자와의 채팅방 링크 제공
+    지원자 목록 화면은 기업 공고 지원자 목록(company.company_job_applications)과
+    같으므로 해당 페이지로 이동합니다. (상태 필터, 페이지 파라미터 유지)
     
     URL: GET /jobs/<job_id>/applications
-    템플릿: jobs/job_applications.html
     
     매개변수:
     - job_id: 공고 ID
-    
-    반환값:
-    - job: 공고 정보
-    - applications: 지원자 목록
-    
-    주의사항:
-    - 공고 작성자만 접근 가능
     """
     
-    try:
-        # 지원자 목록 조회 (권한 확인 포함)
-        applications = ApplicationService.get_job_applications(job_id, current_user.id)
-        
-        # 공고 정보
-        job = JobService.get_job_by_id(job_id)
-        
-        return render_template("jobs/job_applications.html", 
-                             job=job, 
-                             applications=applications)
-        
-    except Exception as e:
-        flash("지원자 목록을 조회할 수 없습니다.", "error")
-        return redirect(url_for("jobs.job_detail", job_id=job_id))
\ No newline at end of file
+    return redirect(url_for("company.company_job_applications", job_id=job_id, **request.args))
@@ -1,8 +1,10 @@
-from flask import Blueprint, render_template,current_app, request, jsonify
+from flask import Blueprint, render_template,current_app, request, jsonify, make_response
 from flask_login import login_required
-from models import db, JobPost
-import requests
 from services.job_service import JobService
+from services.geocode_service import GeocodeService
+from services.map_service import (
+    MapService, parse_point, pack_markers, PAYLOAD_MODE_MARKERS, PAYLOAD_MODE_CLUSTERS
+)
 
 map_bp = Blueprint("map", __name__)
 
@@ -13,24 +15,182 @@ def show_map():
 
     # 기존처럼 전체 데이터를 한 번에 가져오는 대신,
     # 지도 로딩만 담당하고 뷰포트 기반 조회는 별도 API로 처리하도록 분리
-    return render_template("map.html", kakao_key=kakao_key)
+    return render_template("map.html", kakao_key=kakao_key,
+                           map_cluster_min_level=current_app.config.get('MAP_CLUSTER_MIN_LEVEL', 8),
+                           map_max_markers=current_app.config.get('MAP_MAX_MARKERS', 300))
 
-@map_bp.route('/jobs_all')
+@map_bp.route('/api/jobs/in_bounds')
 @login_required
-def jobs_all():
-    # 모든 일자리 데이터를 DB에서 한 번에 불러옴
-    jobs = JobPost.query.filter(
-        JobPost.latitude.isnot(None),
-        JobPost.longitude.isnot(None)
-    ).all()
-
-    job_locations = [
-        {'title': job.title, 'lat': job.latitude, 'company': job.company,
-         'salary': job.salary, 'lng': job.longitude}
-        for job in jobs
-    ]
+def jobs_in_bounds():
+    """
+    뷰포트 범위 공고 조회 (AJAX)
+    ==========================
+    
+    기능:
+    - 지도에 보이는 영역 안의 공고만 조회 (지도 이동/확대 시마다 재조회)
+    - 축소 레벨(MAP_CLUSTER_MIN_LEVEL 이상)에서는 미리 집계된 격자 클러스터만 반환
+    - 개별 마커는 한 번에 MAP_MAX_MARKERS 개까지만 반환
+    - format=bin 이면 ID/좌표만 담은 바이너리로 응답 (ETag 지원, 제목 등은 마커 클릭 시 조회)
+    
+    URL: GET /api/jobs/in_bounds
+    
+    쿼리 파라미터:
+    - sw: 남서쪽 좌표 "위도,경도"
+    - ne: 북동쪽 좌표 "위도,경도"
+    - zoom: 카카오맵 확대 레벨 (1~14, 숫자가 클수록 넓은 지역)
+    - format: 'json' (기본값) 또는 'bin'
+    
+    반환값 (JSON):
+    - mode: 'clusters' 또는 'markers'
+    - clusters: [{lat, lng, count}] (clusters 모드)
+    - jobs: [{id, title, company, salary, lat, lng}] (markers 모드)
+    - truncated: 상한을 넘어 일부만 내려줬는지 여부
+    
+    반환값 (format=bin, application/octet-stream):
+    - services.map_service.pack_markers 레이아웃
+    """
+    sw = parse_point(request.args.get('sw'))
+    ne = parse_point(request.args.get('ne'))
+    if not sw or not ne or sw[0] > ne[0] or sw[1] > ne[1]:
+        return jsonify({'error': 'sw, ne parameters must be "lat,lng" with sw below/left of ne'}), 400
+
+    binary = request.args.get('format') == 'bin'
+    zoom = request.args.get('zoom', type=int)
+
+    if MapService.uses_clusters(zoom, current_app.config.get('MAP_CLUSTER_MIN_LEVEL', 8)):
+        clusters = MapService.get_clusters_in_bounds(zoom, sw[0], sw[1], ne[0], ne[1])
+        if binary:
+            return _binary_response(pack_markers(
+                PAYLOAD_MODE_CLUSTERS,
+                [cluster['count'] for cluster in clusters],
+                [cluster['lat'] for cluster in clusters],
+                [cluster['lng'] for cluster in clusters]
+            ))
+        return jsonify({'mode': 'clusters', 'clusters': clusters, 'jobs': [], 'truncated': False})
+
+    jobs, truncated = MapService.get_jobs_in_bounds(
+        sw[0], sw[1], ne[0], ne[1],
+        limit=current_app.config.get('MAP_MAX_MARKERS', 300),
+        with_details=not binary
+    )
+
+    if binary:
+        return _binary_response(pack_markers(
+            PAYLOAD_MODE_MARKERS,
+            [job['id'] for job in jobs],
+            [job['lat'] for job in jobs],
+            [job['lng'] for job in jobs],
+            truncated=truncated
+        ))
+    return jsonify({'mode': 'markers', 'clusters': [], 'jobs': jobs, 'truncated': truncated})
 
-    return jsonify({'jobs': job_locations})
+def _binary_response(payload):
+    """바이너리 마커 응답 (본문 해시 ETag, 같으면 304)"""
+    response = make_response(payload)
+    response.mimetype = 'application/octet-stream'
+    response.cache_control.private = True
+    response.cache_control.no_cache = True  # 매번 ETag 로 재검증
+    response.add_etag()
+    return response.make_conditional(request)
+
+@map_bp.route('/api/jobs/<int:job_id>/marker')
+@login_required
+def job_marker_detail(job_id):
+    """
+    마커 정보 조회 (AJAX)
+    ===================
+    
+    기능:
+    - 바이너리 마커 응답에 없는 제목/회사명/급여를 마커 클릭 시 조회
+    
+    URL: GET /api/jobs/<job_id>/marker
+    
+    반환값 (JSON):
+    - id, title, company, salary, lat, lng
+    """
+    return jsonify(MapService.get_marker_detail(job_id))
+
+@map_bp.route('/api/jobs/markers/sync')
+@login_required
+def jobs_marker_sync():
+    """
+    마커 증분 동기화 (AJAX)
+    =====================
+    
+    기능:
+    - 클라이언트가 가진 버전 이후에 추가/이동/삭제된 공고 좌표만 반환
+    - 버전이 없거나 너무 오래되었으면 전체 좌표 반환
+    
+    URL: GET /api/jobs/markers/sync
+    
+    쿼리 파라미터:
+    - since: 클라이언트가 가진 버전 (기본값: 0 = 전체)
+    
+    반환값 (JSON):
+    - version: 다음 요청에 보낼 버전
+    - full: 전체 목록 여부 (true 면 보관한 좌표를 모두 버리고 교체)
+    - upserted: [[id, lat, lng]] 추가/이동된 공고
+    - removed: [id] 삭제된 공고
+    """
+    since = request.args.get('since', 0, type=int)
+    changes = MapService.get_marker_changes(
+        since,
+        replay_seconds=current_app.config.get('MAP_SYNC_REPLAY_SECONDS', 30)
+    )
+    return jsonify(changes)
+
+@map_bp.route('/api/jobs/nearby')
+@login_required
+def jobs_nearby():
+    """
+    내 주변 일자리 (AJAX)
+    ===================
+    
+    기능:
+    - 기준 위치에서 반경 안의 공고를 가까운 순으로 조회
+    - 검색어, 모집형태, 근무기간 필터와 함께 사용 가능
+    
+    URL: GET /api/jobs/nearby
+    
+    쿼리 파라미터:
+    - lat, lng: 기준 위치 (필수)
+    - radius_km: 검색 반경 (기본값: 3, 최대 NEARBY_MAX_RADIUS_KM)
+    - limit: 최대 결과 수 (기본값: 30, 최대 100)
+    - q: 검색어
+    - recruitment_type: 모집형태
+    - work_period: 근무기간
+    
+    반환값 (JSON):
+    - jobs: [{id, title, company, salary, lat, lng, distance_km}] 가까운 순
+    """
+    lat = request.args.get('lat', type=float)
+    lng = request.args.get('lng', type=float)
+    if lat is None or lng is None or not (-90 <= lat <= 90 and -180 <= lng <= 180):
+        return jsonify({'error': 'lat, lng parameters are required'}), 400
+
+    max_radius = current_app.config.get('NEARBY_MAX_RADIUS_KM', 50)
+    radius_km = min(max(request.args.get('radius_km', 3, type=float), 0.1), max_radius)
+    limit = min(max(request.args.get('limit', 30, type=int), 1), 100)
+
+    filters = {}
+    if request.args.get('recruitment_type'):
+        filters['recruitment_type'] = request.args.get('recruitment_type')
+    if request.args.get('work_period'):
+        filters['work_period'] = request.args.get('work_period')
+
+    results = JobService.search_nearby(
+        lat, lng, radius_km,
+        query=request.args.get('q', '').strip(),
+        filters=filters,
+        limit=limit
+    )
+
+    jobs = [
+        {'id': job.id, 'title': job.title, 'company': job.company, 'salary': job.salary,
+         'lat': job.latitude, 'lng': job.longitude, 'distance_km': round(distance, 2)}
+        for job, distance in results
+    ]
+    return jsonify({'jobs': jobs, 'radius_km': radius_km})
 
 @map_bp.route('/api/address_search')
 @login_required
@@ -39,16 +199,12 @@ def address_search():
     if not query:
         return jsonify({'error': 'query parameter is required'}), 400
 
-    kakao_rest_api_key = current_app.config.get('KAKAO_REST_API_KEY')
-    if not kakao_rest_api_key:
+    if not current_app.config.get('KAKAO_REST_API_KEY'):
         return jsonify({'error': 'KAKAO_REST_API_KEY is not set'}), 500
 
-    headers = {"Authorization": f"KakaoAK {kakao_rest_api_key}"}
-    url = "https://dapi.kakao.com/v2/local/search/address.json"
-    params = {"query": query}
-
-    resp = requests.get(url, headers=headers, params=params)
-    if resp.status_code != 200:
+    # 메모리/DB 캐시를 먼저 확인하고, 없을 때만 연결 풀을 통해 카카오 API 호출
+    result = GeocodeService.search_address(query)
+    if result is None:
         return jsonify({'error': 'Failed to fetch from Kakao API'}), 502
 
-    return jsonify(resp.json())
\ No newline at end of file
+    return jsonify(result)
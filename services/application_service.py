@@ -14,10 +14,19 @@
 최종 수정일: 2025-01-09
 """
 
-from models import db, JobApplication, JobPost, User
+from flask import abort
+from models import db, JobApplication, JobPost, User, Resume
+from sqlalchemy import func, insert, literal, select
+from sqlalchemy.orm import joinedload
+from sqlalchemy.exc import IntegrityError
 from services.chat_service import ChatService
+from services.job_service import JobService
+from services.job_stats_service import JobStatsService
 from datetime import datetime
 
+# 지원 상태: 대기중, 승인, 거절
+APPLICATION_STATUSES = ('pending', 'accepted', 'rejected')
+
 class ApplicationService:
     
     @staticmethod
@@ -25,6 +34,10 @@ class ApplicationService:
         """
         공고에 지원하기
         
+        지원 정보, 지원 횟수, 채팅방, 시스템 메시지를 하나의 트랜잭션으로 저장합니다.
+        중복 지원은 미리 조회하지 않고 uq_user_job_application 제약 위반으로 판단하므로
+        중복 요청은 INSERT 한 번으로 끝나고, 지원 없이 채팅방만 남는 경우가 없습니다.
+        
         Args:
             user_id: 지원자 ID
             job_id: 공고 ID
@@ -33,64 +46,81 @@ class ApplicationService:
         Returns:
             dict: 결과 정보
         """
-        # 공고 존재 확인
-        job = JobPost.query.get_or_404(job_id)
+        now = datetime.utcnow()
         
-        # 자신의 공고에는 지원할 수 없음
-        if job.author_id == user_id:
+        try:
+            # 지원 정보 생성 (본인 공고는 INSERT ... SELECT 조건에서 제외)
+            source = select(
+                literal(user_id),
+                JobPost.id,
+                literal('pending'),
+                literal(message, db.Text),
+                literal(now),
+                literal(now)
+            ).where(JobPost.id == job_id, JobPost.author_id != user_id)
+            
+            result = db.session.execute(
+                insert(JobApplication).from_select(
+                    ['user_id', 'job_id', 'status', 'message', 'created_at', 'updated_at'],
+                    source
+                )
+            )
+        except IntegrityError:
+            db.session.rollback()
             return {
                 'success': False,
-                'message': '본인이 작성한 공고에는 지원할 수 없습니다.'
+                'message': '이미 지원한 공고입니다.'
             }
         
-        # 이미 지원했는지 확인
-        existing_application = JobApplication.query.filter_by(
-            user_id=user_id,
-            job_id=job_id
-        ).first()
-        
-        if existing_application:
+        if not result.rowcount:
+            db.session.rollback()
+            # 공고가 없거나 본인이 작성한 공고
+            if db.session.query(JobPost.id).filter(JobPost.id == job_id).scalar() is None:
+                abort(404)
             return {
                 'success': False,
-                'message': '이미 지원한 공고입니다.'
+                'message': '본인이 작성한 공고에는 지원할 수 없습니다.'
             }
         
+        application_id = result.lastrowid
+        
         try:
-            # 지원 정보 생성
-            application = JobApplication(
-                user_id=user_id,
-                job_id=job_id,
-                message=message,
-                status='pending'
-            )
-            
-            db.session.add(application)
+            job = db.session.query(JobPost.author_id, JobPost.title, User.nickname)\
+                            .filter(JobPost.id == job_id, User.id == user_id)\
+                            .one()
             
-            # 공고의 지원 횟수 증가
-            job.application_count += 1
+            # 공고의 지원 횟수 증가 (단일 UPDATE 문)
+            JobService.increment_counter(job_id, 'application_count', 1)
             
-            db.session.commit()
-            
-            # 채팅방 자동 생성
-            chat_room = ChatService.create_or_get_chat_room(
+            # 채팅방 자동 생성 (같은 트랜잭션)
+            chat_room_id, chat_room_created = ChatService.open_room_for_application(
                 job_id=job_id,
                 applicant_id=user_id,
-                employer_id=job.author_id
+                employer_id=job.author_id,
+                system_message=f"{job.nickname}님이 '{job.title}' 공고에 지원하여 채팅방이 생성되었습니다."
             )
             
-            return {
-                'success': True,
-                'message': '지원이 완료되었습니다. 채팅방이 생성되었습니다.',
-                'application_id': application.id,
-                'chat_room_id': chat_room.id
-            }
+            db.session.commit()
             
         except Exception as e:
             db.session.rollback()
+            print(f"지원 처리 오류: {e}")
             return {
                 'success': False,
                 'message': '지원 처리 중 오류가 발생했습니다.'
             }
+        
+        # 급상승 집계 및 기업 회원 분석용 시간대별 통계
+        JobStatsService.record(job_id, 'application_count')
+        if chat_room_created:
+            JobStatsService.record(job_id, 'chat_start_count')
+        
+        return {
+            'success': True,
+            'message': '지원이 완료되었습니다. 채팅방이 생성되었습니다.',
+            'application_id': application_id,
+            'chat_room_id': chat_room_id
+        }
     
     @staticmethod
     def get_user_applications(user_id):
@@ -110,25 +140,63 @@ class ApplicationService:
         return applications
     
     @staticmethod
-    def get_job_applications(job_id, employer_id):
+    def get_job_applications(job_id, employer_id, status=None, page=1, per_page=20):
         """
         공고에 대한 지원자 목록 조회 (고용주용)
         
+        지원자, 이력서, 자격증을 함께 로딩하여 템플릿에서 추가 쿼리가 발생하지 않도록 합니다.
+        
         Args:
             job_id: 공고 ID
             employer_id: 고용주 ID
+            status: 지원 상태 필터 ('pending', 'accepted', 'rejected', None: 전체)
+            page: 페이지 번호
+            per_page: 페이지당 지원자 수
             
         Returns:
-            list: 지원자 목록
+            tuple: (공고, 지원자 목록 Pagination)
         """
         # 공고 소유자 확인
         job = JobPost.query.filter_by(id=job_id, author_id=employer_id).first_or_404()
         
-        applications = JobApplication.query.filter_by(job_id=job_id)\
-                                         .order_by(JobApplication.created_at.desc())\
-                                         .all()
+        query = JobApplication.query.filter_by(job_id=job_id)\
+                                    .options(
+                                        joinedload(JobApplication.user)
+                                        .joinedload(User.resume)
+                                        .selectinload(Resume.certificates)
+                                    )
         
-        return applications
+        if status in APPLICATION_STATUSES:
+            query = query.filter(JobApplication.status == status)
+        
+        applications = query.order_by(JobApplication.created_at.desc())\
+                            .paginate(page=page, per_page=per_page, error_out=False)
+        
+        return job, applications
+    
+    @staticmethod
+    def get_application_status_counts(job_id):
+        """
+        공고의 지원 상태별 지원자 수 (GROUP BY 한 번으로 조회)
+        
+        Args:
+            job_id: 공고 ID
+            
+        Returns:
+            dict: {'pending': n, 'accepted': n, 'rejected': n, 'total': n}
+        """
+        counts = {status: 0 for status in APPLICATION_STATUSES}
+        
+        rows = db.session.query(JobApplication.status, func.count(JobApplication.id))\
+                         .filter(JobApplication.job_id == job_id)\
+                         .group_by(JobApplication.status)\
+                         .all()
+        
+        for status, count in rows:
+            counts[status] = count
+        counts['total'] = sum(count for _, count in rows)
+        
+        return counts
     
     @staticmethod
     def update_application_status(application_id, employer_id, status):
@@ -178,6 +246,71 @@ class ApplicationService:
                 'message': '상태 업데이트 중 오류가 발생했습니다.'
             }
     
+    @staticmethod
+    def bulk_update_application_status(job_id, employer_id, application_ids, status):
+        """
+        여러 지원의 상태를 한 번에 업데이트 (고용주용)
+        
+        공고 소유자를 한 번만 확인한 뒤, 해당 공고의 지원들만 단일 UPDATE 문으로 변경합니다.
+        
+        Args:
+            job_id: 공고 ID
+            employer_id: 고용주 ID
+            application_ids: 지원 ID 목록
+            status: 새로운 상태 ('accepted', 'rejected')
+            
+        Returns:
+            dict: 결과 정보 (변경된 지원 수, 상태별 지원자 수 포함)
+        """
+        if status not in ['accepted', 'rejected']:
+            return {
+                'success': False,
+                'message': '잘못된 상태값입니다.'
+            }
+        
+        if not application_ids:
+            return {
+                'success': False,
+                'message': '선택된 지원자가 없습니다.'
+            }
+        
+        # 공고 소유자 확인
+        is_owner = db.session.query(JobPost.id)\
+                             .filter(JobPost.id == job_id, JobPost.author_id == employer_id)\
+                             .scalar() is not None
+        if not is_owner:
+            return {
+                'success': False,
+                'message': '권한이 없습니다.'
+            }
+        
+        try:
+            updated = JobApplication.query.filter(
+                JobApplication.job_id == job_id,
+                JobApplication.id.in_(application_ids)
+            ).update(
+                {JobApplication.status: status, JobApplication.updated_at: datetime.utcnow()},
+                synchronize_session=False
+            )
+            
+            db.session.commit()
+            
+        except Exception as e:
+            db.session.rollback()
+            return {
+                'success': False,
+                'message': '상태 업데이트 중 오류가 발생했습니다.'
+            }
+        
+        status_text = '승인' if status == 'accepted' else '거절'
+        
+        return {
+            'success': True,
+            'message': f'{updated}명의 지원이 {status_text}되었습니다.',
+            'updated': updated,
+            'status_counts': ApplicationService.get_application_status_counts(job_id)
+        }
+    
     @staticmethod
     def check_application_status(user_id, job_id):
         """
@@ -206,4 +339,35 @@ class ApplicationService:
             'status': application.status,
             'application_id': application.id,
             'applied_at': application.created_at
-        }
\ No newline at end of file
+        }
+    
+    @staticmethod
+    def get_application_statuses(user_id, job_ids):
+        """
+        여러 공고에 대한 지원 상태를 한 번의 쿼리로 확인
+        
+        Args:
+            user_id: 사용자 ID
+            job_ids: 공고 ID 목록
+            
+        Returns:
+            dict: {공고 ID: check_application_status 와 같은 형태의 상태 정보}
+        """
+        statuses = {job_id: {'applied': False, 'status': None} for job_id in job_ids}
+        if not job_ids:
+            return statuses
+        
+        applications = JobApplication.query.filter(
+            JobApplication.user_id == user_id,
+            JobApplication.job_id.in_(job_ids)
+        ).all()
+        
+        for application in applications:
+            statuses[application.job_id] = {
+                'applied': True,
+                'status': application.status,
+                'application_id': application.id,
+                'applied_at': application.created_at
+            }
+        
+        return statuses
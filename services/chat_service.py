@@ -15,8 +15,11 @@
 """
 
 from models import db, ChatRoom, ChatMessage, JobPost, User, JobApplication
-from sqlalchemy import or_, and_, desc
+from sqlalchemy import or_, and_, desc, select, func
+from sqlalchemy.orm import joinedload
 from datetime import datetime
+from services.job_stats_service import JobStatsService
+from services.chat_stream_service import ChatStreamService
 
 class ChatService:
     
@@ -81,8 +84,67 @@ class ChatService:
         db.session.add(system_message)
         db.session.commit()
         
+        # 기업 회원 분석용 채팅 시작 통계
+        JobStatsService.record(job_id, 'chat_start_count')
+        
         return new_room
     
+    @staticmethod
+    def open_room_for_application(job_id, applicant_id, employer_id, system_message):
+        """
+        지원과 같은 트랜잭션 안에서 채팅방 생성 (커밋하지 않음)
+        
+        uq_chat_room 유니크 제약을 이용해 INSERT IGNORE 로 생성하고,
+        이미 있던 채팅방이면 다시 활성화만 합니다. 새로 만든 채팅방에만
+        시스템 메시지를 추가합니다.
+        
+        Args:
+            job_id: 공고 ID
+            applicant_id: 지원자 ID
+            employer_id: 고용주 ID
+            system_message: 채팅방 생성 알림 메시지
+            
+        Returns:
+            tuple: (채팅방 ID, 새로 생성되었는지 여부)
+        """
+        now = datetime.utcnow()
+        room_table = ChatRoom.__table__
+        
+        result = db.session.execute(
+            room_table.insert()
+                      .prefix_with("IGNORE", dialect="mysql")
+                      .prefix_with("OR IGNORE", dialect="sqlite")
+                      .values(job_id=job_id, applicant_id=applicant_id, employer_id=employer_id,
+                              is_active=True, applicant_left=False, employer_left=False,
+                              created_at=now, updated_at=now)
+        )
+        
+        if result.rowcount:
+            room_id = result.lastrowid
+            db.session.add(ChatMessage(
+                room_id=room_id,
+                sender_id=applicant_id,
+                message=system_message,
+                message_type='system'
+            ))
+            return room_id, True
+        
+        # 기존 채팅방: 비활성화되었거나 지원자가 나갔던 경우 복귀 처리
+        room_filter = and_(
+            room_table.c.job_id == job_id,
+            room_table.c.applicant_id == applicant_id,
+            room_table.c.employer_id == employer_id
+        )
+        db.session.execute(
+            room_table.update()
+                      .where(room_filter)
+                      .values(is_active=True, applicant_left=False, updated_at=now)
+        )
+        room_id = db.session.execute(
+            select(room_table.c.id).where(room_filter)
+        ).scalar()
+        return room_id, False
+    
     @staticmethod
     def send_message(room_id, sender_id, message, message_type='text'):
         """
@@ -115,6 +177,9 @@ class ChatService:
         
         db.session.commit()
         
+        # 이 워커의 실시간 스트림에 바로 전달
+        ChatStreamService.notify()
+        
         return new_message
     
     @staticmethod
@@ -174,21 +239,18 @@ class ChatService:
         return room_data
     
     @staticmethod
-    def get_chat_messages(room_id, user_id, page=1, per_page=50):
+    def get_participant_room(room_id, user_id):
         """
-        채팅방의 메시지 목록 조회
+        사용자가 참여한 채팅방 조회 (권한 확인, 없으면 404)
         
         Args:
             room_id: 채팅방 ID
-            user_id: 요청한 사용자 ID (권한 확인용)
-            page: 페이지 번호
-            per_page: 페이지당 메시지 수
+            user_id: 사용자 ID
             
         Returns:
-            list: 메시지 목록
+            ChatRoom: 채팅방 객체
         """
-        # 채팅방 접근 권한 확인
-        room = ChatRoom.query.filter(
+        return ChatRoom.query.filter(
             and_(
                 ChatRoom.id == room_id,
                 or_(
@@ -197,13 +259,45 @@ class ChatService:
                 )
             )
         ).first_or_404()
+    
+    @staticmethod
+    def get_chat_messages(room_id, user_id, after_id=None, before_id=None, limit=50):
+        """
+        채팅방의 메시지 목록 조회 (메시지 ID 커서, (room_id, id) 인덱스 범위 검색)
         
-        # 메시지 조회 (오래된 순)
-        messages = ChatMessage.query.filter_by(room_id=room_id)\
-                                  .order_by(ChatMessage.created_at)\
-                                  .paginate(page=page, per_page=per_page, error_out=False)
+        - after_id: after_id 보다 새 메시지를 오래된 것부터 limit 개 (새 메시지 받기)
+        - before_id: before_id 보다 오래된 메시지 중 최신 limit 개 (위로 스크롤)
+        - 둘 다 없으면 최신 limit 개 (채팅방 열기)
         
-        return messages
+        Args:
+            room_id: 채팅방 ID
+            user_id: 요청한 사용자 ID (권한 확인용)
+            after_id: 이 ID 이후 메시지
+            before_id: 이 ID 이전 메시지
+            limit: 최대 메시지 수
+            
+        Returns:
+            tuple: (메시지 목록 (오래된 순), has_more)
+            has_more: after_id 면 더 새 메시지, 그 외에는 더 오래된 메시지가 남았는지 여부
+        """
+        # 채팅방 접근 권한 확인
+        ChatService.get_participant_room(room_id, user_id)
+        
+        query = ChatMessage.query.options(joinedload(ChatMessage.sender))\
+                                 .filter(ChatMessage.room_id == room_id)
+        
+        # 한 개 더 조회해서 남은 메시지가 있는지 확인 (COUNT 없이)
+        if after_id is not None:
+            messages = query.filter(ChatMessage.id > after_id)\
+                            .order_by(ChatMessage.id)\
+                            .limit(limit + 1)\
+                            .all()
+            return messages[:limit], len(messages) > limit
+        
+        if before_id is not None:
+            query = query.filter(ChatMessage.id < before_id)
+        messages = query.order_by(desc(ChatMessage.id)).limit(limit + 1).all()
+        return list(reversed(messages[:limit])), len(messages) > limit
     
     @staticmethod
     def mark_messages_as_read(room_id, user_id):
@@ -215,11 +309,30 @@ class ChatService:
             user_id: 사용자 ID
         """
         # 해당 채팅방에서 다른 사용자가 보낸 읽지 않은 메시지들을 읽음으로 표시
-        ChatMessage.query.filter_by(room_id=room_id, is_read=False)\
-                        .filter(ChatMessage.sender_id != user_id)\
-                        .update({'is_read': True})
+        updated = ChatMessage.query.filter_by(room_id=room_id, is_read=False)\
+                                   .filter(ChatMessage.sender_id != user_id)\
+                                   .update({'is_read': True})
+        
+        # 상대방 화면의 읽음 표시용 위치 (채팅방 최근 활동 시간은 바꾸지 않음)
+        last_read_id = db.session.query(func.max(ChatMessage.id))\
+                                 .filter(ChatMessage.room_id == room_id, ChatMessage.sender_id != user_id)\
+                                 .scalar()
+        if last_read_id:
+            for user_column, read_column in (
+                (ChatRoom.applicant_id, ChatRoom.applicant_last_read_id),
+                (ChatRoom.employer_id, ChatRoom.employer_last_read_id)
+            ):
+                ChatRoom.query.filter(
+                    ChatRoom.id == room_id,
+                    user_column == user_id,
+                    or_(read_column.is_(None), read_column < last_read_id)
+                ).update({read_column: last_read_id, ChatRoom.updated_at: ChatRoom.updated_at},
+                         synchronize_session=False)
         
         db.session.commit()
+        
+        if updated:
+            ChatStreamService.notify()
     
     @staticmethod
     def get_unread_message_count(user_id):
@@ -0,0 +1,245 @@
+"""
+채팅 실시간 스트림 서비스 모듈
+============================
+
+채팅방 화면이 연 SSE(Server-Sent Events) 연결로 새 메시지와 읽음 표시를 보냅니다.
+
+처리 방식:
+- 워커 프로세스마다 백그라운드 스레드 하나가 구독 중인 채팅방만 모아 주기적으로 조회
+  (새 메시지: chat_message.id 범위, 읽음 표시: chat_room 읽은 마지막 메시지 ID)
+  연결마다 DB 를 조회하지 않으므로 열어 둔 채팅방 수와 관계없이 조회는 주기당 두 번
+- 같은 워커에서 메시지를 보내거나 읽으면 notify() 로 바로 조회 (다른 워커는 CHAT_STREAM_POLL_SECONDS 안에 반영)
+- 연결은 DB 커넥션을 잡고 있지 않고 구독 큐만 기다림 (gevent 워커로 유휴 연결을 많이 유지)
+- 자동 증가 ID 가 커밋 순서와 다를 수 있어 최근 몇 주기 구간은 다시 조회하고 이미 보낸 메시지는 건너뜀
+- 큐가 가득 찬(느린) 연결은 끊고, 브라우저가 Last-Event-ID 로 다시 연결하면 DB 에서 이어서 보냄
+"""
+
+import json
+import queue
+import threading
+from collections import deque
+from flask import current_app
+from sqlalchemy import func, select
+from models import db, ChatRoom, ChatMessage, User
+
+
+class Subscription:
+    """채팅방 스트림 연결 하나"""
+
+    def __init__(self, room_id, user_id, queue_size):
+        self.room_id = room_id
+        self.user_id = user_id
+        self.queue = queue.Queue(maxsize=queue_size)
+        self.overflowed = False  # 큐가 가득 참 (연결을 끊고 재연결 시 DB 에서 이어서 보냄)
+
+    def push(self, event):
+        """이벤트 전달 (큐가 가득 차면 이후 이벤트는 버리고 overflowed 표시)"""
+        try:
+            self.queue.put_nowait(event)
+        except queue.Full:
+            self.overflowed = True
+
+
+def format_event(event, data, event_id=None):
+    """SSE 이벤트 문자열"""
+    lines = []
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    lines.append(f"event: {event}")
+    lines.append(f"data: {json.dumps(data, ensure_ascii=False, separators=(',', ':'))}")
+    return '\n'.join(lines) + '\n\n'
+
+
+def message_data(row):
+    """메시지 조회 결과 → 클라이언트 메시지 형식 (/chat/<room_id>/messages 와 같음)"""
+    return {
+        'id': row.id,
+        'message': row.message,
+        'sender_id': row.sender_id,
+        'sender_name': row.sender_name,
+        'created_at': row.created_at.strftime('%Y-%m-%d %H:%M:%S'),
+        'message_type': row.message_type
+    }
+
+
+class ChatStreamService:
+
+    _lock = threading.Lock()
+    _subscribers = {}        # {채팅방 ID: set(Subscription)}
+    _wakeup = threading.Event()
+    _worker = None
+
+    _cursor = None           # 조회한 마지막 메시지 ID (구독자가 없으면 None)
+    _cursor_history = deque()  # 최근 주기들이 조회한 마지막 ID (가장 오래된 값부터 다시 조회)
+    _delivered = set()       # 다시 조회하는 구간에서 이미 보낸 메시지 ID
+    _read_marks = {}         # {채팅방 ID: (지원자 읽음 ID, 고용주 읽음 ID)}
+
+    @staticmethod
+    def subscribe(room_id, user_id):
+        """
+        채팅방 스트림 구독 (백그라운드 스레드가 없으면 시작)
+
+        구독 이후에 커밋된 메시지는 모두 큐로 전달됩니다. 그 전 메시지는 messages_after() 로 채웁니다.
+        """
+        config = current_app.config
+        subscription = Subscription(room_id, user_id, config.get('CHAT_STREAM_QUEUE_SIZE', 100))
+
+        with ChatStreamService._lock:
+            if ChatStreamService._cursor is None:
+                # 조회를 쉬고 있었으면 지금 시점부터 조회 (이전 메시지는 연결별로 DB 에서 채움)
+                ChatStreamService._cursor = db.session.execute(
+                    select(func.coalesce(func.max(ChatMessage.id), 0))
+                ).scalar()
+                ChatStreamService._cursor_history.clear()
+                ChatStreamService._delivered.clear()
+            ChatStreamService._subscribers.setdefault(room_id, set()).add(subscription)
+
+            worker = ChatStreamService._worker
+            if worker is None or not worker.is_alive():
+                app = current_app._get_current_object()
+                worker = threading.Thread(
+                    target=ChatStreamService._run_worker,
+                    args=(app,),
+                    name='chat-stream',
+                    daemon=True
+                )
+                ChatStreamService._worker = worker
+                worker.start()
+
+        ChatStreamService._wakeup.set()
+        return subscription
+
+    @staticmethod
+    def unsubscribe(subscription):
+        """구독 해제 (마지막 구독자면 조회 중지)"""
+        with ChatStreamService._lock:
+            subscribers = ChatStreamService._subscribers.get(subscription.room_id)
+            if subscribers is not None:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del ChatStreamService._subscribers[subscription.room_id]
+                    ChatStreamService._read_marks.pop(subscription.room_id, None)
+            if not ChatStreamService._subscribers:
+                ChatStreamService._cursor = None
+
+    @staticmethod
+    def notify():
+        """이 워커에서 메시지/읽음 상태가 바뀜 (다음 주기를 기다리지 않고 조회)"""
+        if ChatStreamService._subscribers:
+            ChatStreamService._wakeup.set()
+
+    @staticmethod
+    def messages_after(room_id, after_id, limit):
+        """
+        채팅방의 after_id 이후 메시지 (재연결 시 놓친 메시지 채우기)
+
+        Returns:
+            list: 메시지 조회 결과 (ID 순, 최대 limit 개)
+        """
+        return db.session.execute(
+            ChatStreamService._message_query()
+                             .where(ChatMessage.room_id == room_id, ChatMessage.id > after_id)
+                             .order_by(ChatMessage.id)
+                             .limit(limit)
+        ).all()
+
+    @staticmethod
+    def read_event(room, user_id):
+        """상대방이 읽은 마지막 메시지 이벤트 데이터 (읽은 적 없으면 None)"""
+        if room.applicant_id == user_id:
+            reader_id, last_read_id = room.employer_id, room.employer_last_read_id
+        else:
+            reader_id, last_read_id = room.applicant_id, room.applicant_last_read_id
+        if not last_read_id:
+            return None
+        return {'reader_id': reader_id, 'last_read_id': last_read_id}
+
+    @staticmethod
+    def _message_query():
+        return select(
+            ChatMessage.id, ChatMessage.room_id, ChatMessage.sender_id, ChatMessage.message,
+            ChatMessage.message_type, ChatMessage.created_at, User.nickname.label('sender_name')
+        ).join(User, User.id == ChatMessage.sender_id)
+
+    @staticmethod
+    def _run_worker(app):
+        """구독 중인 채팅방의 새 메시지/읽음 표시를 주기적으로 조회해 구독자에게 전달"""
+        with app.app_context():
+            interval = app.config.get('CHAT_STREAM_POLL_SECONDS', 1.0)
+            while True:
+                ChatStreamService._wakeup.wait(interval)
+                ChatStreamService._wakeup.clear()
+
+                with ChatStreamService._lock:
+                    room_ids = list(ChatStreamService._subscribers)
+                if not room_ids:
+                    continue
+
+                try:
+                    ChatStreamService._poll(room_ids)
+                except Exception as e:
+                    print(f"채팅 스트림 조회 오류: {e}")
+                finally:
+                    db.session.remove()
+
+    @staticmethod
+    def _poll(room_ids):
+        """한 주기 조회 (새 메시지 → 읽음 표시 순)"""
+        config = current_app.config
+        lookback = config.get('CHAT_STREAM_LOOKBACK_POLLS', 3)
+
+        cursor = ChatStreamService._cursor
+        if cursor is None:
+            return
+        history = ChatStreamService._cursor_history
+        start = history[0] if history else cursor
+
+        rows = db.session.execute(
+            ChatStreamService._message_query()
+                             .where(ChatMessage.id > start, ChatMessage.room_id.in_(room_ids))
+                             .order_by(ChatMessage.id)
+        ).all()
+
+        rooms = db.session.execute(
+            select(
+                ChatRoom.id, ChatRoom.applicant_id, ChatRoom.employer_id,
+                ChatRoom.applicant_last_read_id, ChatRoom.employer_last_read_id
+            ).where(ChatRoom.id.in_(room_ids))
+        ).all()
+
+        with ChatStreamService._lock:
+            if ChatStreamService._cursor != cursor:
+                return  # 조회하는 동안 구독자가 모두 나갔다가 다시 구독함 (새 시점부터 다시 조회)
+
+            delivered = ChatStreamService._delivered
+            for row in rows:
+                if row.id in delivered:
+                    continue
+                delivered.add(row.id)
+                event = ('message', message_data(row), row.id)
+                for subscription in ChatStreamService._subscribers.get(row.room_id, ()):
+                    subscription.push(event)
+
+            # 다시 조회할 구간 갱신 (구간보다 오래된 전달 기록은 버림)
+            history.append(max([cursor] + [row.id for row in rows]))
+            while len(history) > lookback:
+                history.popleft()
+            ChatStreamService._cursor = history[-1]
+            ChatStreamService._delivered = {i for i in delivered if i > history[0]}
+
+            read_marks = ChatStreamService._read_marks
+            for room in rooms:
+                marks = (room.applicant_last_read_id, room.employer_last_read_id)
+                previous = read_marks.get(room.id, (None, None))
+                read_marks[room.id] = marks
+                if previous == marks:
+                    continue
+
+                for subscription in ChatStreamService._subscribers.get(room.id, ()):
+                    # 상대방의 읽음 위치가 바뀌었을 때만 전달
+                    if subscription.user_id == room.applicant_id:
+                        reader_id, side = room.employer_id, 1
+                    else:
+                        reader_id, side = room.applicant_id, 0
+                    if marks[side] and marks[side] != previous[side]:
+                        subscription.push(('read', {'reader_id': reader_id, 'last_read_id': marks[side]}, None))
@@ -0,0 +1,219 @@
+"""
+통근 가능 지역 서비스 모듈
+========================
+
+사용자가 등록한 거주지(법정동 코드)에서 이력서의 통근 시간
+(commute_time) 또는 걸을 수 있는 시간(walkable_minutes) 안에 갈 수 있는 공고만 고릅니다.
+
+읍/면/동 사이 거리는 미리 계산한 행렬(법정동 코드 순)로 들고 있습니다.
+- data/commute_dong_codes.npy: 법정동 코드 (int64, 오름차순)
+- data/commute_distance.npy: 읍/면/동 중심 사이 직선거리 (uint16, 100m 단위, 좌표 없음은 DISTANCE_UNKNOWN)
+
+행렬은 `flask build-commute-matrix` 로 만들며, 조회 시에는 메모리 매핑으로 거주지 행 하나만 읽습니다.
+공고 필터링은 공고마다 거리를 계산하지 않고, 거주지 행을 한 번에 비교해 통근 가능한
+읍/면/동 코드 목록을 만든 뒤 공고 목록 쿼리의 region_code 조건으로 넘깁니다.
+"""
+
+import os
+import threading
+import numpy as np
+from flask import current_app
+from utils.region_data import DATA_DIR, get_region_data
+
+DONG_CODES_PATH = os.path.join(DATA_DIR, 'commute_dong_codes.npy')
+DISTANCE_PATH = os.path.join(DATA_DIR, 'commute_distance.npy')
+
+# 거리 행렬 단위 (km)
+DISTANCE_UNIT_KM = 0.1
+
+# 좌표를 찾지 못한 읍/면/동 사이 거리 (항상 통근 불가)
+DISTANCE_UNKNOWN = np.iinfo(np.uint16).max
+
+# 행렬 구축 시 한 번에 계산하는 행 수 (메모리 사용량 제한)
+BUILD_CHUNK_ROWS = 256
+
+EARTH_RADIUS_KM = 6371.0088
+
+
+def load_dongs():
+    """
+    법정동 데이터의 읍/면/동 목록 (시/도, 시/군/구, 리 단위 제외)
+
+    Returns:
+        list: [(법정동 코드, 전체 이름)] 코드 오름차순
+    """
+    # 법정동 코드: 시/도(2) + 시/군/구(3) + 읍/면/동(3) + 리(2)
+    return [
+        (code, ' '.join(name.split()))
+        for code, name in get_region_data().iter_dongs()
+        if code // 100 % 1000 != 0 and code % 100 == 0
+    ]
+
+
+class CommuteService:
+
+    _lock = threading.Lock()
+    _codes = None            # 법정동 코드 배열
+    _distance = None         # 거리 행렬 (메모리 매핑)
+    _loaded_mtime = None
+
+    @staticmethod
+    def reach_units(commute_minutes=None, walkable_minutes=None):
+        """
+        통근 시간/걸을 수 있는 시간 → 갈 수 있는 최대 직선거리 (행렬 단위)
+
+        대중교통 평균 속도(COMMUTE_SPEED_KMH)와 보행 속도(WALK_SPEED_KMH) 중 먼 쪽을 쓰고,
+        실제 이동 경로가 직선보다 긴 만큼(COMMUTE_DETOUR_FACTOR) 줄입니다.
+
+        Returns:
+            int: 최대 거리 (100m 단위), 둘 다 없으면 None
+        """
+        if not commute_minutes and not walkable_minutes:
+            return None
+
+        config = current_app.config
+        detour = config.get('COMMUTE_DETOUR_FACTOR', 1.3)
+        reach_km = max(
+            (commute_minutes or 0) * config.get('COMMUTE_SPEED_KMH', 15) / 60,
+            (walkable_minutes or 0) * config.get('WALK_SPEED_KMH', 3) / 60
+        ) / detour
+        return int(reach_km / DISTANCE_UNIT_KM)
+
+    @staticmethod
+    def _positions(region_codes):
+        """
+        법정동 코드 → 행렬 인덱스 (읍/면/동 단위 코드가 아니거나 없으면 -1)
+
+        Args:
+            region_codes: 10자리 법정동 코드 목록 (None 허용)
+        """
+        codes = CommuteService._codes
+        values = np.fromiter(
+            (int(code) if code else -1 for code in region_codes),
+            dtype=np.int64,
+            count=len(region_codes)
+        )
+        positions = np.searchsorted(codes, values)
+        clipped = np.minimum(positions, len(codes) - 1)
+        found = (positions < len(codes)) & (codes[clipped] == values)
+        return np.where(found, clipped, -1)
+
+    @staticmethod
+    def reachable_mask(home_code, reach):
+        """
+        거주지에서 reach 안에 있는 읍/면/동 (행렬 행 하나를 한 번에 비교)
+
+        Args:
+            home_code: 거주지 법정동 코드
+            reach: 최대 거리 (reach_units 결과)
+
+        Returns:
+            ndarray: 읍/면/동별 통근 가능 여부 (bool), 행렬이 없거나 거주지 읍/면/동을 모르면 None
+        """
+        if not home_code or not CommuteService._ensure_loaded():
+            return None
+
+        home_index = int(CommuteService._positions([home_code])[0])
+        if home_index < 0:
+            return None
+
+        return np.asarray(CommuteService._distance[home_index]) <= reach
+
+    @staticmethod
+    def reachable_codes(home_code, commute_minutes=None, walkable_minutes=None):
+        """
+        거주지에서 통근 가능한 읍/면/동 법정동 코드 (공고 목록 쿼리의 region_code IN 조건용)
+
+        법정동 코드가 없거나 시/군/구까지만 아는 공고는 조건에 걸리지 않아 제외됩니다.
+
+        Args:
+            home_code: 거주지 법정동 코드 (User.region_code)
+            commute_minutes: 통근 가능 시간 (분)
+            walkable_minutes: 걸을 수 있는 시간 (분)
+
+        Returns:
+            list: 10자리 법정동 코드 목록, 계산할 수 없으면(시간 미입력, 행렬 없음, 거주지 미등록) None
+        """
+        reach = CommuteService.reach_units(commute_minutes, walkable_minutes)
+        if reach is None:
+            return None
+
+        mask = CommuteService.reachable_mask(home_code, reach)
+        if mask is None:
+            return None
+
+        return [str(code) for code in CommuteService._codes[mask].tolist()]
+
+    @staticmethod
+    def _ensure_loaded():
+        """거리 행렬 로드 (파일이 다시 만들어졌으면 새로 로드)"""
+        try:
+            mtime = os.path.getmtime(DISTANCE_PATH)
+        except OSError:
+            return False
+
+        if CommuteService._loaded_mtime == mtime:
+            return True
+
+        with CommuteService._lock:
+            if CommuteService._loaded_mtime == mtime:
+                return True
+
+            codes = np.load(DONG_CODES_PATH)
+            distance = np.load(DISTANCE_PATH, mmap_mode='r')
+            if len(codes) == 0 or distance.shape != (len(codes), len(codes)):
+                print(f"통근 거리 행렬 크기 불일치: {distance.shape}, 코드 {len(codes)}개")
+                return False
+
+            CommuteService._codes = codes
+            CommuteService._distance = distance
+            CommuteService._loaded_mtime = mtime
+        return True
+
+    @staticmethod
+    def build_matrix(progress=None):
+        """
+        읍/면/동 중심 좌표를 주소 검색으로 구하고 거리 행렬 저장
+
+        주소 검색은 GeocodeService 캐시와 속도 제한(GEOCODE_RATE_PER_SECOND)을 거칩니다.
+
+        Args:
+            progress: 진행 상황 콜백 (처리한 수, 전체 수)
+
+        Returns:
+            tuple: (읍/면/동 수, 좌표를 찾지 못한 수)
+        """
+        from services.geocode_service import GeocodeService
+
+        dongs = load_dongs()
+        count = len(dongs)
+        coords = np.full((count, 2), np.nan)
+        for i, (code, name) in enumerate(dongs):
+            result = GeocodeService.geocode(name, throttle=True)
+            if result:
+                coords[i] = (result['latitude'], result['longitude'])
+            if progress and (i + 1) % 500 == 0:
+                progress(i + 1, count)
+
+        lat = np.radians(coords[:, 0])
+        lng = np.radians(coords[:, 1])
+        distance = np.empty((count, count), dtype=np.uint16)
+        for start in range(0, count, BUILD_CHUNK_ROWS):
+            end = min(start + BUILD_CHUNK_ROWS, count)
+            a = np.sin((lat[None, :] - lat[start:end, None]) / 2) ** 2 \
+                + np.cos(lat[start:end, None]) * np.cos(lat[None, :]) \
+                * np.sin((lng[None, :] - lng[start:end, None]) / 2) ** 2
+            km = 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+            units = np.ceil(km / DISTANCE_UNIT_KM)
+            units[np.isnan(units)] = DISTANCE_UNKNOWN
+            distance[start:end] = np.minimum(units, DISTANCE_UNKNOWN)
+
+        # 조회 중인 프로세스가 반쯤 쓴 파일을 읽지 않도록 임시 파일에 쓴 뒤 교체
+        codes = np.fromiter((code for code, _ in dongs), dtype=np.int64, count=count)
+        for path, array in ((DONG_CODES_PATH, codes), (DISTANCE_PATH, distance)):
+            tmp_path = path + '.tmp'
+            with open(tmp_path, 'wb') as f:
+                np.save(f, array)
+            os.replace(tmp_path, path)
+
+        return count, int(np.isnan(coords[:, 0]).sum())
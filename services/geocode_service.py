@@ -0,0 +1,234 @@
+"""
+주소 검색(지오코딩) 서비스 모듈
+=============================
+
+카카오 로컬 API 주소 검색을 캐시와 연결 풀을 거쳐 호출합니다.
+
+캐시 구조 (검색어는 정규화한 값 기준):
+- 1차: 프로세스 메모리 LRU (GEOCODE_LRU_SIZE 개)
+- 2차: geocode_cache 테이블 (GEOCODE_CACHE_TTL_DAYS 일 유지, 워커/재시작 간 공유)
+
+카카오 API 는 requests.Session 하나로 연결을 재사용하며 모든 요청에 타임아웃을 적용합니다.
+API 주소(KAKAO_LOCAL_API_URL)는 설정으로 바꿀 수 있어 로컬 가짜 서버로 대체할 수 있습니다.
+"""
+
+import hashlib
+import json
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from datetime import datetime, timedelta
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from flask import current_app
+from models import db, GeocodeCache
+from utils.upsert import upsert
+
+
+def normalize_query(query):
+    """
+    캐시 키용 검색어 정규화
+
+    유니코드 NFC 정규화, 앞뒤 공백 제거, 연속 공백을 하나로 합침
+    ('서울  강남구 ' → '서울 강남구')
+    """
+    if not query:
+        return ''
+    return ' '.join(unicodedata.normalize('NFC', query).split())
+
+
+def _query_hash(normalized):
+    """geocode_cache 기본 키 (정규화된 검색어의 SHA-1)"""
+    return hashlib.sha1(normalized.encode('utf-8')).hexdigest()
+
+
+def first_address(result):
+    """
+    주소 검색 응답의 첫 번째 결과 → 좌표/행정구역
+
+    Returns:
+        dict: {'latitude', 'longitude', 'address_name',
+               'region_1depth_name', 'region_2depth_name', 'region_3depth_name'}
+              결과가 없으면 None
+    """
+    if not result or not result.get('documents'):
+        return None
+
+    document = result['documents'][0]
+    region = document.get('address') or document.get('road_address') or {}
+    try:
+        return {
+            'latitude': float(document['y']),
+            'longitude': float(document['x']),
+            'address_name': document.get('address_name'),
+            'region_1depth_name': region.get('region_1depth_name'),
+            'region_2depth_name': region.get('region_2depth_name'),
+            'region_3depth_name': region.get('region_3depth_name')
+        }
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+class GeocodeService:
+
+    _lock = threading.Lock()
+    _lru = OrderedDict()     # {정규화된 검색어: (만료 시각, 응답)}
+    _session = None
+    _throttle_lock = threading.Lock()
+    _last_throttled_request = 0.0
+
+    @staticmethod
+    def search_address(query, throttle=False):
+        """
+        주소 검색 (카카오 로컬 API /v2/local/search/address.json 응답)
+
+        Args:
+            query: 검색할 주소
+            throttle: 캐시에 없어 API 를 호출할 때 GEOCODE_RATE_PER_SECOND 속도 제한 적용 (일괄 처리용)
+
+        Returns:
+            dict: 카카오 API 응답 (documents, meta) 또는 요청 실패 시 None
+        """
+        normalized = normalize_query(query)
+        if not normalized:
+            return None
+
+        now = datetime.utcnow()
+
+        # 1차: 메모리 LRU
+        with GeocodeService._lock:
+            entry = GeocodeService._lru.get(normalized)
+            if entry and entry[0] > now:
+                GeocodeService._lru.move_to_end(normalized)
+                return entry[1]
+
+        # 2차: DB 캐시
+        cached = db.session.get(GeocodeCache, _query_hash(normalized))
+        if cached and cached.expires_at > now:
+            result = json.loads(cached.response)
+            GeocodeService._remember(normalized, cached.expires_at, result)
+            return result
+
+        if throttle:
+            GeocodeService._wait_for_rate_limit()
+
+        result = GeocodeService._request_kakao(normalized)
+        if result is None:
+            return None
+
+        expires_at = now + timedelta(days=current_app.config.get('GEOCODE_CACHE_TTL_DAYS', 30))
+        GeocodeService._store(normalized, expires_at, result)
+        GeocodeService._remember(normalized, expires_at, result)
+        return result
+
+    @staticmethod
+    def geocode(query, throttle=False):
+        """
+        주소 → 좌표/행정구역 (검색 결과 첫 번째 주소)
+
+        Args:
+            query: 주소
+            throttle: API 호출 속도 제한 적용 여부 (search_address 참고)
+
+        Returns:
+            dict: first_address() 결과 (결과가 없거나 요청 실패 시 None)
+        """
+        return first_address(GeocodeService.search_address(query, throttle=throttle))
+
+    @staticmethod
+    def _remember(normalized, expires_at, result):
+        """메모리 LRU 에 저장 (가장 오래 안 쓴 항목부터 제거)"""
+        with GeocodeService._lock:
+            GeocodeService._lru[normalized] = (expires_at, result)
+            GeocodeService._lru.move_to_end(normalized)
+            while len(GeocodeService._lru) > current_app.config.get('GEOCODE_LRU_SIZE', 1024):
+                GeocodeService._lru.popitem(last=False)
+
+    @staticmethod
+    def _store(normalized, expires_at, result):
+        """DB 캐시에 저장 (요청 트랜잭션과 분리된 별도 트랜잭션)"""
+        row = {
+            'query_hash': _query_hash(normalized),
+            'query': normalized[:255],
+            'response': json.dumps(result, ensure_ascii=False),
+            'expires_at': expires_at
+        }
+        stmt = upsert(GeocodeCache.__table__, db.engine.dialect.name, lambda new: {
+            'response': new.response,
+            'expires_at': new.expires_at
+        }).values(**row)
+        try:
+            with db.engine.begin() as connection:
+                connection.execute(stmt)
+        except Exception as e:
+            print(f"주소 검색 캐시 저장 오류: {e}")
+
+    @staticmethod
+    def _wait_for_rate_limit():
+        """직전 속도 제한 호출로부터 1 / GEOCODE_RATE_PER_SECOND 초가 지날 때까지 대기"""
+        min_interval = 1.0 / max(current_app.config.get('GEOCODE_RATE_PER_SECOND', 5), 1)
+        with GeocodeService._throttle_lock:
+            wait = GeocodeService._last_throttled_request + min_interval - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)
+            GeocodeService._last_throttled_request = time.monotonic()
+
+    @staticmethod
+    def _get_session():
+        """카카오 API 용 공유 세션 (연결 풀 + 일시적 오류 재시도)"""
+        if GeocodeService._session is None:
+            with GeocodeService._lock:
+                if GeocodeService._session is None:
+                    pool_size = current_app.config.get('GEOCODE_POOL_SIZE', 10)
+                    adapter = HTTPAdapter(
+                        pool_connections=pool_size,
+                        pool_maxsize=pool_size,
+                        max_retries=Retry(total=2, backoff_factor=0.2,
+                                          status_forcelist=(502, 503, 504),
+                                          allowed_methods=('GET',))
+                    )
+                    session = requests.Session()
+                    session.mount('https://', adapter)
+                    session.mount('http://', adapter)
+                    GeocodeService._session = session
+        return GeocodeService._session
+
+    @staticmethod
+    def _request_kakao(normalized):
+        """카카오 주소 검색 API 호출 (실패 시 None)"""
+        config = current_app.config
+        api_key = config.get('KAKAO_REST_API_KEY')
+        if not api_key:
+            return None
+
+        url = config.get('KAKAO_LOCAL_API_URL', 'https://dapi.kakao.com').rstrip('/') \
+            + '/v2/local/search/address.json'
+        timeout = (config.get('GEOCODE_CONNECT_TIMEOUT', 2), config.get('GEOCODE_READ_TIMEOUT', 5))
+
+        try:
+            response = GeocodeService._get_session().get(
+                url,
+                headers={'Authorization': f'KakaoAK {api_key}'},
+                params={'query': normalized},
+                timeout=timeout
+            )
+            response.raise_for_status()
+            return response.json()
+        except (requests.exceptions.RequestException, ValueError) as e:
+            print(f"카카오 주소 검색 API 요청 오류: {e}")
+            return None
+
+    @staticmethod
+    def prune_expired():
+        """
+        만료된 DB 캐시 삭제
+
+        Returns:
+            int: 삭제된 행 수
+        """
+        deleted = GeocodeCache.query.filter(GeocodeCache.expires_at <= datetime.utcnow())\
+                                    .delete(synchronize_session=False)
+        db.session.commit()
+        return deleted
@@ -0,0 +1,172 @@
+"""
+공고 위치 인덱스 모듈
+===================
+
+"내 주변 일자리" 반경 검색용 인메모리 공간 인덱스입니다.
+
+공고 좌표를 위도 순으로 정렬한 NumPy 배열로 들고 있다가,
+검색 시 위도 구간을 이진 탐색으로 잘라낸 뒤 그 구간에만 벡터화된 하버사인 거리를 계산합니다.
+
+갱신 방식:
+- 처음 조회 시 전체 구축
+- NEARBY_INDEX_REFRESH_SECONDS 마다 updated_at 인덱스로 새로 등록/수정된 공고만 가져와 병합
+- 삭제된 공고가 있으면(좌표 있는 공고 수가 다르면) 전체 재구축
+- NEARBY_INDEX_FULL_REBUILD_SECONDS 마다 전체 재구축
+"""
+
+import threading
+import time
+from datetime import datetime, timedelta
+import numpy as np
+from flask import current_app
+from sqlalchemy import func
+from models import db, JobPost
+
+# 지구 반지름 (km)
+EARTH_RADIUS_KM = 6371.0088
+
+# 위도 1도의 거리 (km)
+KM_PER_LAT_DEGREE = EARTH_RADIUS_KM * np.pi / 180
+
+# 증분 갱신 시 updated_at 기준 시각을 이만큼 앞당겨 늦게 커밋된 공고도 놓치지 않도록 함
+DELTA_SLACK = timedelta(seconds=60)
+
+
+class JobGeoIndex:
+
+    _lock = threading.Lock()
+    _positions = {}          # {공고 ID: (위도, 경도)}
+    _arrays = None           # (ids, 위도, 경도 라디안, 위도 라디안) 위도 오름차순
+    _watermark = None        # 마지막으로 반영한 updated_at
+    _last_refresh = 0.0
+    _last_full_build = 0.0
+
+    @staticmethod
+    def search(lat, lng, radius_km, limit=None):
+        """
+        반경 안의 공고를 거리순으로 조회
+
+        Args:
+            lat, lng: 기준 위치 (위도, 경도)
+            radius_km: 검색 반경 (km)
+            limit: 최대 개수 (없으면 전부)
+
+        Returns:
+            tuple: (공고 ID 배열, 거리(km) 배열) 가까운 순
+        """
+        JobGeoIndex._ensure_fresh()
+
+        arrays = JobGeoIndex._arrays
+        if arrays is None or len(arrays[0]) == 0:
+            return np.empty(0, dtype=np.int64), np.empty(0)
+
+        ids, lat_sorted, lng_rad, lat_rad = arrays
+
+        # 위도 구간으로 후보를 먼저 잘라냄 (정렬된 배열 이진 탐색)
+        band = radius_km / KM_PER_LAT_DEGREE
+        start = np.searchsorted(lat_sorted, lat - band, side='left')
+        end = np.searchsorted(lat_sorted, lat + band, side='right')
+        if start >= end:
+            return np.empty(0, dtype=np.int64), np.empty(0)
+
+        origin_lat = np.radians(lat)
+        origin_lng = np.radians(lng)
+        cand_lat = lat_rad[start:end]
+        cand_lng = lng_rad[start:end]
+
+        # 하버사인 거리 (후보 구간 전체를 한 번에 계산)
+        a = np.sin((cand_lat - origin_lat) / 2) ** 2 \
+            + np.cos(origin_lat) * np.cos(cand_lat) * np.sin((cand_lng - origin_lng) / 2) ** 2
+        distances = 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+
+        inside = np.nonzero(distances <= radius_km)[0]
+        if limit is not None and len(inside) > limit:
+            # 상위 limit 개만 부분 정렬
+            nearest = np.argpartition(distances[inside], limit - 1)[:limit]
+            inside = inside[nearest]
+        order = inside[np.argsort(distances[inside], kind='stable')]
+
+        return ids[start:end][order], distances[order]
+
+    @staticmethod
+    def _ensure_fresh():
+        """갱신 주기가 지났으면 증분 갱신 또는 전체 재구축"""
+        config = current_app.config
+        now = time.monotonic()
+
+        if JobGeoIndex._arrays is not None \
+                and now - JobGeoIndex._last_refresh < config.get('NEARBY_INDEX_REFRESH_SECONDS', 10):
+            return
+
+        with JobGeoIndex._lock:
+            # 다른 스레드가 먼저 갱신했으면 건너뜀
+            if JobGeoIndex._arrays is not None \
+                    and now - JobGeoIndex._last_refresh < config.get('NEARBY_INDEX_REFRESH_SECONDS', 10):
+                return
+
+            if JobGeoIndex._arrays is None \
+                    or now - JobGeoIndex._last_full_build >= config.get('NEARBY_INDEX_FULL_REBUILD_SECONDS', 600):
+                JobGeoIndex._rebuild()
+            else:
+                JobGeoIndex._refresh()
+
+    @staticmethod
+    def _rebuild():
+        """좌표가 있는 모든 공고로 인덱스 전체 구축"""
+        rows = db.session.query(JobPost.id, JobPost.latitude, JobPost.longitude, JobPost.updated_at)\
+                         .filter(JobPost.latitude.isnot(None), JobPost.longitude.isnot(None))\
+                         .all()
+
+        JobGeoIndex._positions = {row.id: (row.latitude, row.longitude) for row in rows}
+        JobGeoIndex._watermark = max((row.updated_at for row in rows if row.updated_at), default=None)
+        JobGeoIndex._build_arrays()
+        JobGeoIndex._last_full_build = JobGeoIndex._last_refresh = time.monotonic()
+
+    @staticmethod
+    def _refresh():
+        """마지막 갱신 이후 등록/수정된 공고만 병합하고, 삭제가 있으면 전체 재구축"""
+        watermark = JobGeoIndex._watermark or datetime.min + DELTA_SLACK
+        rows = db.session.query(JobPost.id, JobPost.latitude, JobPost.longitude, JobPost.updated_at)\
+                         .filter(JobPost.updated_at >= watermark - DELTA_SLACK)\
+                         .all()
+
+        positions = JobGeoIndex._positions
+        changed = False
+        for row in rows:
+            if row.latitude is None or row.longitude is None:
+                changed = positions.pop(row.id, None) is not None or changed
+            elif positions.get(row.id) != (row.latitude, row.longitude):
+                positions[row.id] = (row.latitude, row.longitude)
+                changed = True
+            if row.updated_at and (JobGeoIndex._watermark is None or row.updated_at > JobGeoIndex._watermark):
+                JobGeoIndex._watermark = row.updated_at
+
+        # updated_at 으로는 삭제를 알 수 없으므로 개수로 확인
+        total = db.session.query(func.count(JobPost.id))\
+                          .filter(JobPost.latitude.isnot(None), JobPost.longitude.isnot(None))\
+                          .scalar()
+        if total != len(positions):
+            JobGeoIndex._rebuild()
+            return
+
+        if changed:
+            JobGeoIndex._build_arrays()
+        JobGeoIndex._last_refresh = time.monotonic()
+
+    @staticmethod
+    def _build_arrays():
+        """좌표 사전을 위도 순으로 정렬된 배열로 변환 (검색 중인 스레드를 위해 통째로 교체)"""
+        positions = JobGeoIndex._positions
+        count = len(positions)
+
+        ids = np.fromiter(positions.keys(), dtype=np.int64, count=count)
+        coords = np.array(list(positions.values()), dtype=np.float64).reshape(count, 2)
+
+        order = np.argsort(coords[:, 0], kind='stable')
+        lat_sorted = coords[order, 0]
+        JobGeoIndex._arrays = (
+            ids[order],
+            lat_sorted,
+            np.radians(coords[order, 1]),
+            np.radians(lat_sorted)
+        )
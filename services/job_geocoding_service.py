@@ -0,0 +1,212 @@
+"""
+공고 좌표 채우기(지오코딩) 서비스 모듈
+====================================
+
+좌표가 없는 공고(기업 공고 등록 화면은 주소만 입력받음)의 근무지 주소를
+GeocodeService 로 좌표/행정구역으로 바꿔 채웁니다.
+
+처리 방식:
+- 공고 등록 직후 enqueue() 로 큐에 넣으면 프로세스별 백그라운드 스레드가 모아서 처리
+- 찾은 좌표/행정구역/법정동 코드는 배치마다 executemany UPDATE 한 번으로 반영하고,
+  지도 클러스터/마커 변경 기록/지역별 공고 수도 같은 트랜잭션에서 갱신
+- 카카오 API 호출은 GEOCODE_RATE_PER_SECOND 로 속도 제한 (캐시에 있는 주소는 제한 없이 바로 처리)
+- 주소를 찾지 못한 공고는 geocode_failed_at 을 기록해 반복 시도하지 않음 (API 요청 실패는 다음에 다시 시도)
+- 전체 백필은 `flask geocode-jobs` 명령으로 실행
+"""
+
+import queue
+import threading
+from datetime import datetime
+from flask import current_app
+from sqlalchemy import bindparam, func
+from models import db, JobPost
+from services.geocode_service import GeocodeService, first_address
+from services.map_service import MapService
+from services.region_service import RegionService
+
+
+class JobGeocodingService:
+
+    _queue = queue.Queue()
+    _worker = None
+    _worker_lock = threading.Lock()
+
+    @staticmethod
+    def enqueue(job_id):
+        """
+        공고를 좌표 채우기 큐에 추가 (백그라운드 스레드가 없으면 시작)
+
+        공고가 커밋된 뒤에 호출해야 합니다.
+        """
+        JobGeocodingService._queue.put(job_id)
+
+        with JobGeocodingService._worker_lock:
+            worker = JobGeocodingService._worker
+            if worker is None or not worker.is_alive():
+                app = current_app._get_current_object()
+                worker = threading.Thread(
+                    target=JobGeocodingService._run_worker,
+                    args=(app,),
+                    name='job-geocoding',
+                    daemon=True
+                )
+                JobGeocodingService._worker = worker
+                worker.start()
+
+    @staticmethod
+    def _run_worker(app):
+        """큐에서 공고 ID 를 배치 크기만큼 모아 처리 (큐가 비면 대기)"""
+        while True:
+            job_ids = [JobGeocodingService._queue.get()]
+
+            with app.app_context():
+                batch_size = current_app.config.get('GEOCODE_BATCH_SIZE', 50)
+                while len(job_ids) < batch_size:
+                    try:
+                        job_ids.append(JobGeocodingService._queue.get_nowait())
+                    except queue.Empty:
+                        break
+
+                try:
+                    JobGeocodingService.geocode_jobs(job_ids)
+                except Exception as e:
+                    db.session.rollback()
+                    print(f"공고 좌표 채우기 오류: {e}")
+
+    @staticmethod
+    def pending_query(include_failed=False):
+        """좌표가 없고 주소가 있는 공고 (좌표 채우기 대상)"""
+        query = JobPost.query.filter(
+            (JobPost.latitude.is_(None)) | (JobPost.longitude.is_(None)),
+            JobPost.region.isnot(None),
+            JobPost.region != ''
+        )
+        if not include_failed:
+            query = query.filter(JobPost.geocode_failed_at.is_(None))
+        return query
+
+    @staticmethod
+    def geocode_jobs(job_ids):
+        """
+        공고 한 배치의 좌표/행정구역 채우기
+
+        Args:
+            job_ids: 공고 ID 목록
+
+        Returns:
+            tuple: (좌표를 채운 공고 수, 주소를 찾지 못한 공고 수)
+        """
+        jobs = JobGeocodingService.pending_query(include_failed=True)\
+                                  .with_entities(
+                                      JobPost.id, JobPost.region,
+                                      JobPost.region_1depth_name, JobPost.region_2depth_name,
+                                      JobPost.region_3depth_name, JobPost.recruitment_end_date
+                                  )\
+                                  .filter(JobPost.id.in_(job_ids))\
+                                  .all()
+        if not jobs:
+            return 0, 0
+
+        params = []
+        failed_ids = []
+        for job in jobs:
+            response = GeocodeService.search_address(job.region, throttle=True)
+            if response is None:
+                continue  # API 요청 실패는 다음에 다시 시도
+            result = first_address(response)
+            if not result:
+                failed_ids.append(job.id)
+                continue
+
+            # 행정구역은 비어 있을 때만 채움 (작성자가 지정한 값 유지)
+            values = {
+                'latitude': result['latitude'],
+                'longitude': result['longitude'],
+                'region_1depth_name': job.region_1depth_name or result['region_1depth_name'],
+                'region_2depth_name': job.region_2depth_name or result['region_2depth_name'],
+                'region_3depth_name': job.region_3depth_name or result['region_3depth_name']
+            }
+            values['region_code'] = RegionService.resolve_code(
+                values['region_1depth_name'], values['region_2depth_name'], values['region_3depth_name'],
+                address=result['address_name'] or job.region
+            )
+            params.append(dict({'b_job_id': job.id}, **{f'b_{key}': value for key, value in values.items()}))
+
+            # 지도 클러스터/마커 변경 기록, 지역별 공고 수도 같은 트랜잭션에서 갱신
+            MapService.record_position_change(job.id, new_position=(values['latitude'], values['longitude']))
+            RegionService.record_change(
+                RegionService.snapshot_values(
+                    job.region_1depth_name, job.region_2depth_name, job.region_3depth_name,
+                    job.recruitment_end_date, None, None
+                ),
+                RegionService.snapshot_values(
+                    values['region_1depth_name'], values['region_2depth_name'], values['region_3depth_name'],
+                    job.recruitment_end_date, values['latitude'], values['longitude']
+                )
+            )
+
+        if params:
+            table = JobPost.__table__
+            db.session.execute(
+                table.update()
+                     .where(table.c.id == bindparam('b_job_id'))
+                     .values(
+                         latitude=bindparam('b_latitude'),
+                         longitude=bindparam('b_longitude'),
+                         region_1depth_name=bindparam('b_region_1depth_name'),
+                         region_2depth_name=bindparam('b_region_2depth_name'),
+                         region_3depth_name=bindparam('b_region_3depth_name'),
+                         region_code=bindparam('b_region_code'),
+                         geocode_failed_at=None,
+                         updated_at=datetime.utcnow()  # 근처 공고 인덱스(JobGeoIndex) 증분 갱신 대상
+                     ),
+                params
+            )
+
+        if failed_ids:
+            JobPost.query.filter(JobPost.id.in_(failed_ids))\
+                         .update({JobPost.geocode_failed_at: datetime.utcnow()}, synchronize_session=False)
+
+        db.session.commit()
+        return len(params), len(failed_ids)
+
+    @staticmethod
+    def backfill(batch_size=50, include_failed=False, limit=None):
+        """
+        좌표가 없는 모든 공고 채우기 (배치 단위로 커밋)
+
+        Args:
+            batch_size: 배치 크기
+            include_failed: 이전에 주소를 찾지 못한 공고도 다시 시도
+            limit: 최대 처리 공고 수
+
+        Returns:
+            tuple: (좌표를 채운 공고 수, 주소를 찾지 못한 공고 수)
+        """
+        resolved_total = failed_total = 0
+        last_id = 0
+        while limit is None or resolved_total + failed_total < limit:
+            size = batch_size if limit is None else min(batch_size, limit - resolved_total - failed_total)
+            job_ids = [
+                row.id for row in JobGeocodingService.pending_query(include_failed)
+                                                     .with_entities(JobPost.id)
+                                                     .filter(JobPost.id > last_id)
+                                                     .order_by(JobPost.id)
+                                                     .limit(size)
+            ]
+            if not job_ids:
+                break
+
+            resolved, failed = JobGeocodingService.geocode_jobs(job_ids)
+            resolved_total += resolved
+            failed_total += failed
+            last_id = job_ids[-1]
+
+        return resolved_total, failed_total
+
+    @staticmethod
+    def count_pending():
+        """좌표 채우기 대상 공고 수"""
+        return JobGeocodingService.pending_query()\
+                                  .with_entities(func.count(JobPost.id))\
+                                  .scalar()
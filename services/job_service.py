@@ -1,21 +1,33 @@
-from models import db, JobPost, JobBookmark, User
-from sqlalchemy import desc
+from models import db, JobPost, JobBookmark, JobApplication, User
+from sqlalchemy import desc, case, false, func, or_, select, update
+from sqlalchemy.orm import contains_eager, joinedload
+from flask import current_app
 from flask_login import current_user
+from datetime import datetime
+from services.view_counter_service import ViewCounterService
+from services.job_stats_service import JobStatsService
+from services.map_service import MapService
+from services.job_geo_index import JobGeoIndex
+from services.region_service import RegionService
 
 class JobService:
     @staticmethod
-    def get_all_jobs(page=1, per_page=10, sort_by='latest'):
+    def get_all_jobs(page=1, per_page=10, sort_by='latest', filters=None):
         """
         모든 공고 조회 (페이지네이션 및 정렬)
         
         Args:
             page: 페이지 번호
             per_page: 페이지당 항목 수
-            sort_by: 정렬 기준 ('latest', 'popular', 'views')
+            sort_by: 정렬 기준 ('latest', 'popular', 'views', 'trending')
+            filters: 필터 조건 (search_jobs 와 같은 형식, 선택)
         """
-        query = JobPost.query
+        query = JobService._apply_search_filters(JobPost.query, filters=filters)
         
-        if sort_by == 'latest':
+        if sort_by == 'trending':
+            # 급상승순 (최근 24시간 조회/찜/지원 기준 상위 공고만)
+            query = JobService._order_by_trending(query)
+        elif sort_by == 'latest':
             # 최신순 (기본값)
             query = query.order_by(desc(JobPost.created_at))
         elif sort_by == 'popular':
@@ -36,16 +48,65 @@ class JobService:
         
         return query.paginate(page=page, per_page=per_page, error_out=False)
     
+    @staticmethod
+    def _order_by_trending(query, window='24h'):
+        """급상승 상위 공고로 제한하고 급상승 순위대로 정렬"""
+        job_ids = JobStatsService.get_trending_job_ids(window)
+        if not job_ids:
+            return query.filter(false())
+
+        ranks = {job_id: rank for rank, job_id in enumerate(job_ids)}
+        return query.filter(JobPost.id.in_(job_ids))\
+                    .order_by(case(ranks, value=JobPost.id))
+
+    @staticmethod
+    def get_trending_jobs(window='24h', limit=10):
+        """
+        급상승 공고 조회 (캐시된 상위 공고 목록 기준)
+
+        Args:
+            window: 집계 구간 ('24h', '7d')
+            limit: 최대 공고 수
+
+        Returns:
+            list: 공고 목록 (급상승 순위순, 작성자 정보 함께 로딩됨)
+        """
+        query = JobPost.query.options(joinedload(JobPost.author))
+        return JobService._order_by_trending(query, window).limit(limit).all()
+
     @staticmethod
     def get_job_by_id(job_id):
         """ID로 공고 조회"""
         return JobPost.query.get_or_404(job_id)
+
+    @staticmethod
+    def get_job_summary(job_id):
+        """
+        상세 페이지 동적 영역용 공고 요약 조회
+
+        본문 등 큰 컬럼은 제외하고 제목, 작성자, 통계, 수정일만 조회합니다.
+        """
+        return db.session.query(
+            JobPost.id,
+            JobPost.title,
+            JobPost.author_id,
+            JobPost.view_count,
+            JobPost.bookmark_count,
+            JobPost.application_count,
+            JobPost.updated_at
+        ).filter(JobPost.id == job_id).first_or_404()
     
     @staticmethod
     def create_job(job_data):
         """새 공고 생성"""
         job = JobPost(**job_data)
+        job.region_code = RegionService.resolve_code(
+            job.region_1depth_name, job.region_2depth_name, job.region_3depth_name, address=job.region
+        )
         db.session.add(job)
+        db.session.flush()  # 변경 기록에 쓸 공고 ID 확보
+        MapService.record_position_change(job.id, new_position=(job.latitude, job.longitude))
+        RegionService.record_change(new_snapshot=RegionService.snapshot(job))
         db.session.commit()
         return job
     
@@ -53,8 +114,16 @@ class JobService:
     def update_job(job_id, job_data):
         """공고 수정"""
         job = JobPost.query.get_or_404(job_id)
+        old_position = (job.latitude, job.longitude)
+        old_region = RegionService.snapshot(job)
         for key, value in job_data.items():
             setattr(job, key, value)
+        job.region_code = RegionService.resolve_code(
+            job.region_1depth_name, job.region_2depth_name, job.region_3depth_name, address=job.region
+        )
+        MapService.record_position_change(job.id, old_position, (job.latitude, job.longitude))
+        RegionService.record_change(old_region, RegionService.snapshot(job))
+        job.updated_at = datetime.utcnow()
         db.session.commit()
         return job
     
@@ -62,48 +131,149 @@ class JobService:
     def delete_job(job_id):
         """공고 삭제"""
         job = JobPost.query.get_or_404(job_id)
+        MapService.record_position_change(job.id, old_position=(job.latitude, job.longitude))
+        RegionService.record_change(old_snapshot=RegionService.snapshot(job))
         db.session.delete(job)
         db.session.commit()
         return True
     
     @staticmethod
-    def increment_view_count(job_id):
-        """조회수 증가"""
-        job = JobPost.query.get(job_id)
-        if job:
-            job.view_count += 1
-            db.session.commit()
+    def increment_view_count(job_id, user_id=None):
+        """
+        조회수 증가
+
+        같은 사용자의 반복 조회는 일정 시간 동안 한 번만 집계하며,
+        증가분은 ViewCounterService 버퍼에 모았다가 일괄 반영됩니다.
+        """
+        return ViewCounterService.record_view(job_id, user_id)
     
     @staticmethod
-    def get_user_bookmarks(user_id):
-        """사용자의 찜 목록 조회"""
-        bookmarks = JobBookmark.query.filter_by(user_id=user_id).all()
-        return [bookmark.job for bookmark in bookmarks]
+    def get_user_bookmarks(user_id, author_type=None, sort_by='latest', page=1, per_page=20):
+        """
+        사용자의 찜 목록 조회 (필터링, 정렬, 페이지네이션 모두 SQL에서 처리)
+
+        Args:
+            user_id: 사용자 ID
+            author_type: 작성자 유형 필터 (0: 사람 이음, 1: 기업 이음, None: 전체)
+            sort_by: 정렬 기준 ('latest', 'popular', 'views')
+            page: 페이지 번호
+            per_page: 페이지당 항목 수
+
+        Returns:
+            Pagination: 공고 목록 (작성자 정보 함께 로딩됨)
+        """
+        query = JobPost.query\
+            .join(JobBookmark, JobBookmark.job_id == JobPost.id)\
+            .join(JobPost.author)\
+            .filter(JobBookmark.user_id == user_id)\
+            .options(contains_eager(JobPost.author))
+
+        if author_type is not None:
+            query = query.filter(User.user_type == author_type)
+
+        if sort_by == 'popular':
+            query = query.order_by(
+                desc(JobPost.bookmark_count + JobPost.application_count),
+                desc(JobPost.created_at)
+            )
+        elif sort_by == 'views':
+            query = query.order_by(
+                desc(JobPost.view_count),
+                desc(JobPost.created_at)
+            )
+        else:
+            query = query.order_by(desc(JobPost.created_at))
+
+        return query.paginate(page=page, per_page=per_page, error_out=False)
     
+    @staticmethod
+    def increment_counter(job_id, field, amount=1):
+        """
+        공고 통계 카운터를 단일 UPDATE 문으로 증감 (커밋은 호출자가 수행)
+
+        Args:
+            job_id: 공고 ID
+            field: 카운터 컬럼명 ('bookmark_count', 'application_count', 'view_count')
+            amount: 증감량 (음수면 감소, 0 미만으로는 내려가지 않음)
+        """
+        column = getattr(JobPost, field)
+        if amount >= 0:
+            new_value = column + amount
+        else:
+            new_value = case((column + amount > 0, column + amount), else_=0)
+
+        JobPost.query.filter(JobPost.id == job_id)\
+                     .update({column: new_value}, synchronize_session=False)
+
     @staticmethod
     def toggle_bookmark(user_id, job_id):
-        """찜하기/찜 해제 토글"""
-        bookmark = JobBookmark.query.filter_by(
-            user_id=user_id, job_id=job_id
-        ).first()
-        
-        if bookmark:
-            # 찜 해제
-            db.session.delete(bookmark)
-            job = JobPost.query.get(job_id)
-            if job:
-                job.bookmark_count = max(0, job.bookmark_count - 1)
+        """
+        찜하기/찜 해제 토글
+
+        SELECT 없이 DELETE → (없었으면) INSERT IGNORE 순으로 처리하고,
+        실제로 행이 바뀐 경우에만 찜 카운터를 원자적으로 증감합니다.
+        동시에 여러 번 눌러도 카운터가 실제 찜 개수와 어긋나지 않습니다.
+        """
+        bookmark_table = JobBookmark.__table__
+
+        # 찜 해제 시도
+        deleted = db.session.execute(
+            bookmark_table.delete().where(
+                bookmark_table.c.user_id == user_id,
+                bookmark_table.c.job_id == job_id
+            )
+        ).rowcount
+
+        if deleted:
+            JobService.increment_counter(job_id, 'bookmark_count', -1)
             db.session.commit()
             return False
-        else:
-            # 찜하기
-            bookmark = JobBookmark(user_id=user_id, job_id=job_id)
-            db.session.add(bookmark)
-            job = JobPost.query.get(job_id)
-            if job:
-                job.bookmark_count += 1
-            db.session.commit()
-            return True
+
+        # 찜하기 (uq_user_job_bookmark 충돌 시 무시)
+        inserted = db.session.execute(
+            bookmark_table.insert()
+                          .prefix_with("IGNORE", dialect="mysql")
+                          .prefix_with("OR IGNORE", dialect="sqlite")
+                          .values(user_id=user_id, job_id=job_id)
+        ).rowcount
+
+        if inserted:
+            JobService.increment_counter(job_id, 'bookmark_count', 1)
+        db.session.commit()
+
+        if inserted:
+            JobStatsService.record(job_id, 'bookmark_count')
+        return True
+
+    @staticmethod
+    def reconcile_counters():
+        """
+        찜/지원 카운터를 job_bookmark, job_application 기준으로 일괄 재계산
+
+        공고별 상관 서브쿼리를 사용하는 단일 UPDATE 문으로 처리하며,
+        값이 실제와 다른 공고만 갱신합니다.
+
+        Returns:
+            int: 보정된 공고 수
+        """
+        bookmark_total = select(func.count(JobBookmark.id))\
+            .where(JobBookmark.job_id == JobPost.id)\
+            .scalar_subquery()
+        application_total = select(func.count(JobApplication.id))\
+            .where(JobApplication.job_id == JobPost.id)\
+            .scalar_subquery()
+
+        result = db.session.execute(
+            update(JobPost)
+            .where(or_(
+                func.coalesce(JobPost.bookmark_count, -1) != bookmark_total,
+                func.coalesce(JobPost.application_count, -1) != application_total
+            ))
+            .values(bookmark_count=bookmark_total, application_count=application_total)
+            .execution_options(synchronize_session=False)
+        )
+        db.session.commit()
+        return result.rowcount
     
     @staticmethod
     def is_bookmarked(user_id, job_id):
@@ -115,18 +285,8 @@ class JobService:
         ).first() is not None
     
     @staticmethod
-    def search_jobs(query, filters=None, conditions=None, sort_by='latest'):
-        """
-        공고 검색
-        
-        Args:
-            query: 검색어
-            filters: 필터 조건 (정확 일치)
-            conditions: 추가 검색 조건 (LIKE 검색 등)
-            sort_by: 정렬 기준 ('latest', 'popular', 'views')
-        """
-        jobs_query = JobPost.query
-        
+    def _apply_search_filters(jobs_query, query=None, filters=None, conditions=None):
+        """검색어/필터/추가 조건을 쿼리에 적용 (search_jobs, search_nearby 공용)"""
         if query:
             jobs_query = jobs_query.filter(
                 JobPost.title.contains(query) |
@@ -142,6 +302,14 @@ class JobService:
                 jobs_query = jobs_query.filter(JobPost.region_2depth_name == filters['region_2depth_name'])
             if filters.get('region_3depth_name'):
                 jobs_query = jobs_query.filter(JobPost.region_3depth_name == filters['region_3depth_name'])
+            # 법정동 코드 앞부분 (하위 지역 전체, region_code 인덱스 범위 검색)
+            if filters.get('region_code_prefix'):
+                jobs_query = jobs_query.filter(
+                    RegionService.code_prefix_condition(JobPost.region_code, filters['region_code_prefix'])
+                )
+            # 법정동 코드 목록 (통근 가능 읍/면/동 등, 빈 목록이면 결과 없음)
+            if filters.get('region_codes') is not None:
+                jobs_query = jobs_query.filter(JobPost.region_code.in_(filters['region_codes']))
 
             if filters.get('recruitment_type'):
                 jobs_query = jobs_query.filter(
@@ -157,8 +325,84 @@ class JobService:
             for condition in conditions:
                 jobs_query = jobs_query.filter(condition)
         
+        return jobs_query
+    
+    @staticmethod
+    def search_nearby(lat, lng, radius_km, query=None, filters=None, conditions=None, limit=50):
+        """
+        내 주변 공고 검색 (거리순)
+        
+        반경 안의 후보는 인메모리 위치 인덱스(JobGeoIndex)에서 거리순으로 구하고,
+        검색어/필터는 후보 ID 에 대해서만 DB 에서 적용합니다.
+        가까운 NEARBY_CANDIDATE_LIMIT 개 후보로 limit 개를 채우지 못하면
+        반경 안의 후보를 다 볼 때까지 후보 구간을 넓혀 이어서 거릅니다.
+        
+        Args:
+            lat, lng: 기준 위치 (위도, 경도)
+            radius_km: 검색 반경 (km)
+            query: 검색어
+            filters: 필터 조건 (정확 일치)
+            conditions: 추가 검색 조건
+            limit: 최대 결과 수
+        
+        Returns:
+            list: [(공고, 거리 km)] 가까운 순
+        """
+        if not (query or filters or conditions):
+            job_ids, distances = JobGeoIndex.search(lat, lng, radius_km, limit=limit)
+            distance_by_id = dict(zip(job_ids.tolist(), distances.tolist()))
+            nearest_ids = list(distance_by_id)
+        else:
+            # 가까운 후보부터 조건에 맞는 ID 만 좁은 쿼리로 거름
+            # 결과가 모자라고 반경 안에 후보가 더 있으면 후보 구간을 두 배씩 넓혀 이어서 확인
+            window = current_app.config.get('NEARBY_CANDIDATE_LIMIT', 2000)
+            distance_by_id = {}
+            nearest_ids = []
+            while True:
+                job_ids, distances = JobGeoIndex.search(lat, lng, radius_km, limit=window)
+                unchecked = [
+                    (job_id, distance)
+                    for job_id, distance in zip(job_ids.tolist(), distances.tolist())
+                    if job_id not in distance_by_id
+                ]
+                distance_by_id.update(unchecked)
+                if unchecked:
+                    candidate_ids = [job_id for job_id, _ in unchecked]
+                    matched = {
+                        row.id for row in JobService._apply_search_filters(
+                            db.session.query(JobPost.id).filter(JobPost.id.in_(candidate_ids)),
+                            query, filters, conditions
+                        )
+                    }
+                    nearest_ids.extend(job_id for job_id in candidate_ids if job_id in matched)
+
+                if len(nearest_ids) >= limit or len(job_ids) < window:
+                    break
+                window *= 2
+
+        nearest_ids = nearest_ids[:limit]
+        jobs = JobPost.query.filter(JobPost.id.in_(nearest_ids)).all() if nearest_ids else []
+        jobs.sort(key=lambda job: distance_by_id[job.id])
+        
+        return [(job, distance_by_id[job.id]) for job in jobs]
+    
+    @staticmethod
+    def search_jobs(query, filters=None, conditions=None, sort_by='latest'):
+        """
+        공고 검색
+        
+        Args:
+            query: 검색어
+            filters: 필터 조건 (정확 일치)
+            conditions: 추가 검색 조건 (LIKE 검색 등)
+            sort_by: 정렬 기준 ('latest', 'popular', 'views', 'trending')
+        """
+        jobs_query = JobService._apply_search_filters(JobPost.query, query, filters, conditions)
+        
         # 정렬 적용
-        if sort_by == 'latest':
+        if sort_by == 'trending':
+            jobs_query = JobService._order_by_trending(jobs_query)
+        elif sort_by == 'latest':
             jobs_query = jobs_query.order_by(desc(JobPost.created_at))
         elif sort_by == 'popular':
             jobs_query = jobs_query.order_by(
@@ -0,0 +1,317 @@
+"""
+공고 시간대별 통계 서비스 모듈
+===========================
+
+조회/찜/지원/채팅 시작 이벤트를 1시간 단위(job_stat_hourly)와
+1일 단위(job_stat_daily) 롤업 테이블에 집계합니다.
+
+주요 기능:
+- 이벤트를 메모리 버퍼에 모았다가 주기적으로 일괄 반영 (INSERT ... ON DUPLICATE KEY UPDATE)
+- 기간별 급상승 점수 계산 및 상위 공고 ID 목록 캐시
+- 기업 회원 대시보드용 공고별 일별 통계 조회
+- 오래된 시간별 통계 정리
+"""
+
+import atexit
+import threading
+import time
+from datetime import datetime, timedelta
+from flask import current_app
+from sqlalchemy import desc, func, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from models import db, JobPost, JobStatHourly, JobStatDaily
+from utils.cache import cache
+
+# 급상승 집계 구간 (시간 단위)
+TRENDING_WINDOWS = {
+    '24h': 24,
+    '7d': 24 * 7
+}
+
+# 집계 필드
+STAT_FIELDS = ('view_count', 'bookmark_count', 'application_count', 'chat_start_count')
+
+# 급상승 점수 가중치: 찜/지원은 조회보다 강한 관심 신호
+TRENDING_WEIGHTS = {
+    'view_count': 1,
+    'bookmark_count': 3,
+    'application_count': 5
+}
+
+
+def _bucket_start(moment=None):
+    """시각이 속한 1시간 버킷의 시작 시각 (UTC 정시)"""
+    moment = moment or datetime.utcnow()
+    return moment.replace(minute=0, second=0, microsecond=0)
+
+
+class JobStatsService:
+
+    _lock = threading.Lock()
+    _pending = {}            # {(job_id, bucket_start): {필드명: 증가분}}
+    _last_flush = time.monotonic()
+
+    @staticmethod
+    def init_app(app):
+        """프로세스 종료 시 남은 통계를 반영하도록 등록"""
+        def _flush_on_exit():
+            with app.app_context():
+                JobStatsService.flush()
+
+        atexit.register(_flush_on_exit)
+
+    @staticmethod
+    def record(job_id, field, amount=1):
+        """
+        통계 이벤트 기록
+
+        Args:
+            job_id: 공고 ID
+            field: 집계 필드 (STAT_FIELDS 중 하나)
+            amount: 증가량
+        """
+        key = (job_id, _bucket_start())
+
+        with JobStatsService._lock:
+            counters = JobStatsService._pending.setdefault(key, {})
+            counters[field] = counters.get(field, 0) + amount
+            elapsed = time.monotonic() - JobStatsService._last_flush
+
+        if elapsed >= current_app.config.get('JOB_STATS_FLUSH_INTERVAL', 60):
+            JobStatsService.flush()
+
+    @staticmethod
+    def flush():
+        """
+        버퍼에 쌓인 통계를 job_stat_hourly, job_stat_daily 에 일괄 반영
+
+        Returns:
+            int: 반영된 버킷 수
+        """
+        with JobStatsService._lock:
+            pending = JobStatsService._pending
+            JobStatsService._pending = {}
+            JobStatsService._last_flush = time.monotonic()
+
+        if not pending:
+            return 0
+
+        # 확인과 반영 사이에 공고가 삭제되어 외래 키 오류가 나면 한 번 더 걸러서 반영
+        for attempt in range(2):
+            try:
+                return JobStatsService._write(pending)
+            except IntegrityError as e:
+                if attempt:
+                    # 다시 시도해도 같은 오류이므로 버퍼로 되돌리지 않고 버림
+                    print(f"공고 통계 반영 오류 (버림): {e}")
+            except Exception as e:
+                print(f"공고 통계 반영 오류: {e}")
+                # 실패한 증가분은 다음 반영 때 다시 시도
+                with JobStatsService._lock:
+                    for key, counters in pending.items():
+                        merged = JobStatsService._pending.setdefault(key, {})
+                        for field, amount in counters.items():
+                            merged[field] = merged.get(field, 0) + amount
+                return 0
+        return 0
+
+    @staticmethod
+    def _write(pending):
+        """
+        존재하는 공고의 통계만 한 트랜잭션으로 반영
+
+        삭제된 공고(또는 공고가 아닌 ID)의 통계가 섞이면 외래 키 때문에 배치 전체가
+        실패하므로 job_post 에 있는 ID 만 남깁니다.
+
+        Returns:
+            int: 반영된 버킷 수
+        """
+        with db.engine.begin() as connection:
+            existing = set(connection.execute(
+                select(JobPost.id).where(JobPost.id.in_(sorted({job_id for job_id, _ in pending})))
+            ).scalars())
+            hourly_rows, daily_rows = JobStatsService._rollup_rows(
+                {key: counters for key, counters in pending.items() if key[0] in existing}
+            )
+            if hourly_rows:
+                connection.execute(JobStatsService._upsert(JobStatHourly.__table__), hourly_rows)
+                connection.execute(JobStatsService._upsert(JobStatDaily.__table__), daily_rows)
+        return len(hourly_rows)
+
+    @staticmethod
+    def _rollup_rows(pending):
+        """
+        버퍼 → 시간별/일별 롤업 행
+
+        Returns:
+            tuple: (시간별 행 목록, 일별 행 목록)
+        """
+        hourly_rows = []
+        daily_totals = {}
+        for (job_id, bucket_start), counters in pending.items():
+            hourly_rows.append(dict(
+                {'job_id': job_id, 'bucket_start': bucket_start},
+                **{field: counters.get(field, 0) for field in STAT_FIELDS}
+            ))
+            # 같은 날의 시간 버킷은 일별 롤업 한 행으로 합산
+            daily = daily_totals.setdefault((job_id, bucket_start.date()), dict.fromkeys(STAT_FIELDS, 0))
+            for field, amount in counters.items():
+                daily[field] += amount
+
+        daily_rows = [
+            dict({'job_id': job_id, 'day': day}, **counters)
+            for (job_id, day), counters in daily_totals.items()
+        ]
+        return hourly_rows, daily_rows
+
+    @staticmethod
+    def _upsert(table):
+        """통계 롤업 테이블용 INSERT ... ON DUPLICATE KEY UPDATE (기존 값에 증가분 누적)"""
+        stmt = mysql_insert(table)
+        return stmt.on_duplicate_key_update({
+            field: table.c[field] + stmt.inserted[field] for field in STAT_FIELDS
+        })
+
+    @staticmethod
+    def get_trending_job_ids(window='24h'):
+        """
+        급상승 공고 ID 목록 (점수 내림차순, 최대 TRENDING_SIZE개)
+
+        최근 구간의 시간 버킷만 합산하며, 결과는 TRENDING_CACHE_TIMEOUT 동안 캐시됩니다.
+
+        Args:
+            window: 집계 구간 ('24h', '7d')
+
+        Returns:
+            list: 공고 ID 목록
+        """
+        if window not in TRENDING_WINDOWS:
+            window = '24h'
+
+        cache_key = f"trending_jobs:{window}"
+        job_ids = cache.get(cache_key)
+        if job_ids is not None:
+            return job_ids
+
+        since = _bucket_start() - timedelta(hours=TRENDING_WINDOWS[window] - 1)
+        score = sum(
+            func.sum(getattr(JobStatHourly, field)) * weight
+            for field, weight in TRENDING_WEIGHTS.items()
+        ).label('score')
+
+        rows = db.session.query(JobStatHourly.job_id, score)\
+                         .filter(JobStatHourly.bucket_start >= since)\
+                         .group_by(JobStatHourly.job_id)\
+                         .order_by(desc(score))\
+                         .limit(current_app.config.get('TRENDING_SIZE', 100))\
+                         .all()
+
+        job_ids = [row.job_id for row in rows]
+        cache.set(cache_key, job_ids, timeout=current_app.config.get('TRENDING_CACHE_TIMEOUT', 300))
+        return job_ids
+
+    @staticmethod
+    def get_employer_stats(employer_id, days=14):
+        """
+        기업 회원의 모든 공고에 대한 일별 통계
+
+        일별 롤업 테이블만 GROUP BY 한 번으로 조회하며, 원시 이벤트는 읽지 않습니다.
+
+        Args:
+            employer_id: 공고 작성자 ID
+            days: 조회 기간 (오늘 포함 일 수)
+
+        Returns:
+            dict: {
+                'days': 날짜 목록,
+                'posts': [{'job': 공고, 'totals': 기간 합계, 'series': 날짜별 통계 목록}],
+                'totals': 전체 공고 기간 합계
+            }
+        """
+        today = datetime.utcnow().date()
+        day_list = [today - timedelta(days=offset) for offset in range(days - 1, -1, -1)]
+
+        jobs = db.session.query(
+            JobPost.id, JobPost.title, JobPost.created_at,
+            JobPost.view_count, JobPost.bookmark_count, JobPost.application_count
+        ).filter(JobPost.author_id == employer_id)\
+         .order_by(JobPost.created_at.desc())\
+         .all()
+
+        rows = db.session.query(
+            JobStatDaily.job_id,
+            JobStatDaily.day,
+            *[func.sum(getattr(JobStatDaily, field)).label(field) for field in STAT_FIELDS]
+        ).join(JobPost, JobPost.id == JobStatDaily.job_id)\
+         .filter(JobPost.author_id == employer_id, JobStatDaily.day >= day_list[0])\
+         .group_by(JobStatDaily.job_id, JobStatDaily.day)\
+         .all()
+
+        by_job_day = {(row.job_id, row.day): row for row in rows}
+        empty = dict.fromkeys(STAT_FIELDS, 0)
+
+        posts = []
+        overall = dict(empty)
+        for job in jobs:
+            series = []
+            totals = dict(empty)
+            for day in day_list:
+                row = by_job_day.get((job.id, day))
+                counters = {field: int(getattr(row, field) or 0) for field in STAT_FIELDS} if row else dict(empty)
+                series.append(dict(counters, day=day))
+                for field in STAT_FIELDS:
+                    totals[field] += counters[field]
+            for field in STAT_FIELDS:
+                overall[field] += totals[field]
+            posts.append({'job': job, 'totals': totals, 'series': series})
+
+        return {'days': day_list, 'posts': posts, 'totals': overall}
+
+    @staticmethod
+    def get_hourly_stats(job_id, hours=48):
+        """
+        공고의 최근 시간별 통계
+
+        Args:
+            job_id: 공고 ID
+            hours: 조회 기간 (시간)
+
+        Returns:
+            list: [{'bucket_start': 시각, 필드별 값...}] (시간 오름차순, 빈 시간 포함)
+        """
+        end = _bucket_start()
+        start = end - timedelta(hours=hours - 1)
+
+        rows = JobStatHourly.query.filter(
+            JobStatHourly.job_id == job_id,
+            JobStatHourly.bucket_start >= start
+        ).all()
+        by_bucket = {row.bucket_start: row for row in rows}
+
+        series = []
+        for offset in range(hours):
+            bucket = start + timedelta(hours=offset)
+            row = by_bucket.get(bucket)
+            series.append(dict(
+                {'bucket_start': bucket},
+                **{field: (getattr(row, field) if row else 0) for field in STAT_FIELDS}
+            ))
+        return series
+
+    @staticmethod
+    def prune_hourly(keep_days=8):
+        """
+        오래된 시간별 통계 삭제 (일별 통계는 유지)
+
+        Args:
+            keep_days: 보관 기간 (급상승 7일 구간보다 길어야 함)
+
+        Returns:
+            int: 삭제된 행 수
+        """
+        cutoff = _bucket_start() - timedelta(days=keep_days)
+        deleted = JobStatHourly.query.filter(JobStatHourly.bucket_start < cutoff)\
+                                     .delete(synchronize_session=False)
+        db.session.commit()
+        return deleted
@@ -0,0 +1,362 @@
+"""
+지도 서비스 모듈
+===============
+
+지도 화면에 표시할 공고 위치 데이터를 조회합니다.
+
+주요 기능:
+- 뷰포트(남서/북동 좌표) 범위 안의 공고 조회
+- 한 번에 내려주는 마커 수 상한 적용
+- 확대 레벨별 격자 클러스터 집계 (job_map_cell) 조회 및 증분 갱신
+- 마커 데이터의 바이너리 직렬화 (float32 좌표 + uint32 ID)
+- 공고 좌표 변경 기록 (job_map_change) 및 마커 증분 동기화
+"""
+
+import math
+import struct
+from datetime import datetime, timedelta
+from sqlalchemy import func
+from models import db, JobPost, JobMapCell, JobMapChange
+from utils.upsert import upsert
+
+# 확대 레벨별 클러스터 격자 칸 크기 (도 단위, 레벨이 하나 오를 때마다 두 배)
+CLUSTER_CELL_DEGREES = {
+    8: 0.02,
+    9: 0.04,
+    10: 0.08,
+    11: 0.16,
+    12: 0.32,
+    13: 0.64,
+    14: 1.28
+}
+
+
+# 바이너리 마커 응답 모드 (헤더 1바이트)
+PAYLOAD_MODE_MARKERS = 0
+PAYLOAD_MODE_CLUSTERS = 1
+
+# 헤더: 개수(uint32), 모드(uint8), 잘림 여부(uint8), 예약(uint16) - 리틀 엔디언
+PAYLOAD_HEADER = struct.Struct('<IBBH')
+
+
+def _cell_of(level, lat, lng):
+    """좌표가 속한 격자 칸 (cell_y, cell_x)"""
+    size = CLUSTER_CELL_DEGREES[level]
+    return math.floor(lat / size), math.floor(lng / size)
+
+
+def _valid_position(position):
+    """(위도, 경도) 중 하나라도 없으면 None"""
+    if not position or position[0] is None or position[1] is None:
+        return None
+    return position
+
+
+def pack_markers(mode, values, lats, lngs, truncated=False):
+    """
+    마커/클러스터 목록을 바이너리로 직렬화
+
+    레이아웃 (리틀 엔디언, 모든 구간 4바이트 정렬):
+    - 헤더 8바이트: 개수 uint32, 모드 uint8, 잘림 여부 uint8, 예약 uint16
+    - values uint32 × 개수: 마커 모드면 공고 ID, 클러스터 모드면 공고 수
+    - 위도 float32 × 개수
+    - 경도 float32 × 개수
+
+    브라우저에서는 Uint32Array / Float32Array 로 복사 없이 읽을 수 있습니다.
+
+    Returns:
+        bytes: 직렬화된 응답 본문
+    """
+    count = len(values)
+    return b''.join((
+        PAYLOAD_HEADER.pack(count, mode, 1 if truncated else 0, 0),
+        struct.pack(f'<{count}I', *values),
+        struct.pack(f'<{count}f', *lats),
+        struct.pack(f'<{count}f', *lngs)
+    ))
+
+
+def parse_point(value):
+    """
+    "위도,경도" 문자열을 (위도, 경도) 로 변환
+
+    Returns:
+        tuple: (lat, lng) 또는 형식이 잘못되었으면 None
+    """
+    try:
+        lat, lng = (float(part) for part in value.split(','))
+    except (AttributeError, ValueError):
+        return None
+
+    if not (-90 <= lat <= 90 and -180 <= lng <= 180):
+        return None
+    return lat, lng
+
+
+class MapService:
+
+    @staticmethod
+    def uses_clusters(level, min_level):
+        """확대 레벨에서 개별 마커 대신 클러스터를 보여줄지 여부"""
+        return level is not None and level >= min_level and level in CLUSTER_CELL_DEGREES
+
+    @staticmethod
+    def get_clusters_in_bounds(level, south, west, north, east):
+        """
+        뷰포트 범위의 클러스터 조회
+
+        미리 집계된 격자 칸만 기본 키 (level, cell_y, cell_x) 범위로 읽습니다.
+
+        Args:
+            level: 카카오맵 확대 레벨 (CLUSTER_CELL_DEGREES 키)
+            south, west: 남서쪽 위도/경도
+            north, east: 북동쪽 위도/경도
+
+        Returns:
+            list: [{'lat': 중심 위도, 'lng': 중심 경도, 'count': 공고 수}]
+        """
+        min_y, min_x = _cell_of(level, south, west)
+        max_y, max_x = _cell_of(level, north, east)
+
+        cells = JobMapCell.query.filter(
+            JobMapCell.level == level,
+            JobMapCell.cell_y.between(min_y, max_y),
+            JobMapCell.cell_x.between(min_x, max_x),
+            JobMapCell.job_count > 0
+        ).all()
+
+        return [
+            {'lat': cell.lat_sum / cell.job_count,
+             'lng': cell.lng_sum / cell.job_count,
+             'count': cell.job_count}
+            for cell in cells
+        ]
+
+    @staticmethod
+    def record_position_change(job_id, old_position=None, new_position=None):
+        """
+        공고 좌표 변경 반영 (클러스터 격자 증분 갱신 + 마커 동기화용 변경 기록)
+
+        공고 등록/수정/삭제와 같은 트랜잭션에서 호출하며, 커밋은 호출한 쪽에서 합니다.
+
+        Args:
+            job_id: 공고 ID
+            old_position: 변경 전 (위도, 경도) (새 공고면 None)
+            new_position: 변경 후 (위도, 경도) (삭제면 None)
+        """
+        old_position = _valid_position(old_position)
+        new_position = _valid_position(new_position)
+        if old_position == new_position:
+            return
+
+        MapService.update_clusters(old_position, new_position)
+
+        lat, lng = new_position if new_position else (None, None)
+        db.session.add(JobMapChange(job_id=job_id, latitude=lat, longitude=lng))
+
+    @staticmethod
+    def update_clusters(old_position=None, new_position=None):
+        """
+        공고 좌표 변경을 클러스터 격자에 증분 반영
+
+        Args:
+            old_position: 변경 전 (위도, 경도) (새 공고면 None)
+            new_position: 변경 후 (위도, 경도) (삭제면 None)
+        """
+        if old_position == new_position:
+            return
+
+        deltas = {}
+        for position, sign in ((old_position, -1), (new_position, 1)):
+            position = _valid_position(position)
+            if not position:
+                continue
+            lat, lng = position
+            for level in CLUSTER_CELL_DEGREES:
+                key = (level,) + _cell_of(level, lat, lng)
+                count, lat_sum, lng_sum = deltas.get(key, (0, 0.0, 0.0))
+                deltas[key] = (count + sign, lat_sum + sign * lat, lng_sum + sign * lng)
+
+        rows = [
+            {'level': level, 'cell_y': cell_y, 'cell_x': cell_x,
+             'job_count': count, 'lat_sum': lat_sum, 'lng_sum': lng_sum}
+            for (level, cell_y, cell_x), (count, lat_sum, lng_sum) in deltas.items()
+            if count or lat_sum or lng_sum  # 같은 칸 안에서 이동하면 공고 수는 그대로지만 좌표 합은 바뀜
+        ]
+        if rows:
+            db.session.execute(MapService._cell_upsert(), rows)
+
+    @staticmethod
+    def get_marker_changes(since=0, replay_seconds=30):
+        """
+        마커 증분 동기화
+
+        클라이언트가 가진 버전 이후의 변경만 공고별 최종 상태로 묶어 반환합니다.
+        버전이 없거나 변경 기록이 정리되어 이어받을 수 없으면 전체 목록을 반환합니다.
+
+        순번은 커밋 순서와 다를 수 있으므로(먼저 번호를 받은 트랜잭션이 늦게 커밋)
+        최근 replay_seconds 동안의 변경은 버전과 관계없이 다시 보냅니다.
+        변경은 최종 좌표로 기록되므로 다시 적용해도 결과가 같습니다.
+
+        Args:
+            since: 클라이언트가 가진 버전 (0 이면 전체)
+            replay_seconds: 다시 보낼 최근 변경 구간 (초)
+
+        Returns:
+            dict: {
+                'version': 새 버전,
+                'full': 전체 목록 여부,
+                'upserted': [[id, 위도, 경도]] (추가/이동),
+                'removed': [id] (삭제/좌표 제거)
+            }
+        """
+        version = db.session.query(func.max(JobMapChange.id)).scalar() or 0
+        oldest = db.session.query(func.min(JobMapChange.id)).scalar()
+
+        if since <= 0 or since > version or (oldest is not None and since < oldest - 1):
+            rows = db.session.query(JobPost.id, JobPost.latitude, JobPost.longitude)\
+                             .filter(JobPost.latitude.isnot(None), JobPost.longitude.isnot(None))\
+                             .all()
+            return {
+                'version': version,
+                'full': True,
+                'upserted': [[row.id, row.latitude, row.longitude] for row in rows],
+                'removed': []
+            }
+
+        replay_from = db.session.query(func.min(JobMapChange.id))\
+                                .filter(JobMapChange.created_at >= datetime.utcnow() - timedelta(seconds=replay_seconds))\
+                                .scalar()
+        if replay_from is not None:
+            since = min(since, replay_from - 1)
+
+        changes = JobMapChange.query.filter(JobMapChange.id > since, JobMapChange.id <= version)\
+                                    .order_by(JobMapChange.id)\
+                                    .all()
+
+        # 같은 공고의 여러 변경은 마지막 것만 반영
+        latest = {change.job_id: change for change in changes}
+        upserted = [
+            [job_id, change.latitude, change.longitude]
+            for job_id, change in latest.items()
+            if change.latitude is not None and change.longitude is not None
+        ]
+        removed = [
+            job_id for job_id, change in latest.items()
+            if change.latitude is None or change.longitude is None
+        ]
+
+        return {'version': version, 'full': False, 'upserted': upserted, 'removed': removed}
+
+    @staticmethod
+    def prune_changes(keep_days=30):
+        """
+        오래된 마커 변경 기록 삭제 (그보다 오래된 버전의 클라이언트는 전체 목록을 다시 받음)
+
+        Returns:
+            int: 삭제된 행 수
+        """
+        cutoff = datetime.utcnow() - timedelta(days=keep_days)
+        deleted = JobMapChange.query.filter(JobMapChange.created_at < cutoff)\
+                                    .delete(synchronize_session=False)
+        db.session.commit()
+        return deleted
+
+    @staticmethod
+    def _cell_upsert():
+        """격자 칸 INSERT ... ON DUPLICATE KEY UPDATE (기존 값에 증감분 누적)"""
+        table = JobMapCell.__table__
+        return upsert(table, db.engine.dialect.name, lambda new: {
+            field: table.c[field] + new[field]
+            for field in ('job_count', 'lat_sum', 'lng_sum')
+        })
+
+    @staticmethod
+    def rebuild_clusters():
+        """
+        클러스터 격자 전체 재계산
+
+        증분 갱신이 어긋났거나 좌표를 일괄 수정한 뒤 사용합니다.
+
+        Returns:
+            int: 생성된 격자 칸 수
+        """
+        rows = []
+        for level, size in CLUSTER_CELL_DEGREES.items():
+            cell_y = func.floor(JobPost.latitude / size).label('cell_y')
+            cell_x = func.floor(JobPost.longitude / size).label('cell_x')
+            grouped = db.session.query(
+                cell_y, cell_x,
+                func.count(JobPost.id).label('job_count'),
+                func.sum(JobPost.latitude).label('lat_sum'),
+                func.sum(JobPost.longitude).label('lng_sum')
+            ).filter(
+                JobPost.latitude.isnot(None),
+                JobPost.longitude.isnot(None)
+            ).group_by(cell_y, cell_x).all()
+
+            rows.extend(
+                {'level': level, 'cell_y': int(row.cell_y), 'cell_x': int(row.cell_x),
+                 'job_count': row.job_count, 'lat_sum': float(row.lat_sum), 'lng_sum': float(row.lng_sum)}
+                for row in grouped
+            )
+
+        JobMapCell.query.delete(synchronize_session=False)
+        if rows:
+            db.session.execute(JobMapCell.__table__.insert(), rows)
+        db.session.commit()
+        return len(rows)
+
+    @staticmethod
+    def get_jobs_in_bounds(south, west, north, east, limit=300, with_details=True):
+        """
+        뷰포트 범위 안의 공고 위치 조회
+
+        (latitude, longitude) 복합 인덱스로 위도 범위를 훑고 경도 조건을 인덱스 안에서 거릅니다.
+        with_details=False 면 ID/좌표만 읽으므로 인덱스만으로 처리됩니다.
+        상한보다 하나 더 조회해서 잘린 결과인지 판단합니다.
+
+        Args:
+            south, west: 남서쪽 위도/경도
+            north, east: 북동쪽 위도/경도
+            limit: 최대 공고 수
+            with_details: 제목/회사명/급여 포함 여부
+
+        Returns:
+            tuple: (공고 위치 목록, 상한 초과 여부)
+        """
+        columns = [JobPost.id, JobPost.latitude, JobPost.longitude]
+        if with_details:
+            columns += [JobPost.title, JobPost.company, JobPost.salary]
+
+        rows = db.session.query(*columns).filter(
+            JobPost.latitude.between(south, north),
+            JobPost.longitude.between(west, east)
+        ).order_by(JobPost.id.desc())\
+         .limit(limit + 1)\
+         .all()
+
+        truncated = len(rows) > limit
+        jobs = []
+        for row in rows[:limit]:
+            job = {'id': row.id, 'lat': row.latitude, 'lng': row.longitude}
+            if with_details:
+                job.update(title=row.title, company=row.company, salary=row.salary)
+            jobs.append(job)
+        return jobs, truncated
+
+    @staticmethod
+    def get_marker_detail(job_id):
+        """
+        마커 클릭 시 보여줄 공고 요약 (바이너리 응답에는 제목 등이 없으므로 클릭 시 조회)
+
+        Returns:
+            dict: {id, title, company, salary, lat, lng}
+        """
+        row = db.session.query(
+            JobPost.id, JobPost.title, JobPost.company, JobPost.salary,
+            JobPost.latitude, JobPost.longitude
+        ).filter(JobPost.id == job_id).first_or_404()
+
+        return {'id': row.id, 'title': row.title, 'company': row.company,
+                'salary': row.salary, 'lat': row.latitude, 'lng': row.longitude}
@@ -0,0 +1,391 @@
+"""
+지역별 공고 수 서비스 모듈
+========================
+
+시/도 → 시/군/구 → 읍/면/동 지역 트리에 모집 중인 공고 수를 붙여서 제공합니다.
+지역 선택기(onboarding, 회원정보 수정)와 지도 지역별 히트맵이 같은 응답을 사용합니다.
+
+공고 수는 job_region_count 테이블에 (지역, 모집 마감일) 단위로 누적해 두고
+공고 등록/수정/삭제 시 증감분만 반영합니다. 마감일을 키에 포함하므로
+마감된 공고는 별도 갱신 없이 조회 조건(마감일 >= 오늘)만으로 빠집니다.
+
+공고/사용자 지역은 10자리 법정동 코드(region_code)로도 저장해 두고,
+지역 필터는 코드 앞부분 범위 비교(인덱스 사용)로 처리합니다.
+"""
+
+from datetime import date, datetime
+from flask import current_app
+from sqlalchemy import and_, bindparam, func
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from models import db, JobPost, JobRegionCount, User
+from utils.cache import cache
+from utils.region_matcher import SIDO_ALIASES, match_address, match_region
+
+# 모집 마감일이 없는 공고의 마감일 (항상 모집 중)
+OPEN_ENDED = date(9999, 12, 31)
+
+COUNT_FIELDS = ('job_count', 'located_count', 'lat_sum', 'lng_sum')
+
+
+def normalize_region_names(region_1depth_name, region_2depth_name, region_3depth_name):
+    """
+    공고의 지역명을 지역 선택기 이름으로 맞춤
+
+    - 시/도: 약칭/옛 이름을 정식 이름으로 ('서울' → '서울특별시')
+    - 시/군/구: 공백 제거 ('수원시 장안구' → '수원시장안구')
+    - 읍/면/동: 마지막 단어
+
+    Returns:
+        tuple: (시/도, 시/군/구, 읍/면/동) 없는 단계는 빈 문자열
+    """
+    sido = (region_1depth_name or '').strip()
+    sido = SIDO_ALIASES.get(sido, sido)
+    sigungu = ''.join((region_2depth_name or '').split())
+    dong_tokens = (region_3depth_name or '').split()
+    dong = dong_tokens[-1] if dong_tokens else ''
+    return sido, sigungu, dong
+
+
+class RegionService:
+
+    @staticmethod
+    def snapshot(job):
+        """
+        지역별 공고 수 집계에 필요한 공고 상태
+
+        수정 전후 snapshot 을 record_change 에 넘겨 증감분을 반영합니다.
+        """
+        if job is None:
+            return None
+        return RegionService.snapshot_values(
+            job.region_1depth_name, job.region_2depth_name, job.region_3depth_name,
+            job.recruitment_end_date, job.latitude, job.longitude
+        )
+
+    @staticmethod
+    def snapshot_values(region_1depth_name, region_2depth_name, region_3depth_name,
+                        recruitment_end_date, latitude, longitude):
+        """컬럼 값으로 snapshot 생성 (공고 객체 없이 일괄 갱신할 때 사용)"""
+        return (
+            normalize_region_names(region_1depth_name, region_2depth_name, region_3depth_name),
+            recruitment_end_date or OPEN_ENDED,
+            latitude,
+            longitude
+        )
+
+    @staticmethod
+    def record_change(old_snapshot=None, new_snapshot=None):
+        """
+        공고 등록/수정/삭제를 지역별 공고 수에 증분 반영
+
+        공고 변경과 같은 트랜잭션에서 호출하며, 커밋은 호출한 쪽에서 합니다.
+
+        Args:
+            old_snapshot: 변경 전 snapshot (새 공고면 None)
+            new_snapshot: 변경 후 snapshot (삭제면 None)
+        """
+        if old_snapshot == new_snapshot:
+            return
+
+        rows = []
+        for snapshot, sign in ((old_snapshot, -1), (new_snapshot, 1)):
+            if snapshot is None:
+                continue
+            (sido, sigungu, dong), end_date, lat, lng = snapshot
+            located = lat is not None and lng is not None
+            rows.append({
+                'region_1depth_name': sido,
+                'region_2depth_name': sigungu,
+                'region_3depth_name': dong,
+                'end_date': end_date,
+                'job_count': sign,
+                'located_count': sign if located else 0,
+                'lat_sum': sign * lat if located else 0.0,
+                'lng_sum': sign * lng if located else 0.0
+            })
+
+        db.session.execute(RegionService._count_upsert(), rows)
+
+    @staticmethod
+    def _count_upsert():
+        """지역별 공고 수 INSERT ... ON DUPLICATE KEY UPDATE (기존 값에 증감분 누적)"""
+        table = JobRegionCount.__table__
+        stmt = mysql_insert(table)
+        return stmt.on_duplicate_key_update({
+            field: table.c[field] + stmt.inserted[field] for field in COUNT_FIELDS
+        })
+
+    @staticmethod
+    def resolve_code(region_1depth_name=None, region_2depth_name=None, region_3depth_name=None, address=None):
+        """
+        지역명 → 10자리 법정동 코드 (찾은 가장 깊은 단계)
+
+        행정구역 이름으로 먼저 찾고, 없거나 더 얕게 찾으면 주소(address)로도 찾아봅니다.
+
+        Returns:
+            str: 법정동 코드, 시/도도 찾지 못하면 None
+        """
+        match = match_region(region_1depth_name, region_2depth_name, region_3depth_name) \
+            if region_1depth_name else None
+        if address and (match is None or len(match.prefix) < 8):
+            by_address = match_address(address)
+            if by_address and (match is None or len(by_address.prefix) > len(match.prefix)):
+                match = by_address
+        return match.code if match else None
+
+    @staticmethod
+    def match_filter(region_1depth_name=None, region_2depth_name=None, region_3depth_name=None):
+        """
+        지역 필터 입력 → 법정동 코드 앞부분
+
+        입력한 가장 깊은 단계까지 찾았을 때만 돌려줍니다
+        (읍/면/동을 입력했는데 시/군/구까지만 찾으면 None).
+
+        Returns:
+            str: 코드 앞부분 ('11', '11680', '11680101' 등) 또는 None
+        """
+        if not region_1depth_name:
+            return None
+        match = match_region(region_1depth_name, region_2depth_name or None, region_3depth_name or None)
+        if match is None:
+            return None
+
+        required = 8 if region_3depth_name else 4 if region_2depth_name else 2
+        return match.prefix if len(match.prefix) >= required else None
+
+    @staticmethod
+    def code_prefix_condition(column, prefix):
+        """
+        법정동 코드 앞부분 조건 (region_code 인덱스 범위 검색)
+
+        '11680' → '1168000000' <= column < '1168100000'
+        """
+        lower = prefix.ljust(10, '0')
+        upper = str(int(prefix) + 1).zfill(len(prefix)).ljust(10, '0')
+        return and_(column >= lower, column < upper)
+
+    @staticmethod
+    def backfill_codes(batch_size=500, recompute=False):
+        """
+        공고/사용자 region_code 일괄 채우기 (배치 단위 executemany UPDATE)
+
+        Args:
+            batch_size: 배치 크기
+            recompute: True 면 이미 채워진 행도 다시 계산
+
+        Returns:
+            dict: {'job_post': (채운 수, 찾지 못한 수), 'user': (...)}
+        """
+        targets = (
+            ('job_post', JobPost,
+             (JobPost.region_1depth_name, JobPost.region_2depth_name, JobPost.region_3depth_name, JobPost.region)),
+            ('user', User,
+             (User.sido, User.sigungu, User.dong))
+        )
+
+        results = {}
+        for name, model, columns in targets:
+            table = model.__table__
+            update = table.update()\
+                          .where(table.c.id == bindparam('b_id'))\
+                          .values(region_code=bindparam('b_region_code'))
+
+            resolved = unresolved = 0
+            last_id = 0
+            while True:
+                query = db.session.query(model.id, *columns).filter(model.id > last_id)
+                if not recompute:
+                    query = query.filter(model.region_code.is_(None))
+                rows = query.order_by(model.id).limit(batch_size).all()
+                if not rows:
+                    break
+
+                params = []
+                for row in rows:
+                    code = RegionService.resolve_code(*row[1:])
+                    if code:
+                        params.append({'b_id': row.id, 'b_region_code': code})
+                    else:
+                        unresolved += 1
+                if params:
+                    db.session.execute(update, params)
+                db.session.commit()
+
+                resolved += len(params)
+                last_id = rows[-1].id
+
+            results[name] = (resolved, unresolved)
+        return results
+
+    @staticmethod
+    def migrate_codes(code_map, batch_size=500):
+        """
+        폐지된 법정동 코드를 후속 코드로 일괄 변경 (법정동 데이터 변경 보고서의 code_map)
+
+        후속 코드는 모두 새 배포본에 있는 코드라 변경 순서와 관계없이 한 번만 바뀝니다.
+
+        Args:
+            code_map: {폐지된 코드: 후속 코드}
+            batch_size: 한 번에 처리하는 코드 수
+
+        Returns:
+            dict: {'job_post': 변경한 행 수, 'user': 변경한 행 수}
+        """
+        items = sorted(code_map.items())
+
+        results = {}
+        for name, model in (('job_post', JobPost), ('user', User)):
+            table = model.__table__
+            update = table.update()\
+                          .where(table.c.region_code == bindparam('b_old_code'))\
+                          .values(region_code=bindparam('b_new_code'))
+
+            changed = 0
+            for start in range(0, len(items), batch_size):
+                batch = items[start:start + batch_size]
+                # executemany UPDATE 는 드라이버가 행 수를 합산하지 않을 수 있어 먼저 셈
+                count = db.session.query(func.count(model.id))\
+                                  .filter(model.region_code.in_([old for old, _ in batch]))\
+                                  .scalar()
+                if count:
+                    db.session.execute(update, [
+                        {'b_old_code': old, 'b_new_code': new} for old, new in batch
+                    ])
+                db.session.commit()
+                changed += count
+
+            results[name] = changed
+        return results
+
+    @staticmethod
+    def get_job_count_tree():
+        """
+        모집 중인 공고 수가 붙은 지역 트리 (공고가 있는 지역만)
+
+        결과는 REGION_COUNT_CACHE_TIMEOUT 동안 캐시되며, 날짜가 바뀌면 새로 계산합니다.
+
+        Returns:
+            dict: {
+                'total': 전체 공고 수,
+                'sido': {
+                    시/도 이름: {
+                        'count', 'lat', 'lng',
+                        'sigungu': {시/군/구 이름: {'count', 'lat', 'lng', 'dong': {읍/면/동 이름: 공고 수}}}
+                    }
+                }
+            }
+            lat/lng 는 좌표가 있는 공고들의 평균 위치 (없으면 None)
+        """
+        today = datetime.utcnow().date()
+        cache_key = f"region_job_counts:{today.isoformat()}"
+        tree = cache.get(cache_key)
+        if tree is not None:
+            return tree
+
+        rows = db.session.query(
+            JobRegionCount.region_1depth_name,
+            JobRegionCount.region_2depth_name,
+            JobRegionCount.region_3depth_name,
+            *[func.sum(getattr(JobRegionCount, field)).label(field) for field in COUNT_FIELDS]
+        ).filter(JobRegionCount.end_date >= today)\
+         .group_by(
+            JobRegionCount.region_1depth_name,
+            JobRegionCount.region_2depth_name,
+            JobRegionCount.region_3depth_name
+        ).all()
+
+        def new_node():
+            return {'count': 0, 'located_count': 0, 'lat_sum': 0.0, 'lng_sum': 0.0}
+
+        def add(node, row):
+            node['count'] += int(row.job_count)
+            node['located_count'] += int(row.located_count)
+            node['lat_sum'] += float(row.lat_sum)
+            node['lng_sum'] += float(row.lng_sum)
+
+        tree = {'total': 0, 'sido': {}}
+        for row in rows:
+            if not row.job_count or row.job_count <= 0:
+                continue
+            tree['total'] += int(row.job_count)
+
+            sido = tree['sido'].setdefault(row.region_1depth_name, dict(new_node(), sigungu={}))
+            add(sido, row)
+            if not row.region_2depth_name:
+                continue
+
+            sigungu = sido['sigungu'].setdefault(row.region_2depth_name, dict(new_node(), dong={}))
+            add(sigungu, row)
+            if row.region_3depth_name:
+                sigungu['dong'][row.region_3depth_name] = \
+                    sigungu['dong'].get(row.region_3depth_name, 0) + int(row.job_count)
+
+        # 좌표 합계를 평균 위치로 바꾸고 중간 값은 응답에서 제외
+        for sido in tree['sido'].values():
+            RegionService._finish_node(sido)
+            for sigungu in sido['sigungu'].values():
+                RegionService._finish_node(sigungu)
+
+        cache.set(cache_key, tree, timeout=current_app.config.get('REGION_COUNT_CACHE_TIMEOUT', 60))
+        return tree
+
+    @staticmethod
+    def _finish_node(node):
+        """좌표 합계 → 평균 위치"""
+        located = node.pop('located_count')
+        lat_sum = node.pop('lat_sum')
+        lng_sum = node.pop('lng_sum')
+        node['lat'] = lat_sum / located if located else None
+        node['lng'] = lng_sum / located if located else None
+
+    @staticmethod
+    def rebuild_counts():
+        """
+        지역별 공고 수 전체 재계산 (마감된 공고 행도 함께 정리)
+
+        Returns:
+            int: 생성된 행 수
+        """
+        today = datetime.utcnow().date()
+        jobs = db.session.query(
+            JobPost.region_1depth_name, JobPost.region_2depth_name, JobPost.region_3depth_name,
+            JobPost.recruitment_end_date, JobPost.latitude, JobPost.longitude
+        ).filter(
+            (JobPost.recruitment_end_date.is_(None)) | (JobPost.recruitment_end_date >= today)
+        ).all()
+
+        totals = {}
+        for job in jobs:
+            key = normalize_region_names(job.region_1depth_name, job.region_2depth_name, job.region_3depth_name) \
+                + (job.recruitment_end_date or OPEN_ENDED,)
+            counters = totals.setdefault(key, dict.fromkeys(COUNT_FIELDS, 0))
+            counters['job_count'] += 1
+            if job.latitude is not None and job.longitude is not None:
+                counters['located_count'] += 1
+                counters['lat_sum'] += job.latitude
+                counters['lng_sum'] += job.longitude
+
+        rows = [
+            dict({'region_1depth_name': sido, 'region_2depth_name': sigungu,
+                  'region_3depth_name': dong, 'end_date': end_date}, **counters)
+            for (sido, sigungu, dong, end_date), counters in totals.items()
+        ]
+
+        JobRegionCount.query.delete(synchronize_session=False)
+        if rows:
+            db.session.execute(JobRegionCount.__table__.insert(), rows)
+        db.session.commit()
+        return len(rows)
+
+    @staticmethod
+    def prune_expired():
+        """
+        마감일이 지난 집계 행 삭제 (조회에서는 이미 제외되므로 테이블 크기만 줄임)
+
+        Returns:
+            int: 삭제된 행 수
+        """
+        deleted = JobRegionCount.query.filter(JobRegionCount.end_date < datetime.utcnow().date())\
+                                      .delete(synchronize_session=False)
+        db.session.commit()
+        return deleted
@@ -0,0 +1,115 @@
+"""
+조회수 집계 서비스 모듈
+=====================
+
+공고 조회수를 요청마다 DB에 바로 반영하지 않고 메모리에 모았다가
+일정 주기마다 한 번에 반영(write-behind)합니다.
+
+주요 기능:
+- 사용자/공고별 중복 조회 제거 (새로고침으로 조회수가 부풀려지지 않도록)
+- 공고별 조회수 증가분 버퍼링
+- 배치 UPDATE (view_count = view_count + n) 로 일괄 반영
+
+중복 조회 판단에는 공용 캐시(utils.cache)를 사용하므로
+CACHE_TYPE=filesystem 이면 gunicorn 워커 간에도 중복이 제거됩니다.
+"""
+
+import atexit
+import threading
+import time
+from flask import current_app
+from sqlalchemy import bindparam
+from models import db, JobPost
+from services.job_stats_service import JobStatsService
+from utils.cache import cache
+
+
+class ViewCounterService:
+
+    _lock = threading.Lock()
+    _pending = {}            # {job_id: 아직 DB에 반영되지 않은 조회수}
+    _last_flush = time.monotonic()
+
+    @staticmethod
+    def init_app(app):
+        """프로세스 종료 시 남은 조회수를 반영하도록 등록"""
+        def _flush_on_exit():
+            with app.app_context():
+                ViewCounterService.flush()
+
+        atexit.register(_flush_on_exit)
+
+    @staticmethod
+    def record_view(job_id, user_id=None):
+        """
+        공고 조회 기록
+
+        Args:
+            job_id: 공고 ID
+            user_id: 조회한 사용자 ID (없으면 중복 제거 없이 집계)
+
+        Returns:
+            bool: 조회수에 반영되었는지 여부 (중복 조회면 False)
+        """
+        config = current_app.config
+
+        if user_id:
+            dedupe_key = f"job_view_seen:{user_id}:{job_id}"
+            # add()는 키가 이미 있으면 False 반환 → 중복 조회
+            if not cache.add(dedupe_key, 1, timeout=config.get('VIEW_COUNT_DEDUPE_SECONDS', 1800)):
+                return False
+
+        # 급상승 집계용 시간대별 통계
+        JobStatsService.record(job_id, 'view_count')
+
+        with ViewCounterService._lock:
+            ViewCounterService._pending[job_id] = ViewCounterService._pending.get(job_id, 0) + 1
+            pending_total = sum(ViewCounterService._pending.values())
+            elapsed = time.monotonic() - ViewCounterService._last_flush
+
+        if (pending_total >= config.get('VIEW_COUNT_FLUSH_THRESHOLD', 200)
+                or elapsed >= config.get('VIEW_COUNT_FLUSH_INTERVAL', 30)):
+            ViewCounterService.flush()
+
+        return True
+
+    @staticmethod
+    def get_pending(job_id):
+        """아직 DB에 반영되지 않은 조회수"""
+        return ViewCounterService._pending.get(job_id, 0)
+
+    @staticmethod
+    def flush():
+        """
+        버퍼에 쌓인 조회수를 DB에 일괄 반영
+
+        Returns:
+            int: 반영된 공고 수
+        """
+        with ViewCounterService._lock:
+            pending = ViewCounterService._pending
+            ViewCounterService._pending = {}
+            ViewCounterService._last_flush = time.monotonic()
+
+        if not pending:
+            return 0
+
+        table = JobPost.__table__
+        stmt = table.update()\
+                    .where(table.c.id == bindparam('b_job_id'))\
+                    .values(view_count=table.c.view_count + bindparam('b_views'))
+        params = [{'b_job_id': job_id, 'b_views': views} for job_id, views in pending.items()]
+
+        try:
+            # 요청의 세션과 분리된 별도 트랜잭션에서 executemany 로 반영
+            with db.engine.begin() as connection:
+                connection.execute(stmt, params)
+        except Exception as e:
+            print(f"조회수 반영 오류: {e}")
+            # 실패한 증가분은 다음 반영 때 다시 시도
+            with ViewCounterService._lock:
+                for job_id, views in pending.items():
+                    ViewCounterService._pending[job_id] = ViewCounterService._pending.get(job_id, 0) + views
+            return 0
+
+        return len(pending)
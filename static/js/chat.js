@@ -102,6 +102,12 @@ function createMessageElement(messageData, isOwn = false) {
   const timeDiv = document.createElement("div");
   timeDiv.className = "message-time";
   timeDiv.textContent = formatMessageTime(messageData.created_at);
+  if (isOwn && !isSystem && messageData.is_read) {
+    const readSpan = document.createElement("span");
+    readSpan.className = "message-read";
+    readSpan.textContent = "읽음";
+    timeDiv.appendChild(readSpan);
+  }
 
   contentDiv.appendChild(bubbleDiv);
   contentDiv.appendChild(timeDiv);
@@ -181,8 +187,143 @@ document.addEventListener("DOMContentLoaded", function () {
   }
 });
 
-// 실시간 메시지 업데이트 (폴링 방식)
+// 이전 메시지 불러오기 (채팅방은 최신 메시지부터 열림)
+let loadingOlderMessages = false;
+
+async function loadOlderMessages(roomId) {
+  const messagesContainer = document.getElementById("chatMessages");
+  const loadOlderBtn = document.getElementById("loadOlderBtn");
+  if (!messagesContainer || !loadOlderBtn || loadingOlderMessages) return;
+
+  const firstMessage = messagesContainer.querySelector("[data-message-id]");
+  if (!firstMessage) return;
+
+  loadingOlderMessages = true;
+  try {
+    const response = await apiRequest(
+      `/chat/${roomId}/messages?before_id=${firstMessage.dataset.messageId}`
+    );
+    if (!response.success) return;
+
+    // 위에 메시지를 붙여도 보고 있던 위치가 그대로 보이도록 스크롤 보정
+    const previousHeight = messagesContainer.scrollHeight;
+    const fragment = document.createDocumentFragment();
+    response.messages.forEach((messageData) => {
+      const isOwn = messageData.sender_id === getCurrentUserId();
+      fragment.appendChild(createMessageElement(messageData, isOwn));
+    });
+    loadOlderBtn.after(fragment);
+    messagesContainer.scrollTop += messagesContainer.scrollHeight - previousHeight;
+
+    if (!response.has_more) {
+      loadOlderBtn.remove();
+    }
+  } catch (error) {
+    console.error("이전 메시지 불러오기 오류:", error);
+  } finally {
+    loadingOlderMessages = false;
+  }
+}
+
+// 맨 위까지 스크롤하면 이전 메시지 불러오기
+function enableScrollBack(roomId) {
+  const messagesContainer = document.getElementById("chatMessages");
+  if (!messagesContainer) return;
+
+  messagesContainer.addEventListener("scroll", () => {
+    if (messagesContainer.scrollTop < 50) {
+      loadOlderMessages(roomId);
+    }
+  });
+}
+
+// 실시간 메시지 업데이트 (SSE, EventSource 가 없는 브라우저는 폴링)
+let messageStream;
 let messagePollingInterval;
+let markReadTimer;
+
+function startMessageStream(roomId) {
+  stopMessageStream();
+
+  if (!window.EventSource) {
+    startMessagePolling(roomId);
+    return;
+  }
+
+  // 화면에 있는 마지막 메시지 이후부터 받음 (재연결 시에는 브라우저가 Last-Event-ID 를 보냄)
+  // 메시지가 없으면 0 을 보내 화면을 그린 뒤 구독 전까지 온 메시지도 받음
+  messageStream = new EventSource(
+    `/chat/${roomId}/stream?after_id=${getLastMessageId()}`
+  );
+
+  messageStream.addEventListener("message", (event) => {
+    const messageData = JSON.parse(event.data);
+    const isOwn = messageData.sender_id === getCurrentUserId();
+    addMessageToChat(messageData, isOwn);
+    scrollToBottom();
+
+    if (!isOwn) {
+      scheduleMarkAsRead(roomId);
+    }
+  });
+
+  messageStream.addEventListener("read", (event) => {
+    const readData = JSON.parse(event.data);
+    if (readData.reader_id !== getCurrentUserId()) {
+      markOwnMessagesRead(readData.last_read_id);
+    }
+  });
+}
+
+function stopMessageStream() {
+  if (messageStream) {
+    messageStream.close();
+    messageStream = null;
+  }
+  stopMessagePolling();
+}
+
+// 보고 있는 중에 받은 메시지 읽음 처리 (연달아 받으면 한 번만 요청)
+function scheduleMarkAsRead(roomId) {
+  if (markReadTimer) {
+    return;
+  }
+  markReadTimer = setTimeout(async () => {
+    markReadTimer = null;
+    try {
+      await apiRequest(`/chat/${roomId}/read`, { method: "POST" });
+    } catch (error) {
+      console.error("읽음 처리 오류:", error);
+    }
+  }, 500);
+}
+
+// 상대방이 읽은 내 메시지에 읽음 표시
+function markOwnMessagesRead(lastReadId) {
+  document
+    .querySelectorAll("#chatMessages .message.own[data-message-id]")
+    .forEach((messageDiv) => {
+      if (
+        parseInt(messageDiv.dataset.messageId) <= lastReadId &&
+        !messageDiv.querySelector(".message-read")
+      ) {
+        const readSpan = document.createElement("span");
+        readSpan.className = "message-read";
+        readSpan.textContent = "읽음";
+        messageDiv.querySelector(".message-time").appendChild(readSpan);
+      }
+    });
+}
+
+// 화면에 있는 마지막 메시지 ID
+function getLastMessageId() {
+  const ids = Array.from(
+    document.querySelectorAll("#chatMessages [data-message-id]")
+  )
+    .map((messageDiv) => parseInt(messageDiv.dataset.messageId))
+    .filter((id) => !isNaN(id));
+  return ids.length ? Math.max(...ids) : 0;
+}
 
 function startMessagePolling(roomId) {
   // 기존 폴링 중지
@@ -190,11 +331,11 @@ function startMessagePolling(roomId) {
     clearInterval(messagePollingInterval);
   }
 
-  // 5초마다 새 메시지 확인
+  // 5초마다 화면의 마지막 메시지 이후 새 메시지 확인
   messagePollingInterval = setInterval(async () => {
     try {
       const response = await apiRequest(
-        `/chat/${roomId}/messages?page=1&per_page=10`
+        `/chat/${roomId}/messages?after_id=${getLastMessageId()}`
       );
       if (response.success) {
         updateChatMessages(response.messages);
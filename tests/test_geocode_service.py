@@ -0,0 +1,237 @@
+"""
+GeocodeService 테스트
+
+로컬 http.server 가짜 카카오 API 에 KAKAO_LOCAL_API_URL 을 연결해
+메모리 LRU → geocode_cache 테이블 → 공유 세션(연결 풀) 순서의 조회, 캐시 만료, 타임아웃을 확인합니다.
+"""
+
+import json
+import threading
+import time
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+from flask import Flask
+
+from models import db, GeocodeCache
+from services.geocode_service import GeocodeService, _query_hash
+
+SLOW_QUERY = '느린 주소'
+
+
+def kakao_response(query):
+    """카카오 주소 검색 응답 형식 (검색어를 주소 이름으로 돌려줌)"""
+    return {
+        'documents': [{
+            'address_name': query,
+            'x': '127.0276',
+            'y': '37.4979',
+            'address': {
+                'region_1depth_name': '서울',
+                'region_2depth_name': '강남구',
+                'region_3depth_name': '역삼동'
+            }
+        }],
+        'meta': {'total_count': 1}
+    }
+
+
+class FakeKakaoHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'  # keep-alive (연결 재사용 확인용)
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        query = parse_qs(url.query).get('query', [''])[0]
+        self.server.requests.append({
+            'path': url.path,
+            'query': query,
+            'authorization': self.headers.get('Authorization'),
+            'client': self.client_address
+        })
+
+        if query == SLOW_QUERY:
+            time.sleep(self.server.slow_seconds)
+
+        body = json.dumps(kakao_response(query), ensure_ascii=False).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        try:
+            self.wfile.write(body)
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # 타임아웃으로 클라이언트가 먼저 끊음
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def kakao_server():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), FakeKakaoHandler)
+    server.daemon_threads = True
+    server.requests = []
+    server.slow_seconds = 5.0
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def app(kakao_server):
+    app = Flask(__name__)
+    app.config.update(
+        TESTING=True,
+        SQLALCHEMY_DATABASE_URI='sqlite://',
+        KAKAO_REST_API_KEY='test-key',
+        KAKAO_LOCAL_API_URL=f'http://127.0.0.1:{kakao_server.server_address[1]}/',
+        GEOCODE_LRU_SIZE=2,
+        GEOCODE_CACHE_TTL_DAYS=30,
+        GEOCODE_POOL_SIZE=2,
+        GEOCODE_CONNECT_TIMEOUT=1,
+        GEOCODE_READ_TIMEOUT=0.2
+    )
+    db.init_app(app)
+
+    # 서비스 상태는 클래스 변수라 테스트마다 초기화
+    GeocodeService._lru.clear()
+    GeocodeService._session = None
+
+    with app.app_context():
+        GeocodeCache.__table__.create(db.engine)
+        yield app
+        db.session.remove()
+        GeocodeCache.__table__.drop(db.engine)
+
+    if GeocodeService._session is not None:
+        GeocodeService._session.close()
+        GeocodeService._session = None
+    GeocodeService._lru.clear()
+
+
+def add_cache_row(query, expires_at, address_name):
+    db.session.add(GeocodeCache(
+        query_hash=_query_hash(query),
+        query=query,
+        response=json.dumps(kakao_response(address_name), ensure_ascii=False),
+        expires_at=expires_at
+    ))
+    db.session.commit()
+
+
+def test_api_request(app, kakao_server):
+    result = GeocodeService.geocode('서울 강남구 역삼동')
+
+    assert result['latitude'] == pytest.approx(37.4979)
+    assert result['longitude'] == pytest.approx(127.0276)
+    assert result['region_2depth_name'] == '강남구'
+
+    [request] = kakao_server.requests
+    assert request['path'] == '/v2/local/search/address.json'
+    assert request['query'] == '서울 강남구 역삼동'
+    assert request['authorization'] == 'KakaoAK test-key'
+
+
+def test_lru_hit_uses_normalized_query(app, kakao_server):
+    first = GeocodeService.search_address('서울  강남구 역삼동 ')
+    second = GeocodeService.search_address(' 서울 강남구   역삼동')
+
+    assert second == first
+    assert len(kakao_server.requests) == 1
+
+
+def test_lru_evicts_least_recently_used(app, kakao_server):
+    GeocodeService.search_address('주소 1')
+    GeocodeService.search_address('주소 2')
+    GeocodeService.search_address('주소 1')   # 최근 사용으로 갱신
+    GeocodeService.search_address('주소 3')   # GEOCODE_LRU_SIZE=2 → '주소 2' 제거
+
+    assert list(GeocodeService._lru) == ['주소 1', '주소 3']
+
+
+def test_db_cache_hit(app, kakao_server):
+    add_cache_row('서울 강남구 역삼동', datetime.utcnow() + timedelta(days=1), 'DB 캐시')
+
+    result = GeocodeService.geocode('서울 강남구 역삼동')
+
+    assert result['address_name'] == 'DB 캐시'
+    assert kakao_server.requests == []
+    assert '서울 강남구 역삼동' in GeocodeService._lru  # 다음 조회는 메모리에서
+
+
+def test_expired_lru_falls_back_to_db_cache(app, kakao_server):
+    GeocodeService._lru['서울 강남구 역삼동'] = (
+        datetime.utcnow() - timedelta(seconds=1), kakao_response('만료된 LRU')
+    )
+    add_cache_row('서울 강남구 역삼동', datetime.utcnow() + timedelta(days=1), 'DB 캐시')
+
+    result = GeocodeService.geocode('서울 강남구 역삼동')
+
+    assert result['address_name'] == 'DB 캐시'
+    assert kakao_server.requests == []
+
+
+def test_api_response_stored_in_db_cache(app, kakao_server):
+    GeocodeService.search_address('서울  강남구 역삼동')
+
+    cached = db.session.get(GeocodeCache, _query_hash('서울 강남구 역삼동'))
+    assert cached is not None
+    assert cached.query == '서울 강남구 역삼동'
+    assert json.loads(cached.response) == kakao_response('서울 강남구 역삼동')
+    assert cached.expires_at > datetime.utcnow() + timedelta(days=29)
+
+    # 다른 워커(빈 메모리 LRU)에서는 DB 캐시로 조회
+    GeocodeService._lru.clear()
+    assert GeocodeService.search_address('서울 강남구 역삼동') == kakao_response('서울 강남구 역삼동')
+    assert len(kakao_server.requests) == 1
+
+
+def test_expired_db_cache_requests_api(app, kakao_server):
+    add_cache_row('서울 강남구 역삼동', datetime.utcnow() - timedelta(seconds=1), '만료된 DB 캐시')
+
+    result = GeocodeService.geocode('서울 강남구 역삼동')
+
+    assert result['address_name'] == '서울 강남구 역삼동'
+    assert len(kakao_server.requests) == 1
+
+    expires_at, _ = GeocodeService._lru['서울 강남구 역삼동']
+    assert expires_at > datetime.utcnow() + timedelta(days=29)  # GEOCODE_CACHE_TTL_DAYS 적용
+
+    # 만료된 DB 캐시 행은 새 응답으로 갱신
+    db.session.expire_all()
+    cached = db.session.get(GeocodeCache, _query_hash('서울 강남구 역삼동'))
+    assert json.loads(cached.response) == kakao_response('서울 강남구 역삼동')
+    assert cached.expires_at == expires_at
+
+
+def test_api_requests_share_pooled_connection(app, kakao_server):
+    GeocodeService.search_address('주소 1')
+    GeocodeService.search_address('주소 2')
+    GeocodeService.search_address('주소 3')
+
+    assert len(kakao_server.requests) == 3
+    assert len({request['client'] for request in kakao_server.requests}) == 1
+
+
+def test_read_timeout_returns_none(app, kakao_server):
+    started = time.monotonic()
+    result = GeocodeService.search_address(SLOW_QUERY)
+    elapsed = time.monotonic() - started
+
+    assert result is None
+    assert elapsed < kakao_server.slow_seconds  # 재시도를 포함해도 느린 응답을 기다리지 않음
+    assert SLOW_QUERY not in GeocodeService._lru  # 실패는 캐시하지 않음
+
+    # 타임아웃 뒤에도 다른 주소는 정상 조회
+    assert GeocodeService.geocode('서울 강남구 역삼동')['region_2depth_name'] == '강남구'
+
+
+def test_missing_api_key_skips_request(app, kakao_server):
+    app.config['KAKAO_REST_API_KEY'] = None
+
+    assert GeocodeService.search_address('서울 강남구 역삼동') is None
+    assert kakao_server.requests == []
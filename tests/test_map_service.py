@@ -0,0 +1,68 @@
+"""
+MapService 클러스터 격자 증분 갱신 테스트 (SQLite 메모리 DB)
+"""
+
+import pytest
+from flask import Flask
+
+from models import db, JobMapCell
+from services.map_service import CLUSTER_CELL_DEGREES, MapService
+
+# 모든 확대 레벨에서 같은 격자 칸에 들어가는 두 좌표
+POSITION = (37.001, 127.001)
+MOVED_POSITION = (37.009, 127.009)
+
+
+@pytest.fixture
+def app():
+    app = Flask(__name__)
+    app.config.update(TESTING=True, SQLALCHEMY_DATABASE_URI='sqlite://')
+    db.init_app(app)
+
+    with app.app_context():
+        JobMapCell.__table__.create(db.engine)
+        yield app
+        db.session.remove()
+        JobMapCell.__table__.drop(db.engine)
+
+
+def clusters(level):
+    """POSITION 주변 뷰포트의 클러스터"""
+    return MapService.get_clusters_in_bounds(level, 36.9, 126.9, 37.1, 127.1)
+
+
+def test_new_post_adds_to_cell(app):
+    MapService.update_clusters(None, POSITION)
+    db.session.commit()
+
+    for level in CLUSTER_CELL_DEGREES:
+        [cluster] = clusters(level)
+        assert cluster['count'] == 1
+        assert cluster['lat'] == pytest.approx(POSITION[0])
+        assert cluster['lng'] == pytest.approx(POSITION[1])
+
+
+def test_move_within_cell_updates_centroid(app):
+    MapService.update_clusters(None, POSITION)
+    MapService.update_clusters(None, (37.005, 127.005))
+    db.session.commit()
+
+    MapService.update_clusters(POSITION, MOVED_POSITION)
+    db.session.commit()
+
+    for level in CLUSTER_CELL_DEGREES:
+        [cluster] = clusters(level)
+        assert cluster['count'] == 2
+        assert cluster['lat'] == pytest.approx((MOVED_POSITION[0] + 37.005) / 2)
+        assert cluster['lng'] == pytest.approx((MOVED_POSITION[1] + 127.005) / 2)
+
+
+def test_removed_post_leaves_empty_cell_hidden(app):
+    MapService.update_clusters(None, POSITION)
+    db.session.commit()
+
+    MapService.update_clusters(POSITION, None)
+    db.session.commit()
+
+    for level in CLUSTER_CELL_DEGREES:
+        assert clusters(level) == []
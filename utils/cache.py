@@ -0,0 +1,29 @@
+"""
+공용 캐시 모듈
+=============
+
+cachelib 기반의 애플리케이션 공용 캐시 객체를 제공합니다.
+
+- CACHE_TYPE=filesystem: CACHE_DIR 아래 파일 캐시 (gunicorn 워커 간 공유)
+- 그 외(기본값 simple): 프로세스 메모리 캐시
+"""
+
+from cachelib import FileSystemCache, SimpleCache
+from config import Config
+
+
+def _create_cache():
+    """설정에 맞는 캐시 백엔드 생성"""
+    if Config.CACHE_TYPE == "filesystem":
+        return FileSystemCache(
+            Config.CACHE_DIR,
+            threshold=Config.CACHE_THRESHOLD,
+            default_timeout=Config.CACHE_DEFAULT_TIMEOUT
+        )
+    return SimpleCache(
+        threshold=Config.CACHE_THRESHOLD,
+        default_timeout=Config.CACHE_DEFAULT_TIMEOUT
+    )
+
+
+cache = _create_cache()
@@ -0,0 +1,267 @@
+"""
+법정동 데이터 빌드 모듈
+=====================
+
+국토교통부 전국 법정동 CSV 새 배포본으로 data/sido.json, sigungu.json, dong.json 과
+data/regions.bin 을 다시 만들고, 현재 데이터와 비교한 변경 보고서를 씁니다.
+
+- CSV 는 한 줄씩 읽어 존재하는 법정동만 모음 (폐지된 행은 후속 코드 추적에만 사용)
+- 현재 데이터(regions.bin)와 코드 기준으로 비교해 신설/명칭 변경/폐지를 구분
+- 바뀐 것이 없으면 아무 파일도 다시 쓰지 않음
+- JSON 은 한 줄에 한 항목인 압축 형식으로 쓰고, 이어서 regions.bin(조회 인덱스 포함)을 컴파일
+- 폐지된 코드는 후속 코드로 연결해 보고서의 code_map 에 담음
+  (`flask migrate-region-codes <보고서>` 로 저장된 공고/사용자 region_code 일괄 변경)
+
+후속 코드 찾는 순서:
+1. CSV 과거법정동코드 (새 코드 행에 예전 코드가 적혀 있음, 여러 번 바뀌었으면 끝까지 따라감)
+2. 새 배포본에서 전체 이름이 같은 코드 (같은 단계에서 하나뿐일 때)
+3. 남아 있는 상위 지역 코드 (읍/면/동 → 시/군/구 → 시/도)
+
+Flask 에 의존하지 않습니다.
+"""
+
+import csv
+import json
+import os
+import re
+from collections import OrderedDict
+from utils.region_data import DATA_DIR, DONG, REGION_DATA_PATH, compile_region_data, get_region_data
+
+# 배포본 파일 이름의 날짜 ('국토교통부_전국 법정동_20250415.csv' → '20250415')
+RELEASE_DATE = re.compile(r'(\d{8})')
+
+# 후속 코드를 찾을 때 거슬러 올라가는 상위 지역 코드 길이 (읍/면/동, 시/군/구, 시/도)
+ANCESTOR_DIGITS = (8, 5, 2)
+
+# 과거법정동코드를 따라가는 최대 횟수 (순환 방지)
+MAX_SUCCESSOR_HOPS = 10
+
+
+def release_name(csv_path):
+    """CSV 파일 이름의 날짜 (없으면 확장자를 뗀 파일 이름)"""
+    filename = os.path.splitext(os.path.basename(csv_path))[0]
+    match = RELEASE_DATE.search(filename)
+    return match.group(1) if match else filename
+
+
+def read_release(csv_path, encoding='utf-8-sig'):
+    """
+    법정동 CSV 한 줄씩 읽기
+
+    Yields:
+        tuple: (법정동 코드, 시/도, 시/군/구, 읍/면/동, 폐지 여부, 과거 법정동 코드)
+    """
+    with open(csv_path, encoding=encoding, newline='') as csvfile:
+        for row in csv.DictReader(csvfile):
+            yield (
+                row['법정동코드'].strip(),
+                row['시도명'].strip(),
+                row['시군구명'].strip(),
+                row['읍면동명'].strip(),
+                bool(row['삭제일자'].strip()),
+                (row.get('과거법정동코드') or '').strip()
+            )
+
+
+class Release:
+    """
+    배포본 하나의 존재하는 법정동 (CSV 순서 유지)
+
+    Attributes:
+        sido: {시/도 코드(2자리): 이름}
+        sigungu: {시/군/구 코드(5자리): {"code", "name", "sido_code"}}
+        dong: {법정동 코드(10자리): {"code", "name", "sigungu_code"}}
+        predecessors: {예전 코드: 새 코드} (과거법정동코드)
+    """
+
+    def __init__(self, rows):
+        self.sido = OrderedDict()
+        self.sigungu = OrderedDict()
+        self.dong = OrderedDict()
+        self.predecessors = {}
+
+        for code, sido_name, sigungu_name, dong_name, deleted, past_code in rows:
+            if deleted:
+                continue
+
+            sido_code = code[:2]
+            sigungu_code = code[:5]
+
+            if past_code and past_code != code:
+                self.predecessors.setdefault(past_code, code)
+
+            self.sido.setdefault(sido_code, sido_name)
+            if sigungu_code not in self.sigungu:
+                self.sigungu[sigungu_code] = {
+                    "code": sigungu_code,
+                    "name": f"{sido_name} {sigungu_name}",
+                    "sido_code": sido_code
+                }
+            if code not in self.dong:
+                self.dong[code] = {
+                    "code": code,
+                    "name": f"{sido_name} {sigungu_name} {dong_name}",
+                    "sigungu_code": sigungu_code
+                }
+
+    def names(self):
+        """{법정동 코드: 전체 이름}"""
+        return {code: item["name"] for code, item in self.dong.items()}
+
+
+def current_names():
+    """현재 데이터(regions.bin)의 {법정동 코드: 전체 이름}"""
+    return {str(code): name for code, name in get_region_data().records(DONG)}
+
+
+def _is_ri(code):
+    return code[-2:] != '00'
+
+
+def find_successor(code, name, release, names_by_full_name):
+    """
+    폐지된 코드의 후속 코드
+
+    Args:
+        code: 폐지된 법정동 코드
+        name: 폐지 전 전체 이름
+        release: 새 배포본
+        names_by_full_name: 새 배포본의 {전체 이름: [법정동 코드]}
+
+    Returns:
+        tuple: (후속 코드, 찾은 방법 'predecessor' | 'name' | 'ancestor'), 없으면 (None, None)
+    """
+    successor = code
+    for _ in range(MAX_SUCCESSOR_HOPS):
+        successor = release.predecessors.get(successor)
+        if successor is None:
+            break
+        if successor in release.dong:
+            return successor, 'predecessor'
+
+    same_name = [
+        candidate for candidate in names_by_full_name.get(name, ())
+        if _is_ri(candidate) == _is_ri(code)
+    ]
+    if len(same_name) == 1:
+        return same_name[0], 'name'
+
+    for digits in ANCESTOR_DIGITS:
+        ancestor = code[:digits].ljust(10, '0')
+        if ancestor != code and ancestor in release.dong:
+            return ancestor, 'ancestor'
+    return None, None
+
+
+def diff_release(previous, release):
+    """
+    현재 데이터와 새 배포본 비교
+
+    Args:
+        previous: 현재 {법정동 코드: 전체 이름}
+        release: 새 배포본 (Release)
+
+    Returns:
+        dict: {
+            'added': [{"code", "name"}],
+            'renamed': [{"code", "old_name", "new_name"}],
+            'abolished': [{"code", "name", "successor", "method"}],
+            'code_map': {폐지된 코드: 후속 코드}
+        }
+    """
+    current = release.names()
+
+    names_by_full_name = {}
+    for code, name in current.items():
+        names_by_full_name.setdefault(name, []).append(code)
+
+    added = [
+        {"code": code, "name": name}
+        for code, name in current.items() if code not in previous
+    ]
+    renamed = [
+        {"code": code, "old_name": previous[code], "new_name": name}
+        for code, name in current.items()
+        if code in previous and previous[code] != name
+    ]
+
+    abolished = []
+    code_map = {}
+    for code in sorted(set(previous) - set(current)):
+        successor, method = find_successor(code, previous[code], release, names_by_full_name)
+        abolished.append({"code": code, "name": previous[code], "successor": successor, "method": method})
+        if successor:
+            code_map[code] = successor
+
+    return {'added': added, 'renamed': renamed, 'abolished': abolished, 'code_map': code_map}
+
+
+def _write_json_lines(path, items):
+    """한 줄에 한 항목인 압축 JSON 배열 (임시 파일에 쓴 뒤 교체)"""
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write('[')
+        for i, item in enumerate(items):
+            f.write(',\n' if i else '\n')
+            f.write(json.dumps(item, ensure_ascii=False, separators=(',', ':')))
+        f.write('\n]\n')
+    os.replace(tmp_path, path)
+
+
+def write_release(release):
+    """새 배포본으로 data/*.json 과 regions.bin 다시 쓰기"""
+    os.makedirs(DATA_DIR, exist_ok=True)
+    _write_json_lines(
+        os.path.join(DATA_DIR, 'sido.json'),
+        ({"code": code, "name": name} for code, name in release.sido.items())
+    )
+    _write_json_lines(os.path.join(DATA_DIR, 'sigungu.json'), release.sigungu.values())
+    _write_json_lines(os.path.join(DATA_DIR, 'dong.json'), release.dong.values())
+    return compile_region_data(REGION_DATA_PATH)
+
+
+def build(csv_path, report_path=None, encoding='utf-8-sig', dry_run=False, force=False):
+    """
+    새 배포본을 현재 데이터와 비교해 바뀌었으면 데이터 파일과 변경 보고서를 씀
+
+    Args:
+        csv_path: 법정동 CSV 경로
+        report_path: 변경 보고서 경로 (기본: data/region_migration_<배포일>.json)
+        encoding: CSV 인코딩 (배포본에 따라 'cp949')
+        dry_run: True 면 비교만 하고 파일은 쓰지 않음
+        force: True 면 바뀐 것이 없어도 데이터 파일을 다시 씀 (보고서는 쓰지 않음)
+
+    Returns:
+        dict: 변경 보고서 (보고서를 쓰지 않았으면 report_path 는 None)
+    """
+    release = Release(read_release(csv_path, encoding))
+    if not release.dong:
+        raise ValueError(f"법정동이 없는 CSV 입니다: {csv_path}")
+
+    previous = current_names()
+    name = release_name(csv_path)
+    report = {
+        'release': name,
+        'previous_version': get_region_data().version,
+        **diff_release(previous, release)
+    }
+
+    if dry_run:
+        return dict(report, report_path=None)
+
+    changed = report['added'] or report['renamed'] or report['abolished']
+    if changed or force:
+        write_release(release)
+    if not changed:
+        return dict(report, report_path=None)
+
+    report_path = report_path or os.path.join(DATA_DIR, f"region_migration_{name}.json")
+    with open(report_path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    return dict(report, report_path=report_path)
+
+
+def load_code_map(report_path):
+    """변경 보고서의 {폐지된 코드: 후속 코드}"""
+    with open(report_path, encoding='utf-8') as f:
+        return json.load(f).get('code_map', {})
@@ -0,0 +1,372 @@
+"""
+지역(법정동) 데이터 모듈
+======================
+
+지역 선택기 API 가 쓰는 시/도, 시/군/구, 읍/면/동 목록을 압축된 바이너리 파일
+(data/regions.bin)로 컴파일해 두고 메모리 매핑으로 읽습니다.
+
+- 처음 사용할 때 로드 (import 시점에 JSON 을 파싱하지 않음)
+- 읽기 전용 mmap 이라 gunicorn 워커들이 같은 페이지 캐시를 공유
+- 법정동 코드 오름차순으로 저장하므로 하위 지역은 코드 범위 이진 탐색으로 찾음
+  (시/군/구 코드 = 법정동 코드 앞 5자리, 시/도 코드 = 앞 2자리)
+- 요청에 실제로 쓰인 응답(JSON)만 워커별로 만들어 재사용
+
+지역 계층 API(/api/areas/tree, /api/areas/dong/<시/군/구 코드>) 응답은 컴파일할 때
+JSON 과 gzip 으로 미리 만들어 같은 파일에 넣어 두고, 요청 시에는 그대로 내려보냅니다.
+
+regions.bin 은 data/*.json 보다 오래됐거나 없으면(형식이 바뀌었으면) 자동으로 다시 만듭니다.
+Flask 에 의존하지 않으므로 스크립트/벤치마크에서도 그대로 사용할 수 있습니다.
+
+파일 구조 (네이티브 바이트 순서):
+    헤더 | 시/도 코드(int64) + 이름 오프셋(uint32) | 시/군/구 ... | 읍/면/동 ...
+         | 응답 키(int64) + 오프셋(uint32) | 이름(UTF-8) | 응답(JSON, gzip 번갈아)
+"""
+
+import gzip
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+import threading
+from array import array
+from bisect import bisect_left
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data")
+REGION_DATA_PATH = os.path.join(DATA_DIR, "regions.bin")
+SOURCE_FILES = ("sido.json", "sigungu.json", "dong.json")
+
+# 매직, 리틀 엔디언 여부, 시/도·시/군/구·읍/면/동 개수, 이름 영역 크기, 응답 개수, 응답 영역 크기, 데이터 버전
+HEADER = struct.Struct("<4sB3xIIIIII8s")
+MAGIC = b"RGN2"
+
+# 미리 만든 응답 키 (0: 시/도 → 시/군/구 트리, 그 외: 시/군/구 코드 → 읍/면/동 목록)
+TREE_KEY = 0
+
+SIDO, SIGUNGU, DONG = 0, 1, 2
+
+# 하위 지역 코드 범위 계산용 (시/도 코드 × SIDO_SPAN = 그 시/도 첫 시/군/구 코드)
+SIDO_SPAN = 1000
+SIGUNGU_SPAN = 100000
+
+EMPTY_PAYLOAD = b"[]"
+
+
+def last_token(s):
+    return s.split()[-1] if s else s
+
+
+def _dump(names):
+    """지역 선택기 응답 [{"name": ...}] 을 JSON 바이트로"""
+    return json.dumps([{"name": name} for name in names], separators=(",", ":")).encode("utf-8")
+
+
+def _load_json(filename):
+    try:
+        with open(os.path.join(DATA_DIR, filename), encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError as e:
+        print(f"Warning: {e}")
+        return []
+
+
+def _pad(buffer, alignment=8):
+    buffer.extend(b"\0" * (-len(buffer) % alignment))
+
+
+def _is_dong_level(code):
+    """읍/면/동 단위 법정동 코드인지 (시/도, 시/군/구 자체 행과 리 단위 제외)"""
+    return code // 100 % 1000 != 0 and code % 100 == 0
+
+
+def _build_payloads(sections):
+    """
+    지역 계층 API 응답 (JSON)
+
+    Returns:
+        list: [(응답 키, JSON 바이트)] 키 오름차순
+    """
+    sido_records, sigungu_records, dong_records = sections
+
+    def dumps(value):
+        return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    sigungu_by_sido = {}
+    for code, name in sigungu_records:
+        if code % SIDO_SPAN:  # 시/도 자체 행 제외
+            sigungu_by_sido.setdefault(code // SIDO_SPAN, []).append(
+                {"code": str(code), "name": last_token(name)}
+            )
+
+    tree = {"sido": [
+        {"code": str(code), "name": name, "sigungu": sigungu_by_sido.get(code, [])}
+        for code, name in sido_records
+    ]}
+
+    dong_by_sigungu = {}
+    for code, name in dong_records:
+        if _is_dong_level(code):
+            dong_by_sigungu.setdefault(code // SIGUNGU_SPAN, []).append(
+                {"code": str(code), "name": last_token(name)}
+            )
+
+    payloads = [(TREE_KEY, dumps(tree))]
+    payloads.extend(
+        (code, dumps(dong_by_sigungu.get(code, [])))
+        for code, _ in sigungu_records if code % SIDO_SPAN
+    )
+    return payloads
+
+
+def compile_region_data(path=REGION_DATA_PATH):
+    """
+    data/sido.json, sigungu.json, dong.json → regions.bin
+
+    읽는 프로세스가 쓰다 만 파일을 보지 않도록 임시 파일에 쓴 뒤 교체합니다.
+
+    Returns:
+        int: 파일 크기 (바이트)
+    """
+    sections = [
+        sorted((int(item["code"]), item["name"]) for item in _load_json(filename))
+        for filename in SOURCE_FILES
+    ]
+
+    names = bytearray()
+    body = bytearray(HEADER.size)
+    _pad(body)
+    for records in sections:
+        offsets = array("I")
+        for _, name in records:
+            offsets.append(len(names))
+            names.extend(name.encode("utf-8"))
+        offsets.append(len(names))
+
+        body.extend(array("q", (code for code, _ in records)).tobytes())
+        body.extend(offsets.tobytes())
+        _pad(body)
+
+    # 데이터 버전 (ETag 용): 코드와 이름이 같으면 같은 값
+    version = hashlib.sha1(bytes(body) + bytes(names)).digest()[:8]
+
+    payloads = _build_payloads(sections)
+    blob = bytearray()
+    offsets = array("I")
+    for _, raw in payloads:
+        offsets.append(len(blob))
+        blob.extend(raw)
+        offsets.append(len(blob))
+        blob.extend(gzip.compress(raw, compresslevel=9, mtime=0))
+    offsets.append(len(blob))
+
+    body.extend(array("q", (key for key, _ in payloads)).tobytes())
+    body.extend(offsets.tobytes())
+    _pad(body)
+
+    body[:HEADER.size] = HEADER.pack(
+        MAGIC, sys.byteorder == "little", *(len(records) for records in sections), len(names),
+        len(payloads), len(blob), version
+    )
+    body.extend(names)
+    body.extend(blob)
+
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(body)
+    os.replace(tmp_path, path)
+    return len(body)
+
+
+class RegionData:
+    """
+    메모리 매핑된 지역 데이터
+
+    코드/이름 배열은 mmap 위의 memoryview 라 파이썬 객체로 풀어 두지 않습니다.
+    """
+
+    def __init__(self, path=REGION_DATA_PATH):
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        view = memoryview(self._mmap)
+        if len(view) < HEADER.size:
+            raise ValueError(f"지원하지 않는 지역 데이터 파일: {path}")
+        magic, little, *counts, names_size, payload_count, payload_size, version = HEADER.unpack_from(view)
+        if magic != MAGIC or bool(little) != (sys.byteorder == "little"):
+            raise ValueError(f"지원하지 않는 지역 데이터 파일: {path}")
+        self.version = version.hex()
+
+        self._codes = []
+        self._offsets = []
+        position = HEADER.size + (-HEADER.size % 8)
+        for count in counts:
+            self._codes.append(view[position:position + count * 8].cast("q"))
+            position += count * 8
+            self._offsets.append(view[position:position + (count + 1) * 4].cast("I"))
+            position += (count + 1) * 4
+            position += -position % 8
+
+        self._payload_keys = view[position:position + payload_count * 8].cast("q")
+        position += payload_count * 8
+        self._payload_offsets = view[position:position + (payload_count * 2 + 1) * 4].cast("I")
+        position += (payload_count * 2 + 1) * 4
+        position += -position % 8
+
+        self._names = view[position:position + names_size]
+        position += names_size
+        self._payloads = view[position:position + payload_size]
+
+        self._lock = threading.Lock()
+        self._sido_codes = None
+        self._sigungu_payloads = {}
+        self._dong_payloads = {}
+        self._sido_payload = None
+
+    def count(self, section):
+        return len(self._codes[section])
+
+    def name(self, section, i):
+        offsets = self._offsets[section]
+        return str(self._names[offsets[i]:offsets[i + 1]], "utf-8")
+
+    def _range(self, section, start_code, end_code):
+        """코드가 [start_code, end_code) 인 항목 인덱스 범위"""
+        codes = self._codes[section]
+        return range(bisect_left(codes, start_code), bisect_left(codes, end_code))
+
+    def _sido_code(self, sido_name):
+        """시/도 이름 → 코드 (17개뿐이라 처음 한 번 사전으로 만듦)"""
+        if self._sido_codes is None:
+            sido_codes = {}
+            for i in range(self.count(SIDO)):
+                sido_codes.setdefault(self.name(SIDO, i), self._codes[SIDO][i])
+            self._sido_codes = sido_codes
+        return self._sido_codes.get(sido_name)
+
+    @property
+    def sido_payload(self):
+        """시/도 목록 응답"""
+        if self._sido_payload is None:
+            self._sido_payload = _dump(self.name(SIDO, i) for i in range(self.count(SIDO)))
+        return self._sido_payload
+
+    def sigungu_payload(self, sido_name):
+        """시/도의 시/군/구 목록 응답 (없으면 빈 목록)"""
+        payload = self._sigungu_payloads.get(sido_name)
+        if payload is not None:
+            return payload
+
+        sido_code = self._sido_code(sido_name)
+        if sido_code is None:
+            return EMPTY_PAYLOAD
+
+        payload = _dump(
+            last_token(self.name(SIGUNGU, i))
+            for i in self._range(SIGUNGU, sido_code * SIDO_SPAN, (sido_code + 1) * SIDO_SPAN)
+        )
+        with self._lock:
+            self._sigungu_payloads[sido_name] = payload
+        return payload
+
+    def dong_payload(self, sido_name, sigungu_name):
+        """시/군/구의 읍/면/동 목록 응답 (없으면 빈 목록)"""
+        key = (sido_name, sigungu_name)
+        payload = self._dong_payloads.get(key)
+        if payload is not None:
+            return payload
+
+        sido_code = self._sido_code(sido_name)
+        if sido_code is None:
+            return EMPTY_PAYLOAD
+
+        # 같은 시/도 안에서 이름이 같은 첫 번째 시/군/구 (시/도당 수십 개)
+        sigungu_code = next(
+            (
+                self._codes[SIGUNGU][i]
+                for i in self._range(SIGUNGU, sido_code * SIDO_SPAN, (sido_code + 1) * SIDO_SPAN)
+                if last_token(self.name(SIGUNGU, i)) == sigungu_name
+            ),
+            None
+        )
+        if sigungu_code is None:
+            return EMPTY_PAYLOAD
+
+        payload = _dump(
+            last_token(self.name(DONG, i))
+            for i in self._range(DONG, sigungu_code * SIGUNGU_SPAN, (sigungu_code + 1) * SIGUNGU_SPAN)
+        )
+        with self._lock:
+            self._dong_payloads[key] = payload
+        return payload
+
+    def payload(self, key, compressed=False):
+        """
+        미리 만든 지역 계층 API 응답
+
+        Args:
+            key: TREE_KEY 또는 시/군/구 코드
+            compressed: True 면 gzip 으로 압축된 응답
+
+        Returns:
+            bytes: JSON (또는 gzip) 응답, 없는 키면 None
+        """
+        keys = self._payload_keys
+        i = bisect_left(keys, key)
+        if i == len(keys) or keys[i] != key:
+            return None
+        j = i * 2 + (1 if compressed else 0)
+        return bytes(self._payloads[self._payload_offsets[j]:self._payload_offsets[j + 1]])
+
+    def records(self, section, start_code=0, end_code=None):
+        """
+        코드가 [start_code, end_code) 인 항목 (코드, 전체 이름) 코드 오름차순
+
+        Args:
+            section: SIDO, SIGUNGU, DONG
+            start_code, end_code: 코드 범위 (end_code 가 없으면 끝까지)
+        """
+        codes = self._codes[section]
+        end = len(codes) if end_code is None else bisect_left(codes, end_code)
+        for i in range(bisect_left(codes, start_code), end):
+            yield codes[i], self.name(section, i)
+
+    def iter_dongs(self):
+        """모든 법정동 (코드, 전체 이름) 코드 오름차순"""
+        return self.records(DONG)
+
+
+def _is_stale(path):
+    """regions.bin 이 없거나 원본 JSON 보다 오래됐는지"""
+    try:
+        compiled = os.path.getmtime(path)
+    except OSError:
+        return True
+    for filename in SOURCE_FILES:
+        try:
+            if os.path.getmtime(os.path.join(DATA_DIR, filename)) > compiled:
+                return True
+        except OSError:
+            continue
+    return False
+
+
+_region_data = None
+_region_data_lock = threading.Lock()
+
+
+def get_region_data():
+    """프로세스 공용 지역 데이터 (처음 호출 시 매핑, 필요하면 먼저 컴파일)"""
+    global _region_data
+    if _region_data is None:
+        with _region_data_lock:
+            if _region_data is None:
+                if _is_stale(REGION_DATA_PATH):
+                    compile_region_data()
+                try:
+                    _region_data = RegionData()
+                except ValueError:
+                    # 예전 형식으로 만든 파일이면 다시 컴파일
+                    compile_region_data()
+                    _region_data = RegionData()
+    return _region_data
@@ -0,0 +1,289 @@
+"""
+지역명 → 법정동 코드 매칭 모듈
+============================
+
+공고 행정구역(카카오 이름), 사용자 거주지(지역 선택기 이름), 자유 입력 주소를
+data/*.json 법정동 데이터의 10자리 법정동 코드로 바꿉니다.
+
+매칭 순서 (단계마다 앞에서 찾으면 멈춤):
+- 시/도: 정식 이름 → 약칭/옛 이름(SIDO_ALIASES) → 앞부분 일치(하나뿐일 때) → 유사 이름
+- 시/군/구: 붙여 쓴 전체 이름('수원시 장안구' → '수원시장안구') → 구 이름만('장안구')
+  → 시/군/구 접미사 생략('강남') → 유사 이름
+- 읍/면/동: 이름 → 행정동 번호 제거('역삼1동' → '역삼동') → 유사 이름
+  (시/군/구를 모르면 시/도 안에서 이름이 하나뿐일 때만)
+
+찾은 가장 깊은 단계의 코드를 돌려주며, 코드 앞부분(prefix)으로 하위 지역 전체를 고를 수 있습니다.
+(시/도 2자리, 시/군/구 5자리, 구가 있는 시 4자리, 읍/면/동 8자리)
+
+Flask 에 의존하지 않습니다.
+"""
+
+import difflib
+import re
+from collections import namedtuple
+from functools import lru_cache
+from utils.region_data import SIDO, SIGUNGU, DONG, SIDO_SPAN, SIGUNGU_SPAN, get_region_data
+
+# 카카오 지역명/옛 지역명 → 지역 선택기(data/sido.json) 시/도 이름
+SIDO_ALIASES = {
+    '서울': '서울특별시',
+    '부산': '부산광역시',
+    '대구': '대구광역시',
+    '인천': '인천광역시',
+    '광주': '광주광역시',
+    '대전': '대전광역시',
+    '울산': '울산광역시',
+    '세종': '세종특별자치시',
+    '경기': '경기도',
+    '충북': '충청북도',
+    '충남': '충청남도',
+    '전남': '전라남도',
+    '경북': '경상북도',
+    '경남': '경상남도',
+    '제주': '제주특별자치도',
+    '제주도': '제주특별자치도',
+    '강원': '강원특별자치도',
+    '강원도': '강원특별자치도',
+    '전북': '전북특별자치도',
+    '전라북도': '전북특별자치도'
+}
+
+# 단계별 코드 앞부분 길이
+SIDO_PREFIX = 2
+CITY_PREFIX = 4        # 구가 있는 시 (예: 수원시 4111 → 장안구 41111, 권선구 41113 ...)
+SIGUNGU_PREFIX = 5
+DONG_PREFIX = 8        # 리(마지막 2자리)까지 포함
+
+# 유사 이름으로 인정하는 최소 유사도 (difflib)
+FUZZY_CUTOFF = 0.75
+
+SIGUNGU_SUFFIXES = ('시', '군', '구')
+DONG_SUFFIXES = ('동', '읍', '면', '가', '리')
+
+# 행정동 번호 ('역삼1동', '상계3.4동', '제기제1동' → 법정동 '역삼동', '상계동', '제기동')
+ADMIN_DONG_NUMBER = re.compile(r'제?\d+(?:[.·,]\d+)*(?=가?동$)')
+
+RegionMatch = namedtuple('RegionMatch', ['code', 'prefix'])
+RegionMatch.__doc__ = """매칭 결과 (code: 10자리 법정동 코드, prefix: 하위 지역을 포함하는 코드 앞부분)"""
+
+
+def _compact(name):
+    return ''.join((name or '').split())
+
+
+def _fuzzy(name, candidates):
+    """가장 비슷한 후보 (FUZZY_CUTOFF 미만이면 None)"""
+    matches = difflib.get_close_matches(name, candidates, n=1, cutoff=FUZZY_CUTOFF)
+    return matches[0] if matches else None
+
+
+def _full_code(code, digits):
+    """단계 코드 → 10자리 법정동 코드 ('11110' → '1111000000')"""
+    return str(code).zfill(digits).ljust(10, '0')
+
+
+class _Catalog:
+    """매칭용 이름 목록 (지역 데이터에서 처음 한 번 구성)"""
+
+    def __init__(self, region_data):
+        self.sido = {}                  # {시/도 이름: 코드}
+        self.sigungu_by_sido = {}       # {시/도 코드: [(코드, 전체 이름 붙여쓰기, 마지막 단어)]}
+        self.dong_by_sido = {}          # {시/도 코드: [(코드, 이름)]} 읍/면/동 단위만
+
+        for code, name in region_data.records(SIDO):
+            self.sido.setdefault(' '.join(name.split()), code)
+
+        sido_names = {code: name for name, code in self.sido.items()}
+        for code, name in region_data.records(SIGUNGU):
+            if not code % SIDO_SPAN:
+                continue  # 시/도 자체 행
+            sido_code = code // SIDO_SPAN
+            tokens = name.split()
+            if tokens and tokens[0] == sido_names.get(sido_code):
+                tokens = tokens[1:]
+            if tokens:
+                self.sigungu_by_sido.setdefault(sido_code, []).append((code, ''.join(tokens), tokens[-1]))
+
+        for code, name in region_data.records(DONG):
+            if code // 100 % 1000 and not code % 100:
+                self.dong_by_sido.setdefault(code // (SIDO_SPAN * SIGUNGU_SPAN), []).append(
+                    (code, name.split()[-1])
+                )
+
+        # 구가 있는 시 (같은 앞 4자리에 다른 시/군/구가 있는 xxxx0 코드)
+        sigungu_codes = {code for items in self.sigungu_by_sido.values() for code, _, _ in items}
+        self.cities = {
+            code for code in sigungu_codes
+            if code % 10 == 0 and any(code + i in sigungu_codes for i in range(1, 10))
+        }
+
+
+_catalog = None
+
+
+def _get_catalog():
+    global _catalog
+    if _catalog is None:
+        _catalog = _Catalog(get_region_data())
+    return _catalog
+
+
+def _match_sido(catalog, name):
+    name = _compact(name)
+    if not name:
+        return None
+    if name in catalog.sido:
+        return catalog.sido[name]
+    if name in SIDO_ALIASES:
+        return catalog.sido.get(SIDO_ALIASES[name])
+
+    prefixed = [code for sido_name, code in catalog.sido.items() if sido_name.startswith(name)]
+    if len(prefixed) == 1:
+        return prefixed[0]
+
+    matched = _fuzzy(name, list(catalog.sido))
+    return catalog.sido[matched] if matched else None
+
+
+def _match_sigungu(catalog, sido_code, name, fuzzy=True):
+    candidates = catalog.sigungu_by_sido.get(sido_code, [])
+    name = _compact(name)
+    if not name:
+        # 시/군/구가 하나뿐인 시/도 (세종)
+        return candidates[0][0] if len(candidates) == 1 else None
+
+    for code, full, _ in candidates:
+        if full == name:
+            return code
+    for code, _, last in candidates:
+        if last == name:
+            return code
+
+    # 구가 있는 시의 구 이름만 ('장안구' → '수원시장안구'), 하나뿐일 때
+    if name.endswith(SIGUNGU_SUFFIXES) and len(name) >= 2:
+        suffixed = [code for code, full, _ in candidates if full.endswith(name)]
+        if len(suffixed) == 1:
+            return suffixed[0]
+    if not name.endswith(SIGUNGU_SUFFIXES):
+        for code, _, last in candidates:
+            if last[:-1] == name:
+                return code
+
+    if not fuzzy:
+        return None
+
+    by_name = {}
+    for code, full, last in candidates:
+        by_name.setdefault(full, code)
+        by_name.setdefault(last, code)
+    matched = _fuzzy(name, list(by_name))
+    return by_name[matched] if matched else None
+
+
+def _match_dong(catalog, sido_code, sigungu_prefix, name):
+    """읍/면/동 매칭 (sigungu_prefix 가 없으면 시/도 전체에서 이름이 하나뿐일 때만)"""
+    name = _compact(name)
+    if not name:
+        return None
+
+    candidates = catalog.dong_by_sido.get(sido_code, [])
+    if sigungu_prefix:
+        candidates = [(code, dong) for code, dong in candidates if str(code).startswith(sigungu_prefix)]
+
+    def unique(matches):
+        if sigungu_prefix:
+            return matches[0] if matches else None
+        return matches[0] if len(matches) == 1 else None
+
+    for variant in dict.fromkeys((name, ADMIN_DONG_NUMBER.sub('', name))):
+        found = unique([code for code, dong in candidates if dong == variant])
+        if found:
+            return found
+
+    if not sigungu_prefix:
+        return None
+
+    by_name = {}
+    for code, dong in candidates:
+        by_name.setdefault(dong, code)
+    matched = _fuzzy(ADMIN_DONG_NUMBER.sub('', name), list(by_name))
+    return by_name[matched] if matched else None
+
+
+def _sigungu_prefix(catalog, code):
+    return str(code)[:CITY_PREFIX] if code in catalog.cities else str(code)
+
+
+@lru_cache(maxsize=4096)
+def match_region(sido, sigungu=None, dong=None):
+    """
+    시/도, 시/군/구, 읍/면/동 이름 → 법정동 코드
+
+    Args:
+        sido: 시/도 이름 ('서울', '서울특별시' 등)
+        sigungu: 시/군/구 이름 ('수원시 장안구', '장안구' 등)
+        dong: 읍/면/동 이름 ('역삼동', '역삼1동' 등)
+
+    Returns:
+        RegionMatch: 찾은 가장 깊은 단계의 코드, 시/도도 찾지 못하면 None
+    """
+    catalog = _get_catalog()
+    sido_code = _match_sido(catalog, sido)
+    if sido_code is None:
+        return None
+    match = RegionMatch(_full_code(sido_code, SIDO_PREFIX), str(sido_code).zfill(SIDO_PREFIX))
+
+    # 시/군/구 자리에 시/도 이름이 온 경우 (세종)
+    if sigungu and _match_sido(catalog, sigungu) == sido_code:
+        sigungu = None
+
+    sigungu_code = _match_sigungu(catalog, sido_code, sigungu)
+    sigungu_prefix = None
+    if sigungu_code is not None:
+        sigungu_prefix = _sigungu_prefix(catalog, sigungu_code)
+        match = RegionMatch(_full_code(sigungu_code, SIGUNGU_PREFIX), sigungu_prefix)
+    elif sigungu:
+        return match
+
+    dong_code = _match_dong(catalog, sido_code, sigungu_prefix, dong)
+    if dong_code is not None:
+        match = RegionMatch(str(dong_code), str(dong_code)[:DONG_PREFIX])
+    return match
+
+
+@lru_cache(maxsize=4096)
+def match_address(address):
+    """
+    자유 입력 주소 → 법정동 코드 ('서울 강남구 역삼동 123-4', '경기 수원시 장안구 ...')
+
+    첫 단어를 시/도, 이어지는 한두 단어를 시/군/구로 보고, 그 뒤에서
+    읍/면/동처럼 끝나는 첫 단어를 읍/면/동으로 봅니다 (도로명 주소면 시/군/구까지).
+
+    Returns:
+        RegionMatch: 찾은 가장 깊은 단계의 코드, 시/도도 찾지 못하면 None
+    """
+    tokens = (address or '').split()
+    if not tokens:
+        return None
+
+    catalog = _get_catalog()
+    sido_code = _match_sido(catalog, tokens[0])
+    if sido_code is None:
+        return None
+
+    rest = tokens[1:]
+    best = match_region(tokens[0])
+    # '수원시 장안구' 처럼 두 단어인 시/군/구를 먼저 시도
+    for width in (2, 1, 0):
+        if len(rest) < width:
+            continue
+        sigungu = ' '.join(rest[:width])
+        if width and _match_sigungu(catalog, sido_code, sigungu, fuzzy=width == 1) is None:
+            continue
+        dong = next((token for token in rest[width:] if token.endswith(DONG_SUFFIXES)), None)
+        match = match_region(tokens[0], sigungu or None, dong)
+        if match and len(match.prefix) > len(best.prefix):
+            best = match
+        if width:
+            break
+    return best
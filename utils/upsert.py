@@ -0,0 +1,34 @@
+"""
+INSERT ... 중복 시 갱신(upsert) 구문 모듈
+======================================
+
+운영 DB(MySQL)는 INSERT ... ON DUPLICATE KEY UPDATE, 테스트용 SQLite 는
+INSERT ... ON CONFLICT DO UPDATE 로 같은 동작의 구문을 만듭니다.
+"""
+
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+
+def upsert(table, dialect_name, update):
+    """
+    기본 키가 겹치면 갱신하는 INSERT 구문
+
+    Args:
+        table: 대상 테이블
+        dialect_name: DB 종류 (db.engine.dialect.name, 'mysql' 또는 'sqlite')
+        update: 새로 넣으려던 행(컬럼 모음)을 받아 {컬럼 이름: 갱신 식} 을 돌려주는 함수
+                (기존 값은 table.c 로 참조)
+
+    Returns:
+        Insert: 실행할 구문
+    """
+    if dialect_name == 'sqlite':
+        stmt = sqlite_insert(table)
+        return stmt.on_conflict_do_update(
+            index_elements=list(table.primary_key.columns),
+            set_=update(stmt.excluded)
+        )
+
+    stmt = mysql_insert(table)
+    return stmt.on_duplicate_key_update(update(stmt.inserted))